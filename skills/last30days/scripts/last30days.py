@@ -4,26 +4,35 @@ last30days - Research a topic from the last 30 days on Reddit + X + YouTube + We
 
 Usage:
     python3 last30days.py <topic> [options]
+    python3 last30days.py serve [--socket PATH] [--workers N]
 
 Options:
     --mock              Use fixtures instead of real API calls
-    --emit=MODE         Output mode: compact|json|md|context|path (default: compact)
+    --emit=MODE         Output mode: compact|json|md|context|path|jsonl-stream (default: compact)
     --sources=MODE      Source selection: auto|reddit|x|both (default: auto)
     --quick             Faster research with fewer sources (8-12 each)
     --deep              Comprehensive research with more sources (50-70 Reddit, 40-60 X)
     --debug             Enable verbose debug logging
     --store             Persist findings to SQLite database
     --diagnose          Show source availability diagnostics and exit
+    --refresh           Bypass the result cache and fetch fresh data
+    --cache-only        Serve results from the cache only (no network calls)
+    --engine=MODE       Research engine: threads|async (default: threads, or
+                        async with --emit=jsonl-stream)
+    --deadline=SECS     Stop waiting after SECS and report what has arrived
 """
 
 import argparse
+import asyncio
 import atexit
+import functools
 import json
 import os
 import signal
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -38,11 +47,28 @@ _child_pids: set = set()
 _child_pids_lock = threading.Lock()
 
 TIMEOUT_PROFILES = {
-    "quick":   {"global": 90,  "future": 30, "reddit_future": 60,  "youtube_future": 60,  "http": 15, "enrich_per": 8,  "enrich_total": 30, "enrich_max_items": 10},
-    "default": {"global": 180, "future": 60, "reddit_future": 90,  "youtube_future": 90,  "http": 30, "enrich_per": 15, "enrich_total": 45, "enrich_max_items": 15},
-    "deep":    {"global": 300, "future": 90, "reddit_future": 120, "youtube_future": 120, "http": 30, "enrich_per": 15, "enrich_total": 60, "enrich_max_items": 25},
+    "quick":   {"global": 90,  "future": 30, "reddit_future": 60,  "youtube_future": 60,  "http": 15, "enrich_per": 8,  "enrich_total": 30, "enrich_threads": 3},
+    "default": {"global": 180, "future": 60, "reddit_future": 90,  "youtube_future": 90,  "http": 30, "enrich_per": 15, "enrich_total": 45, "enrich_threads": 5},
+    "deep":    {"global": 300, "future": 90, "reddit_future": 120, "youtube_future": 120, "http": 30, "enrich_per": 15, "enrich_total": 60, "enrich_threads": 8},
 }
 
+# Concurrent Reddit thread fetches during enrichment: an adaptive limit
+# starts at ENRICH_MAX_WORKERS and moves within [1, ENRICH_MAX_CONCURRENCY]
+ENRICH_MAX_WORKERS = 5
+ENRICH_MAX_CONCURRENCY = 10
+
+# Tries per thread when Reddit rate-limits; between tries the limiter halves
+# concurrency and waits out Retry-After
+ENRICH_ATTEMPTS = 3
+
+# Reddit items whose engagement is refreshed with batched /api/info calls;
+# only the top "enrich_threads" of them get a full comment-tree fetch
+ENRICH_INFO_MAX_ITEMS = 100
+
+# With --deadline, the hard watchdog only fires this long after the deadline,
+# as a backstop for work that does not check it
+DEADLINE_GRACE = 15
+
 
 def register_child_pid(pid: int):
     """Track a child process for cleanup."""
@@ -73,8 +99,12 @@ atexit.register(_cleanup_children)
 def _install_global_timeout(timeout_seconds: int):
     """Install a global timeout watchdog.
 
-    Uses SIGALRM on Unix, threading.Timer as fallback.
+    Uses SIGALRM on Unix, threading.Timer as fallback. Skipped off the main
+    thread: requests handled by `serve` must not take the server down, and
+    rely on the per-source timeouts instead.
     """
+    if threading.current_thread() is not threading.main_thread():
+        return
     if hasattr(signal, 'SIGALRM'):
         def _handler(signum, frame):
             sys.stderr.write(f"\n[TIMEOUT] Global timeout ({timeout_seconds}s) exceeded. Cleaning up.\n")
@@ -96,23 +126,27 @@ def _install_global_timeout(timeout_seconds: int):
 
 from lib import (
     bird_x,
+    cache,
+    concurrency,
+    daemon,
     dates,
+    deadline,
     dedupe,
     entity_extract,
     env,
     http,
     models,
-    normalize,
     openai_reddit,
+    pipeline,
     reddit_enrich,
     render,
     schema,
     score,
     ui,
-    websearch,
     xai_x,
     youtube_yt,
 )
+from lib.deadline import ThreadPoolExecutor
 
 
 def load_fixture(name: str) -> dict:
@@ -124,6 +158,217 @@ def load_fixture(name: str) -> dict:
     return {}
 
 
+def _load_source_cache(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    source: str,
+    depth: str,
+    model: str,
+    cache_mode: str,
+) -> tuple:
+    """Look up cached results for one source.
+
+    In 'only' mode the TTL is ignored: stale results beat no results when the
+    caller has asked us not to touch the network, and the age is reported.
+
+    Returns:
+        Tuple of (data, age_hours) or (None, None) on miss
+    """
+    if cache_mode == "refresh":
+        return None, None
+    cache.ensure_cache_dir()
+    key = cache.get_source_cache_key(topic, from_date, to_date, source, depth, model)
+    if cache_mode == "only":
+        ttl = float("inf")
+    else:
+        ttl = cache.SOURCE_TTL_HOURS.get(source, cache.DEFAULT_TTL_HOURS)
+    return cache.load_cache_with_age(key, ttl)
+
+
+def _save_source_cache(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    source: str,
+    depth: str,
+    model: str,
+    data: dict,
+):
+    """Save one source's results to the cache."""
+    key = cache.get_source_cache_key(topic, from_date, to_date, source, depth, model)
+    ttl = cache.SOURCE_TTL_HOURS.get(source, cache.DEFAULT_TTL_HOURS)
+    cache.save_cache(key, data, ttl)
+
+
+def _source_models(selected_models: dict, x_source: str, web_backend: str) -> dict:
+    """Model/backend per source, used as part of the result cache key."""
+    return {
+        "reddit": selected_models.get("openai"),
+        "x": selected_models.get("xai") if x_source == "xai" else x_source,
+        "youtube": "yt-dlp",
+        "web": web_backend,
+    }
+
+
+def _load_cached_sources(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    wanted: dict,
+    source_models: dict,
+    cache_mode: str,
+    cache_ages: dict,
+) -> dict:
+    """Look up every wanted source in the result cache.
+
+    Returns:
+        Dict of {source: cached data} for hits; cache_ages is filled in place
+    """
+    cached = {}
+    for source, enabled in wanted.items():
+        if not enabled:
+            continue
+        data, age = _load_source_cache(
+            topic, from_date, to_date, source, depth,
+            source_models[source], cache_mode,
+        )
+        if data is not None:
+            cached[source] = data
+            cache_ages[source] = age
+    return cached
+
+
+def _save_fresh_sources(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    source_models: dict,
+    fresh: dict,
+):
+    """Save freshly fetched per-source results to the cache.
+
+    Sources cut short by the run deadline are incomplete and not cached.
+    """
+    cut_short = deadline.current().cut_short
+    for source, data in fresh.items():
+        if source in cut_short:
+            continue
+        _save_source_cache(topic, from_date, to_date, source, depth, source_models[source], data)
+
+
+def _plan_sources(
+    topic: str,
+    sources: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    mock: bool,
+    x_source: str,
+    run_youtube: bool,
+    cache_mode: str,
+    cache_ages: dict,
+) -> dict:
+    """Decide which sources to fetch and which to serve from the result cache.
+
+    Returns:
+        Dict with web_needed, web_backend, do_reddit, do_x, run_youtube (what
+        still has to be fetched), cached, source_models, and per-source
+        items/raw/errors pre-filled from the cache or --cache-only misses
+    """
+    # Determine web search mode
+    do_web = sources in ("all", "web", "reddit-web", "x-web")
+    web_backend = env.get_web_search_source(config) if do_web else None
+
+    plan = {
+        "web_needed": do_web and not web_backend,
+        "web_backend": web_backend,
+        "do_reddit": sources in ("both", "reddit", "all", "reddit-web"),
+        "do_x": sources in ("both", "x", "all", "x-web"),
+        "run_youtube": run_youtube,
+        "cached": {},
+        "source_models": _source_models(selected_models, x_source, web_backend),
+        "items": {"reddit": [], "x": [], "youtube": [], "web": []},
+        "raw": {"reddit": None, "x": None},
+        "errors": {"reddit": None, "x": None, "youtube": None, "web": None},
+    }
+    fetch_keys = {"reddit": "do_reddit", "x": "do_x", "youtube": "run_youtube", "web": "web_backend"}
+
+    # Serve what we can from the per-source result cache (never in mock mode)
+    if not mock:
+        wanted = {source: bool(plan[k]) for source, k in fetch_keys.items()}
+        plan["cached"] = _load_cached_sources(
+            topic, from_date, to_date, depth, wanted,
+            plan["source_models"], cache_mode, cache_ages,
+        )
+    for source, data in plan["cached"].items():
+        plan["items"][source] = data.get("items", [])
+        if source in plan["raw"]:
+            plan["raw"][source] = data.get("raw")
+        plan[fetch_keys[source]] = None if source == "web" else False
+
+    # --cache-only: anything not served from the cache is skipped, not fetched
+    if cache_mode == "only":
+        for source, k in fetch_keys.items():
+            if plan[k]:
+                plan["errors"][source] = "No cached results (--cache-only)"
+                plan[k] = None if source == "web" else False
+
+    return plan
+
+
+def _refresh_reddit_engagement(
+    items: list,
+    timeouts: dict,
+    mock: bool,
+    progress=None,
+) -> tuple:
+    """First enrichment tier: refresh engagement for all items in one batch.
+
+    Args:
+        items: Reddit items (updated in place)
+        timeouts: Timeout profile
+        mock: Use the /api/info fixture instead of the network
+        progress: Optional progress display
+
+    Returns:
+        Tuple of (indices refreshed, whether Reddit rate-limited us)
+    """
+    mock_info = load_fixture("reddit_info_sample.json") if mock else None
+    try:
+        return reddit_enrich.refresh_engagement(items, mock_info, timeout=timeouts["enrich_per"]), False
+    except reddit_enrich.RedditRateLimitError:
+        if progress:
+            progress.show_error("Reddit rate-limited (429) — skipping remaining enrichment")
+        return [], True
+    except deadline.DeadlineExceeded:
+        deadline.current().mark("reddit")
+    except Exception as e:
+        if progress:
+            progress.show_error(f"Engagement refresh failed: {e}")
+    return [], False
+
+
+def _enrich_thread(item: dict, limiter: concurrency.AdaptiveLimit, use_cache: bool = True) -> dict:
+    """Comment-tier enrichment of one thread through the adaptive limiter.
+
+    Raises:
+        reddit_enrich.RedditRateLimitError: Only once every attempt was
+            rate-limited
+    """
+    fetch = functools.partial(reddit_enrich.enrich_reddit_item, use_cache=use_cache)
+    for attempt in range(ENRICH_ATTEMPTS):
+        try:
+            return limiter.run(fetch, item)
+        except reddit_enrich.RedditRateLimitError:
+            if attempt == ENRICH_ATTEMPTS - 1:
+                raise
+
+
 def _search_reddit(
     topic: str,
     config: dict,
@@ -316,7 +561,7 @@ def _search_web(
 
     Returns:
         Tuple of (web_items, web_error)
-        web_items are raw dicts ready for websearch.normalize_websearch_items()
+        web_items are raw dicts ready for pipeline.process_source()
     """
     from lib import brave_search, parallel_search, openrouter_search
 
@@ -343,7 +588,7 @@ def _search_web(
     except Exception as e:
         return [], f"{type(e).__name__}: {e}"
 
-    # Add IDs and date_confidence for websearch.normalize_websearch_items()
+    # Add IDs and date_confidence for pipeline.process_source()
     for i, item in enumerate(raw_results):
         item.setdefault("id", f"W{i+1}")
         if item.get("date") and not item.get("date_confidence"):
@@ -355,6 +600,26 @@ def _search_web(
     return raw_results, web_error
 
 
+def _note_cut_short(source: str, error: str = None) -> str:
+    """Mark a source cut short if it failed because the run deadline passed.
+
+    Returns:
+        The error to report for the source
+    """
+    run_deadline = deadline.current()
+    if error and run_deadline.expired():
+        run_deadline.mark(source)
+        return run_deadline.describe()
+    return error
+
+
+def _publish_cached(plan: dict, on_source):
+    """Hand every source served from the cache to on_source up front."""
+    if on_source:
+        for source in plan["cached"]:
+            on_source(source, plan["items"][source])
+
+
 def _run_supplemental(
     topic: str,
     reddit_items: list,
@@ -365,6 +630,7 @@ def _run_supplemental(
     x_source: str,
     progress: ui.ProgressDisplay = None,
     skip_reddit: bool = False,
+    skip_x: bool = False,
 ) -> tuple:
     """Run Phase 2 supplemental searches based on entities from Phase 1.
 
@@ -381,6 +647,7 @@ def _run_supplemental(
         x_source: 'bird' or 'xai'
         progress: Optional progress display
         skip_reddit: If True, skip Reddit supplemental (e.g. rate-limited)
+        skip_x: If True, skip X supplemental (e.g. X results came from cache)
 
     Returns:
         Tuple of (supplemental_reddit, supplemental_x)
@@ -402,12 +669,19 @@ def _run_supplemental(
         max_subreddits=max_subs,
     )
 
-    has_handles = entities["x_handles"] and x_source == "bird"
+    has_handles = entities["x_handles"] and x_source == "bird" and not skip_x
     has_subs = entities["reddit_subreddits"] and not skip_reddit
 
     if not has_handles and not has_subs:
         return [], []
 
+    run_deadline = deadline.current()
+    if run_deadline.expired():
+        for source, wanted in (("reddit", has_subs), ("x", has_handles)):
+            if wanted:
+                run_deadline.mark(source)
+        return [], []
+
     parts = []
     if has_handles:
         parts.append(f"@{', @'.join(entities['x_handles'][:3])}")
@@ -452,26 +726,36 @@ def _run_supplemental(
 
         if reddit_future:
             try:
-                raw_reddit = reddit_future.result(timeout=30)
+                raw_reddit = reddit_future.result(timeout=run_deadline.cap(30))
                 # Filter out URLs already found in Phase 1
                 supplemental_reddit = [
                     item for item in raw_reddit
                     if item.get("url", "") not in existing_urls
                 ]
             except TimeoutError:
-                sys.stderr.write("[Phase 2] Supplemental Reddit timed out (30s)\n")
+                deadline.abandon(reddit_future)
+                if run_deadline.expired():
+                    run_deadline.mark("reddit")
+                else:
+                    sys.stderr.write("[Phase 2] Supplemental Reddit timed out (30s)\n")
             except Exception as e:
                 sys.stderr.write(f"[Phase 2] Supplemental Reddit error: {e}\n")
 
         if x_future:
             try:
-                raw_x = x_future.result(timeout=30)
+                # search_handles returns what it has after its own (shorter)
+                # budget, so this only fires if Bird hangs outright
+                raw_x = x_future.result(timeout=run_deadline.cap(30))
                 supplemental_x = [
                     item for item in raw_x
                     if item.get("url", "") not in existing_urls
                 ]
             except TimeoutError:
-                sys.stderr.write("[Phase 2] Supplemental X timed out (30s)\n")
+                deadline.abandon(x_future)
+                if run_deadline.expired():
+                    run_deadline.mark("x")
+                else:
+                    sys.stderr.write("[Phase 2] Supplemental X timed out (30s)\n")
             except Exception as e:
                 sys.stderr.write(f"[Phase 2] Supplemental X error: {e}\n")
 
@@ -497,9 +781,21 @@ def run_research(
     x_source: str = "xai",
     run_youtube: bool = False,
     timeouts: dict = None,
+    cache_mode: str = "use",
+    cache_ages: dict = None,
+    on_source=None,
 ) -> tuple:
     """Run the research pipeline.
 
+    Args:
+        cache_mode: 'use' (serve fresh cache hits, fetch the rest),
+            'refresh' (always fetch, then update the cache), or
+            'only' (serve cache hits, never fetch)
+        cache_ages: Optional dict, filled with {source: age_hours} for every
+            source served from the cache
+        on_source: Optional callback(source, items), called once per source
+            as soon as its items are final (after enrichment and Phase 2)
+
     Returns:
         Tuple of (reddit_items, x_items, youtube_items, web_items, web_needed,
                   raw_openai, raw_xai, raw_reddit_enriched,
@@ -508,27 +804,42 @@ def run_research(
     Note: web_needed is True when web search should be performed by the assistant
     (i.e., no native web search API keys are configured). When native web search
     runs, web_items will be populated and web_needed will be False.
+
+    All waits are capped by the current run deadline (see lib/deadline.py).
+    Sources it interrupts keep what they had, report a "cut short" error if
+    they got nothing, and are marked on the deadline.
     """
+    run_deadline = deadline.current()
     if timeouts is None:
         timeouts = TIMEOUT_PROFILES[depth]
     future_timeout = timeouts["future"]
+    if cache_ages is None:
+        cache_ages = {}
 
-    reddit_items = []
-    x_items = []
-    youtube_items = []
-    web_items = []
-    raw_openai = None
-    raw_xai = None
+    plan = _plan_sources(
+        topic, sources, config, selected_models, from_date, to_date,
+        depth, mock, x_source, run_youtube, cache_mode, cache_ages,
+    )
+    web_needed = plan["web_needed"]
+    web_backend = plan["web_backend"]
+    do_reddit = plan["do_reddit"]
+    do_x = plan["do_x"]
+    run_youtube = plan["run_youtube"]
+    cached = plan["cached"]
+    source_models = plan["source_models"]
+
+    reddit_items = plan["items"]["reddit"]
+    x_items = plan["items"]["x"]
+    youtube_items = plan["items"]["youtube"]
+    web_items = plan["items"]["web"]
+    raw_openai = plan["raw"]["reddit"]
+    raw_xai = plan["raw"]["x"]
     raw_reddit_enriched = []
-    reddit_error = None
-    x_error = None
-    youtube_error = None
-    web_error = None
-
-    # Determine web search mode
-    do_web = sources in ("all", "web", "reddit-web", "x-web")
-    web_backend = env.get_web_search_source(config) if do_web else None
-    web_needed = do_web and not web_backend
+    reddit_error = plan["errors"]["reddit"]
+    x_error = plan["errors"]["x"]
+    youtube_error = plan["errors"]["youtube"]
+    web_error = plan["errors"]["web"]
+    _publish_cached(plan, on_source)
 
     # Web-only mode
     if sources == "web":
@@ -544,9 +855,12 @@ def run_research(
                 web_error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"Web error: {e}")
+            web_error = _note_cut_short("web", web_error)
             sys.stderr.write(f"[web] {len(web_items)} results\n")
             sys.stderr.flush()
-        else:
+            if on_source:
+                on_source("web", web_items)
+        elif web_needed:
             # No native backend — assistant handles WebSearch
             if progress:
                 progress.start_web_only()
@@ -563,14 +877,20 @@ def run_research(
                 youtube_error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"YouTube error: {e}")
+            youtube_error = _note_cut_short("youtube", youtube_error)
             if progress:
                 progress.end_youtube(len(youtube_items))
+            if on_source:
+                on_source("youtube", youtube_items)
+        if not mock:
+            fresh = {}
+            if web_backend and web_items and not web_error:
+                fresh["web"] = {"items": web_items}
+            if run_youtube and youtube_items and not youtube_error:
+                fresh["youtube"] = {"items": youtube_items}
+            _save_fresh_sources(topic, from_date, to_date, depth, source_models, fresh)
         return reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error
 
-    # Determine which searches to run
-    do_reddit = sources in ("both", "reddit", "all", "reddit-web")
-    do_x = sources in ("both", "x", "all", "x-web")
-
     # Run Reddit, X, YouTube, and Web searches in parallel
     reddit_future = None
     x_future = None
@@ -614,10 +934,11 @@ def run_research(
         if reddit_future:
             reddit_timeout = timeouts.get("reddit_future", future_timeout)
             try:
-                reddit_items, raw_openai, reddit_error = reddit_future.result(timeout=reddit_timeout)
+                reddit_items, raw_openai, reddit_error = reddit_future.result(timeout=run_deadline.cap(reddit_timeout))
                 if reddit_error and progress:
                     progress.show_error(f"Reddit error: {reddit_error}")
             except TimeoutError:
+                deadline.abandon(reddit_future)
                 reddit_error = f"Reddit search timed out after {reddit_timeout}s"
                 if progress:
                     progress.show_error(reddit_error)
@@ -625,15 +946,17 @@ def run_research(
                 reddit_error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"Reddit error: {e}")
+            reddit_error = _note_cut_short("reddit", reddit_error)
             if progress:
                 progress.end_reddit(len(reddit_items))
 
         if x_future:
             try:
-                x_items, raw_xai, x_error = x_future.result(timeout=future_timeout)
+                x_items, raw_xai, x_error = x_future.result(timeout=run_deadline.cap(future_timeout))
                 if x_error and progress:
                     progress.show_error(f"X error: {x_error}")
             except TimeoutError:
+                deadline.abandon(x_future)
                 x_error = f"X search timed out after {future_timeout}s"
                 if progress:
                     progress.show_error(x_error)
@@ -641,16 +964,18 @@ def run_research(
                 x_error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"X error: {e}")
+            x_error = _note_cut_short("x", x_error)
             if progress:
                 progress.end_x(len(x_items))
 
         if youtube_future:
             yt_timeout = timeouts.get("youtube_future", future_timeout)
             try:
-                youtube_items, youtube_error = youtube_future.result(timeout=yt_timeout)
+                youtube_items, youtube_error = youtube_future.result(timeout=run_deadline.cap(yt_timeout))
                 if youtube_error and progress:
                     progress.show_error(f"YouTube error: {youtube_error}")
             except TimeoutError:
+                deadline.abandon(youtube_future)
                 youtube_error = f"YouTube search timed out after {yt_timeout}s"
                 if progress:
                     progress.show_error(youtube_error)
@@ -658,15 +983,19 @@ def run_research(
                 youtube_error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"YouTube error: {e}")
+            youtube_error = _note_cut_short("youtube", youtube_error)
             if progress:
                 progress.end_youtube(len(youtube_items))
+            if on_source:
+                on_source("youtube", youtube_items)
 
         if web_future:
             try:
-                web_items, web_error = web_future.result(timeout=future_timeout)
+                web_items, web_error = web_future.result(timeout=run_deadline.cap(future_timeout))
                 if web_error and progress:
                     progress.show_error(f"Web error: {web_error}")
             except TimeoutError:
+                deadline.abandon(web_future)
                 web_error = f"Web search timed out after {future_timeout}s"
                 if progress:
                     progress.show_error(web_error)
@@ -674,49 +1003,66 @@ def run_research(
                 web_error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"Web error: {e}")
+            web_error = _note_cut_short("web", web_error)
             sys.stderr.write(f"[web] {len(web_items)} results\n")
             sys.stderr.flush()
+            if on_source:
+                on_source("web", web_items)
 
-    # Enrich Reddit items with real data (parallel, capped)
-    enrich_max = timeouts["enrich_max_items"]
+    # Enrich Reddit items with real data in two tiers: one batched /api/info
+    # call refreshes engagement for every item, then only the busiest threads
+    # get a full comment-tree fetch (parallel, capped).
+    # Cached Reddit items were enriched before they were saved.
     enrich_total_timeout = timeouts["enrich_total"]
-    items_to_enrich = reddit_items[:enrich_max]
+    to_refresh = reddit_items[:ENRICH_INFO_MAX_ITEMS] if "reddit" not in cached else []
     rate_limited = False  # Set True if Reddit returns 429 during enrichment
-
-    if items_to_enrich:
+    if to_refresh and run_deadline.expired():
+        run_deadline.mark("reddit")
+        to_refresh = []
+
+    if to_refresh:
+        refreshed, rate_limited = _refresh_reddit_engagement(to_refresh, timeouts, mock, progress)
+        enriched = set(refreshed)
+        thread_idx = [] if rate_limited or run_deadline.expired() else reddit_enrich.select_for_comments(
+            to_refresh, timeouts["enrich_threads"],
+        )
         if progress:
-            progress.start_reddit_enrich(1, len(items_to_enrich))
+            progress.start_reddit_enrich(0, len(thread_idx))
 
         if mock:
             # Sequential mock enrichment (fast, no need for parallelism)
-            for i, item in enumerate(items_to_enrich):
-                if progress and i > 0:
-                    progress.update_reddit_enrich(i + 1, len(items_to_enrich))
+            for n, i in enumerate(thread_idx):
                 try:
                     mock_thread = load_fixture("reddit_thread_sample.json")
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
+                    reddit_items[i] = reddit_enrich.enrich_reddit_item(reddit_items[i], mock_thread)
+                    enriched.add(i)
                 except Exception as e:
                     if progress:
-                        progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
-                raw_reddit_enriched.append(reddit_items[i])
-        else:
-            # Parallel enrichment with bounded concurrency and total timeout
-            # Uses short HTTP timeout (10s) and 1 retry to fail fast on 429
+                        progress.show_error(f"Enrich failed for {reddit_items[i].get('url', 'unknown')}: {e}")
+                if progress:
+                    progress.update_reddit_enrich(n + 1, len(thread_idx))
+        elif thread_idx:
+            # Parallel comment fetches with adaptive concurrency and total timeout.
+            # Each fetch uses a short HTTP timeout and no HTTP-level retry; a 429
+            # slows the limiter down and the thread is tried again.
             completed_count = 0
-            rate_limited = False
-            with ThreadPoolExecutor(max_workers=5) as enrich_pool:
+            limiter = concurrency.AdaptiveLimit(ENRICH_MAX_WORKERS, maximum=ENRICH_MAX_CONCURRENCY)
+            with ThreadPoolExecutor(max_workers=ENRICH_MAX_CONCURRENCY) as enrich_pool:
                 futures = {
-                    enrich_pool.submit(reddit_enrich.enrich_reddit_item, item): i
-                    for i, item in enumerate(items_to_enrich)
+                    enrich_pool.submit(
+                        _enrich_thread, reddit_items[i], limiter, cache_mode != "refresh",
+                    ): i
+                    for i in thread_idx
                 }
                 try:
-                    for future in as_completed(futures, timeout=enrich_total_timeout):
+                    for future in as_completed(futures, timeout=run_deadline.cap(enrich_total_timeout)):
                         idx = futures[future]
                         completed_count += 1
                         if progress:
-                            progress.update_reddit_enrich(completed_count, len(items_to_enrich))
+                            progress.update_reddit_enrich(completed_count, len(thread_idx))
                         try:
                             reddit_items[idx] = future.result(timeout=timeouts["enrich_per"])
+                            enriched.add(idx)
                         except reddit_enrich.RedditRateLimitError:
                             rate_limited = True
                             if progress:
@@ -725,45 +1071,706 @@ def run_research(
                                 )
                             # Cancel remaining futures and bail
                             for f in futures:
-                                f.cancel()
+                                deadline.abandon(f)
                             break
+                        except deadline.DeadlineExceeded:
+                            # Keep the unenriched item
+                            run_deadline.mark("reddit")
                         except Exception as e:
                             if progress:
                                 progress.show_error(
-                                    f"Enrich failed for {items_to_enrich[idx].get('url', 'unknown')}: {e}"
+                                    f"Enrich failed for {reddit_items[idx].get('url', 'unknown')}: {e}"
                                 )
-                        raw_reddit_enriched.append(reddit_items[idx])
                 except TimeoutError:
-                    if progress:
+                    # Stop the stragglers' retries rather than leaving them running
+                    for f in futures:
+                        deadline.abandon(f)
+                    if run_deadline.expired():
+                        run_deadline.mark("reddit")
+                        if progress:
+                            progress.show_error(
+                                f"Enrichment cut short by deadline "
+                                f"({completed_count}/{len(thread_idx)} done)"
+                            )
+                    elif progress:
                         progress.show_error(
                             f"Enrichment timed out after {enrich_total_timeout}s "
-                            f"({completed_count}/{len(items_to_enrich)} done)"
+                            f"({completed_count}/{len(thread_idx)} done)"
                         )
-                    # Keep unenriched items as-is
-                    for idx in futures.values():
-                        if reddit_items[idx] not in raw_reddit_enriched:
-                            raw_reddit_enriched.append(reddit_items[idx])
 
+        raw_reddit_enriched.extend(reddit_items[i] for i in sorted(enriched))
         if progress:
             progress.end_reddit_enrich()
 
     # Phase 2: Supplemental search based on entities from Phase 1
-    # Skip on --quick (speed matters), mock mode, or if Reddit is rate-limiting
-    if depth != "quick" and not mock and (reddit_items or x_items):
+    # Skip on --quick (speed matters), mock mode, or if Reddit is rate-limiting.
+    # Cached sources already include their supplemental results.
+    if depth != "quick" and not mock and (reddit_items or x_items) and (reddit_future or x_future):
         sup_reddit, sup_x = _run_supplemental(
             topic, reddit_items, x_items,
             from_date, to_date, depth, x_source, progress,
-            skip_reddit=rate_limited,
+            skip_reddit=rate_limited or not reddit_future,
+            skip_x=not x_future,
         )
         if sup_reddit:
             reddit_items.extend(sup_reddit)
         if sup_x:
             x_items.extend(sup_x)
+    if on_source:
+        if reddit_future:
+            on_source("reddit", reddit_items)
+        if x_future:
+            on_source("x", x_items)
+
+    # Cache freshly fetched sources (errors and empty results are not cached)
+    if not mock:
+        fresh = {}
+        if reddit_future and reddit_items and not reddit_error:
+            fresh["reddit"] = {"items": reddit_items, "raw": raw_openai}
+        if x_future and x_items and not x_error:
+            fresh["x"] = {"items": x_items, "raw": raw_xai}
+        if youtube_future and youtube_items and not youtube_error:
+            fresh["youtube"] = {"items": youtube_items}
+        if web_future and web_items and not web_error:
+            fresh["web"] = {"items": web_items}
+        _save_fresh_sources(topic, from_date, to_date, depth, source_models, fresh)
 
     return reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error
 
 
-def main():
+async def _await_in_thread(executor, timeout: float, fn, *args):
+    """Run a blocking call on the executor, bounded by timeout seconds.
+
+    The timeout is capped by the current run deadline. If it expires (or
+    the awaiting task is cancelled) the call is abandoned, which stops its
+    HTTP retries and frees the worker thread.
+    """
+    future = executor.submit(fn, *args)
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), deadline.current().cap(timeout))
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        deadline.abandon(future)
+        raise
+
+
+async def _research_graph(
+    topic: str,
+    sources: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    mock: bool,
+    progress: ui.ProgressDisplay,
+    x_source: str,
+    run_youtube: bool,
+    timeouts: dict,
+    cache_mode: str,
+    cache_ages: dict,
+    on_source,
+) -> tuple:
+    """Task graph behind run_research_async (see there)."""
+    run_deadline = deadline.current()
+    future_timeout = timeouts["future"]
+
+    plan = _plan_sources(
+        topic, sources, config, selected_models, from_date, to_date,
+        depth, mock, x_source, run_youtube, cache_mode, cache_ages,
+    )
+    web_backend = plan["web_backend"]
+    cached = plan["cached"]
+    items = plan["items"]
+    raw = plan["raw"]
+    errors = plan["errors"]
+    raw_reddit_enriched = []
+    rate_limited = False
+    _publish_cached(plan, on_source)
+
+    # Skip Phase 2 on --quick (speed matters) and in mock mode
+    do_phase2 = depth != "quick" and not mock
+
+    # 4 Phase 1 sources + enrichment slots + one Phase 2 drill-down per source
+    executor = ThreadPoolExecutor(max_workers=4 + ENRICH_MAX_CONCURRENCY + 2)
+    limiter = concurrency.AdaptiveLimit(ENRICH_MAX_WORKERS, maximum=ENRICH_MAX_CONCURRENCY)
+
+    async def enrich_one(item: dict) -> dict:
+        if mock:
+            mock_thread = load_fixture("reddit_thread_sample.json")
+            return reddit_enrich.enrich_reddit_item(item, mock_thread)
+        # Rate-limited retries wait inside the limiter; enrich_total bounds them
+        return await _await_in_thread(
+            executor, timeouts["enrich_total"],
+            _enrich_thread, item, limiter, cache_mode != "refresh",
+        )
+
+    async def enrich_reddit():
+        # Reddit engagement is refreshed as soon as the search returns, while
+        # the other Phase 1 sources are still running; the busiest threads
+        # then get their comment trees.
+        nonlocal rate_limited
+        to_refresh = items["reddit"][:ENRICH_INFO_MAX_ITEMS]
+        if not to_refresh:
+            return
+        if run_deadline.expired():
+            run_deadline.mark("reddit")
+            return
+        try:
+            refreshed, rate_limited = await _await_in_thread(
+                executor, timeouts["enrich_per"], _refresh_reddit_engagement,
+                to_refresh, timeouts, mock, progress,
+            )
+        except asyncio.TimeoutError:
+            refreshed = []
+            if run_deadline.expired():
+                run_deadline.mark("reddit")
+            elif progress:
+                progress.show_error(f"Engagement refresh timed out after {timeouts['enrich_per']}s")
+        enriched = set(refreshed)
+        to_enrich = [] if rate_limited or run_deadline.expired() else reddit_enrich.select_for_comments(
+            to_refresh, timeouts["enrich_threads"],
+        )
+        if progress:
+            progress.start_reddit_enrich(0, len(to_enrich))
+        tasks = {asyncio.ensure_future(enrich_one(items["reddit"][i])): i for i in to_enrich}
+        pending = set(tasks)
+        done_count = 0
+        loop = asyncio.get_running_loop()
+        enrich_until = loop.time() + run_deadline.cap(timeouts["enrich_total"])
+        while pending:
+            remaining = enrich_until - loop.time()
+            if remaining <= 0:
+                if run_deadline.expired():
+                    run_deadline.mark("reddit")
+                    if progress:
+                        progress.show_error(
+                            f"Enrichment cut short by deadline "
+                            f"({done_count}/{len(to_enrich)} done)"
+                        )
+                elif progress:
+                    progress.show_error(
+                        f"Enrichment timed out after {timeouts['enrich_total']}s "
+                        f"({done_count}/{len(to_enrich)} done)"
+                    )
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                idx = tasks[task]
+                done_count += 1
+                if progress:
+                    progress.update_reddit_enrich(done_count, len(to_enrich))
+                try:
+                    items["reddit"][idx] = task.result()
+                    enriched.add(idx)
+                except reddit_enrich.RedditRateLimitError:
+                    rate_limited = True
+                except Exception as e:
+                    if run_deadline.expired():
+                        # Keep the unenriched item
+                        run_deadline.mark("reddit")
+                    elif progress:
+                        progress.show_error(
+                            f"Enrich failed for {items['reddit'][idx].get('url', 'unknown')}: {e}"
+                        )
+            if rate_limited:
+                if progress:
+                    progress.show_error("Reddit rate-limited (429) — skipping remaining enrichment")
+                break
+        for task in pending:
+            task.cancel()
+        raw_reddit_enriched.extend(items["reddit"][i] for i in sorted(enriched))
+        if progress:
+            progress.end_reddit_enrich()
+
+    async def reddit_node():
+        timeout = timeouts.get("reddit_future", future_timeout)
+        if progress:
+            progress.start_reddit()
+        try:
+            items["reddit"], raw["reddit"], errors["reddit"] = await _await_in_thread(
+                executor, timeout, _search_reddit,
+                topic, config, selected_models, from_date, to_date, depth, mock,
+            )
+            if errors["reddit"] and progress:
+                progress.show_error(f"Reddit error: {errors['reddit']}")
+        except asyncio.TimeoutError:
+            errors["reddit"] = f"Reddit search timed out after {timeout}s"
+            if progress:
+                progress.show_error(errors["reddit"])
+        except Exception as e:
+            errors["reddit"] = f"{type(e).__name__}: {e}"
+            if progress:
+                progress.show_error(f"Reddit error: {e}")
+        errors["reddit"] = _note_cut_short("reddit", errors["reddit"])
+        if progress:
+            progress.end_reddit(len(items["reddit"]))
+        await enrich_reddit()
+        # Phase 2 waits for enrichment: a 429 there means skip the drill-down
+        if do_phase2 and items["reddit"]:
+            items["reddit"].extend(await drill_down("reddit"))
+        if on_source:
+            on_source("reddit", items["reddit"])
+
+    async def x_node():
+        if progress:
+            progress.start_x()
+        try:
+            items["x"], raw["x"], errors["x"] = await _await_in_thread(
+                executor, future_timeout, _search_x,
+                topic, config, selected_models, from_date, to_date, depth, mock, x_source,
+            )
+            if errors["x"] and progress:
+                progress.show_error(f"X error: {errors['x']}")
+        except asyncio.TimeoutError:
+            errors["x"] = f"X search timed out after {future_timeout}s"
+            if progress:
+                progress.show_error(errors["x"])
+        except Exception as e:
+            errors["x"] = f"{type(e).__name__}: {e}"
+            if progress:
+                progress.show_error(f"X error: {e}")
+        errors["x"] = _note_cut_short("x", errors["x"])
+        if progress:
+            progress.end_x(len(items["x"]))
+        if do_phase2 and items["x"]:
+            items["x"].extend(await drill_down("x"))
+        if on_source:
+            on_source("x", items["x"])
+
+    async def youtube_node():
+        timeout = timeouts.get("youtube_future", future_timeout)
+        if progress:
+            progress.start_youtube()
+        try:
+            items["youtube"], errors["youtube"] = await _await_in_thread(
+                executor, timeout, _search_youtube, topic, from_date, to_date, depth,
+            )
+            if errors["youtube"] and progress:
+                progress.show_error(f"YouTube error: {errors['youtube']}")
+        except asyncio.TimeoutError:
+            errors["youtube"] = f"YouTube search timed out after {timeout}s"
+            if progress:
+                progress.show_error(errors["youtube"])
+        except Exception as e:
+            errors["youtube"] = f"{type(e).__name__}: {e}"
+            if progress:
+                progress.show_error(f"YouTube error: {e}")
+        errors["youtube"] = _note_cut_short("youtube", errors["youtube"])
+        if progress:
+            progress.end_youtube(len(items["youtube"]))
+        if on_source:
+            on_source("youtube", items["youtube"])
+
+    async def web_node():
+        sys.stderr.write(f"[web] Searching via {web_backend}\n")
+        sys.stderr.flush()
+        try:
+            items["web"], errors["web"] = await _await_in_thread(
+                executor, future_timeout, _search_web, topic, config, from_date, to_date, depth,
+            )
+            if errors["web"] and progress:
+                progress.show_error(f"Web error: {errors['web']}")
+        except asyncio.TimeoutError:
+            errors["web"] = f"Web search timed out after {future_timeout}s"
+            if progress:
+                progress.show_error(errors["web"])
+        except Exception as e:
+            errors["web"] = f"{type(e).__name__}: {e}"
+            if progress:
+                progress.show_error(f"Web error: {e}")
+        errors["web"] = _note_cut_short("web", errors["web"])
+        sys.stderr.write(f"[web] {len(items['web'])} results\n")
+        sys.stderr.flush()
+        if on_source:
+            on_source("web", items["web"])
+
+    async def drill_down(source: str) -> list:
+        # Phase 2 for one source. Subreddits come only from Reddit items and
+        # handles only from X items, so each drill-down starts as soon as its
+        # own Phase 1 search returns.
+        reddit_in = items["reddit"] if source == "reddit" else []
+        x_in = items["x"] if source == "x" else []
+        try:
+            # _run_supplemental bounds its own search at 30s
+            sup_reddit, sup_x = await _await_in_thread(
+                executor, 60, _run_supplemental,
+                topic, list(reddit_in), list(x_in),
+                from_date, to_date, depth, x_source, progress,
+                source != "reddit" or rate_limited, source != "x",
+            )
+        except Exception as e:
+            if run_deadline.expired():
+                run_deadline.mark(source)
+            else:
+                sys.stderr.write(f"[Phase 2] Supplemental {source} error: {e}\n")
+            return []
+        return sup_reddit if source == "reddit" else sup_x
+
+    # Cached sources already include their supplemental results
+    nodes = []
+    if plan["do_reddit"]:
+        nodes.append(reddit_node())
+    if plan["do_x"]:
+        nodes.append(x_node())
+    if plan["run_youtube"]:
+        nodes.append(youtube_node())
+    if web_backend:
+        nodes.append(web_node())
+
+    if sources == "web" and plan["web_needed"] and progress:
+        # No native backend — assistant handles WebSearch
+        progress.start_web_only()
+        progress.end_web_only()
+
+    try:
+        await asyncio.gather(*nodes)
+    finally:
+        executor.shutdown(wait=False)
+
+    # Cache freshly fetched sources (errors and empty results are not cached)
+    if not mock:
+        fresh = {}
+        if plan["do_reddit"] and items["reddit"] and not errors["reddit"]:
+            fresh["reddit"] = {"items": items["reddit"], "raw": raw["reddit"]}
+        if plan["do_x"] and items["x"] and not errors["x"]:
+            fresh["x"] = {"items": items["x"], "raw": raw["x"]}
+        if plan["run_youtube"] and items["youtube"] and not errors["youtube"]:
+            fresh["youtube"] = {"items": items["youtube"]}
+        if web_backend and items["web"] and not errors["web"]:
+            fresh["web"] = {"items": items["web"]}
+        _save_fresh_sources(topic, from_date, to_date, depth, plan["source_models"], fresh)
+
+    return (
+        items["reddit"], items["x"], items["youtube"], items["web"], plan["web_needed"],
+        raw["reddit"], raw["x"], raw_reddit_enriched,
+        errors["reddit"], errors["x"], errors["youtube"], errors["web"],
+    )
+
+
+def run_research_async(
+    topic: str,
+    sources: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str = "default",
+    mock: bool = False,
+    progress: ui.ProgressDisplay = None,
+    x_source: str = "xai",
+    run_youtube: bool = False,
+    timeouts: dict = None,
+    cache_mode: str = "use",
+    cache_ages: dict = None,
+    on_source=None,
+) -> tuple:
+    """Run the research pipeline as an asyncio task graph (--engine=async).
+
+    Same inputs and outputs as run_research, but the phases overlap instead
+    of running back to back: as soon as the Reddit search returns, its threads
+    are enriched and then the subreddit drill-down starts (skipped if
+    enrichment hit a 429), and as soon as the X search returns, the handle
+    drill-down starts, without waiting for the other Phase 1 sources. Blocking source calls run on a thread pool, each
+    bounded by its TIMEOUT_PROFILES entry.
+    """
+    if timeouts is None:
+        timeouts = TIMEOUT_PROFILES[depth]
+    if cache_ages is None:
+        cache_ages = {}
+    return asyncio.run(_research_graph(
+        topic, sources, config, selected_models, from_date, to_date,
+        depth, mock, progress, x_source, run_youtube, timeouts,
+        cache_mode, cache_ages, on_source,
+    ))
+
+
+# ---------------------------------------------------------------------------
+# Importable API (used by watchlist.py and other in-process callers)
+# ---------------------------------------------------------------------------
+
+MODEL_CONFIG_KEYS = (
+    "OPENAI_API_KEY", "OPENAI_MODEL_POLICY", "OPENAI_MODEL_PIN",
+    "XAI_API_KEY", "XAI_MODEL_POLICY", "XAI_MODEL_PIN",
+)
+MODEL_MEMO_TTL = 3600
+_model_memo: dict = {}
+_model_memo_lock = threading.Lock()
+
+
+def resolve_sources(
+    config: dict,
+    x_source: str = None,
+    requested: str = "auto",
+    include_web: bool = False,
+    mock: bool = False,
+) -> tuple:
+    """Pick the source mode to run from the requested mode and config.
+
+    Returns:
+        (sources, error). error is None, a 'WebSearch fallback' note that
+        callers may show and ignore, or a reason the request cannot run.
+    """
+    # Mock mode can work without keys
+    if mock:
+        return ("both" if requested == "auto" else requested), None
+
+    # Check available sources (accounting for Bird auto-detection)
+    available = env.get_available_sources(config)
+
+    # Override available if Bird is ready
+    if x_source == 'bird':
+        if available == 'reddit':
+            available = 'both'  # Now have both Reddit + X (via Bird)
+        elif available == 'web':
+            available = 'x'  # Now have X via Bird
+
+    # Validate requested sources against available
+    return env.validate_sources(requested, available, include_web)
+
+
+def select_models(config: dict, mock: bool = False) -> dict:
+    """Select OpenAI/xAI models (from the model cache when it is fresh).
+
+    Selections are also kept in memory for MODEL_MEMO_TTL seconds, so
+    long-running callers (serve, watchlist) skip the model cache entirely.
+    """
+    if mock:
+        # Use mock models
+        mock_openai_models = load_fixture("models_openai_sample.json").get("data", [])
+        mock_xai_models = load_fixture("models_xai_sample.json").get("data", [])
+        return models.get_models(
+            {
+                "OPENAI_API_KEY": "mock",
+                "XAI_API_KEY": "mock",
+                **config,
+            },
+            mock_openai_models,
+            mock_xai_models,
+        )
+    key = tuple(config.get(k) for k in MODEL_CONFIG_KEYS)
+    with _model_memo_lock:
+        memo = _model_memo.get(key)
+        if memo and time.monotonic() - memo[0] < MODEL_MEMO_TTL:
+            return dict(memo[1])
+    selected = models.get_models(config)
+    with _model_memo_lock:
+        _model_memo[key] = (time.monotonic(), selected)
+    return dict(selected)
+
+
+def report_mode(sources: str) -> str:
+    """Report mode string for a resolved source mode."""
+    modes = {
+        "all": "all",  # reddit + x + web
+        "both": "both",  # reddit + x
+        "reddit": "reddit-only",
+        "reddit-web": "reddit-web",
+        "x": "x-only",
+        "x-web": "x-web",
+        "web": "web-only",
+    }
+    return modes.get(sources, sources)
+
+
+def process_results(
+    reddit_items: list,
+    x_items: list,
+    youtube_items: list,
+    web_items: list,
+    from_date: str,
+    to_date: str,
+    stages: pipeline.StreamingPipeline = None,
+) -> tuple:
+    """Normalize, score, dedupe, and cluster raw research results.
+
+    Args:
+        stages: Pipeline that already processed some sources while research
+            ran (via on_source); sources it has not seen are processed here
+
+    Returns:
+        Tuple of (reddit, x, youtube, web) schema item lists
+    """
+    if stages is None:
+        stages = pipeline.StreamingPipeline(from_date, to_date)
+    raw_by_source = {"reddit": reddit_items, "x": x_items, "youtube": youtube_items, "web": web_items}
+    for source, raw_items in raw_by_source.items():
+        if raw_items and not stages.has(source):
+            stages.add(source, raw_items)
+
+    # Cross-source clustering: a story seen on several platforms becomes one
+    # item, with the other appearances listed as sightings
+    return dedupe.cluster_cross_source(
+        stages.items("reddit"), stages.items("x"), stages.items("youtube"), stages.items("web"),
+    )
+
+
+def findings_from_report(report: schema.Report) -> list:
+    """Convert report items to store.store_findings dicts."""
+    findings = []
+    for item in report.reddit:
+        findings.append({
+            "source": "reddit",
+            "url": item.url,
+            "title": item.title,
+            "author": item.subreddit,
+            "content": item.title,
+            "engagement_score": item.engagement.score if item.engagement else 0,
+            "relevance_score": item.relevance,
+        })
+    for item in report.x:
+        findings.append({
+            "source": "x",
+            "url": item.url,
+            "title": item.text[:100],
+            "author": item.author_handle,
+            "content": item.text,
+            "engagement_score": item.engagement.likes if item.engagement else 0,
+            "relevance_score": item.relevance,
+        })
+    for item in report.youtube:
+        findings.append({
+            "source": "youtube",
+            "url": item.url,
+            "title": item.title,
+            "author": item.channel_name,
+            "content": item.transcript_snippet[:500] if item.transcript_snippet else item.title,
+            "engagement_score": item.engagement.views if item.engagement and item.engagement.views else 0,
+            "relevance_score": item.relevance,
+        })
+    for item in report.web:
+        findings.append({
+            "source": "web",
+            "url": item.url,
+            "title": item.title,
+            "author": item.source_domain,
+            "content": item.snippet,
+            "engagement_score": 0,
+            "relevance_score": item.relevance,
+        })
+    return findings
+
+
+def research_topic(
+    topic: str,
+    depth: str = "default",
+    days: int = 30,
+    sources: str = "auto",
+    include_web: bool = False,
+    config: dict = None,
+    engine: str = "threads",
+    cache_mode: str = "use",
+    mock: bool = False,
+    progress: ui.ProgressDisplay = None,
+    deadline_seconds: float = None,
+) -> schema.Report:
+    """Research a topic end to end and return the report, without printing.
+
+    This is what the CLI does minus argument parsing, the global timeout
+    watchdog, and output. Module state (HTTP keep-alive pool, result and
+    model caches, store connection) is shared across calls, so callers
+    researching many topics should call this in-process. With
+    deadline_seconds, research stops waiting after that long and the report
+    lists the sources that were cut short.
+
+    Raises:
+        ValueError: If the requested sources cannot run with this config
+    """
+    if config is None:
+        config = env.get_config()
+    x_source = env.get_x_source(config)
+    sources, error = resolve_sources(config, x_source, sources, include_web, mock)
+    if error and "WebSearch fallback" not in error:
+        raise ValueError(error)
+
+    from_date, to_date = dates.get_date_range(days)
+    selected_models = select_models(config, mock)
+    research = run_research_async if engine == "async" else run_research
+    cache_ages = {}
+    stages = pipeline.StreamingPipeline(from_date, to_date)
+    run_deadline = deadline.Deadline(deadline_seconds)
+    with deadline.active(run_deadline):
+        (reddit_items, x_items, youtube_items, web_items, _web_needed, _raw_openai, _raw_xai,
+         _raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error) = research(
+            topic,
+            sources,
+            config,
+            selected_models,
+            from_date,
+            to_date,
+            depth,
+            mock,
+            progress,
+            x_source=x_source or "xai",
+            run_youtube=env.is_ytdlp_available(),
+            cache_mode=cache_mode,
+            cache_ages=cache_ages,
+            on_source=stages.add,
+        )
+
+    report = schema.create_report(
+        topic,
+        from_date,
+        to_date,
+        report_mode(sources),
+        selected_models.get("openai"),
+        selected_models.get("xai"),
+    )
+    report.reddit, report.x, report.youtube, report.web = process_results(
+        reddit_items, x_items, youtube_items, web_items, from_date, to_date, stages,
+    )
+    report.reddit_error = reddit_error
+    report.x_error = x_error
+    report.youtube_error = youtube_error
+    report.web_error = web_error
+    report.cut_short = run_deadline.cut_short
+    if cache_ages:
+        report.from_cache = True
+        report.cache_age_hours = round(max(cache_ages.values()), 2)
+    return report
+
+
+def serve(argv: list):
+    """Run `last30days.py serve`: answer CLI requests from a warm process."""
+    parser = argparse.ArgumentParser(
+        prog="last30days.py serve",
+        description="Keep config, model selection, tool probes and connections "
+                    "warm, and run queries sent by last30days_client.py",
+    )
+    parser.add_argument("--socket", type=Path, default=None,
+                        help=f"Unix socket path (default: {daemon.socket_path()})")
+    parser.add_argument("--workers", type=int, default=daemon.DEFAULT_WORKERS,
+                        help=f"Queries to run at once (default: {daemon.DEFAULT_WORKERS})")
+    args = parser.parse_args(argv)
+
+    # Warm up everything a query would otherwise pay for on a cold start
+    config = env.get_config()
+    x_source_status = env.get_x_source_status(config)
+    env.is_ytdlp_available()
+    try:
+        select_models(config)
+    except Exception as e:
+        sys.stderr.write(f"[serve] Model selection failed, will retry per query: {e}\n")
+    sys.stderr.write(
+        f"[serve] X source: {x_source_status['source'] or 'none'}, "
+        f"web search: {env.get_web_search_source(config) or 'none'}\n"
+    )
+
+    try:
+        daemon.serve(main, args.socket, max(1, args.workers))
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def main(argv: list = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["serve"]:
+        serve(argv[1:])
+        return
+
     # Fix Unicode output on Windows (cp1252 can't encode emoji)
     if sys.platform == "win32":
         sys.stdout.reconfigure(encoding="utf-8", errors="replace")
@@ -776,7 +1783,7 @@ def main():
     parser.add_argument("--mock", action="store_true", help="Use fixtures")
     parser.add_argument(
         "--emit",
-        choices=["compact", "json", "md", "context", "path"],
+        choices=["compact", "json", "md", "context", "path", "jsonl-stream"],
         default="compact",
         help="Output mode",
     )
@@ -831,15 +1838,38 @@ def main():
         metavar="SECS",
         help="Global timeout in seconds (default: 180, quick: 90, deep: 300)",
     )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        metavar="SECS",
+        help="Stop waiting after SECS and report whatever has arrived, marking the "
+             "sources that were cut short (replaces the hard --timeout kill)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async"],
+        default=None,
+        help="Research engine: phased thread pools (default) or an asyncio task graph "
+             "(default with --emit=jsonl-stream)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bypass the result cache and fetch fresh data",
+    )
+    parser.add_argument(
+        "--cache-only",
+        action="store_true",
+        help="Serve results from the cache only, skipping uncached sources",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    # Enable debug logging if requested
+    # Enable debug logging if requested (for this run only: under `serve`
+    # other requests share the process)
     if args.debug:
-        os.environ["LAST30DAYS_DEBUG"] = "1"
-        # Re-import http to pick up debug flag
-        from lib import http as http_module
-        http_module.DEBUG = True
+        http.enable_debug()
 
     # Determine depth
     if args.quick and args.deep:
@@ -852,9 +1882,27 @@ def main():
     else:
         depth = "default"
 
-    # Install global timeout watchdog
+    # Determine cache mode
+    if args.refresh and args.cache_only:
+        print("Error: Cannot use both --refresh and --cache-only", file=sys.stderr)
+        sys.exit(1)
+    elif args.refresh:
+        cache_mode = "refresh"
+    elif args.cache_only:
+        cache_mode = "only"
+    else:
+        cache_mode = "use"
+
+    # Install global timeout watchdog. With --deadline the research winds
+    # itself down, so the hard kill is only a backstop.
     timeouts = TIMEOUT_PROFILES[depth]
-    global_timeout = args.timeout or timeouts["global"]
+    if args.deadline is not None and args.deadline <= 0:
+        print("Error: --deadline must be positive", file=sys.stderr)
+        sys.exit(1)
+    if args.deadline:
+        global_timeout = int(args.deadline) + DEADLINE_GRACE
+    else:
+        global_timeout = args.timeout or timeouts["global"]
     _install_global_timeout(global_timeout)
 
     # Load config
@@ -909,32 +1957,14 @@ def main():
     }
     ui.show_diagnostic_banner(diag)
 
-    # Check available sources (accounting for Bird auto-detection)
-    available = env.get_available_sources(config)
-
-    # Override available if Bird is ready
-    if x_source == 'bird':
-        if available == 'reddit':
-            available = 'both'  # Now have both Reddit + X (via Bird)
-        elif available == 'web':
-            available = 'x'  # Now have X via Bird
-
-    # Mock mode can work without keys
-    if args.mock:
-        if args.sources == "auto":
-            sources = "both"
+    sources, error = resolve_sources(config, x_source, args.sources, args.include_web, args.mock)
+    if error:
+        # If it's a warning about WebSearch fallback, print but continue
+        if "WebSearch fallback" in error:
+            print(f"Note: {error}", file=sys.stderr)
         else:
-            sources = args.sources
-    else:
-        # Validate requested sources against available
-        sources, error = env.validate_sources(args.sources, available, args.include_web)
-        if error:
-            # If it's a warning about WebSearch fallback, print but continue
-            if "WebSearch fallback" in error:
-                print(f"Note: {error}", file=sys.stderr)
-            else:
-                print(f"Error: {error}", file=sys.stderr)
-                sys.exit(1)
+            print(f"Error: {error}", file=sys.stderr)
+            sys.exit(1)
 
     # Get date range
     from_date, to_date = dates.get_date_range(args.days)
@@ -946,101 +1976,52 @@ def main():
     if missing_keys != 'none':
         progress.show_promo(missing_keys, diag=diag)
 
-    # Select models
-    if args.mock:
-        # Use mock models
-        mock_openai_models = load_fixture("models_openai_sample.json").get("data", [])
-        mock_xai_models = load_fixture("models_xai_sample.json").get("data", [])
-        selected_models = models.get_models(
-            {
-                "OPENAI_API_KEY": "mock",
-                "XAI_API_KEY": "mock",
-                **config,
-            },
-            mock_openai_models,
-            mock_xai_models,
+    selected_models = select_models(config, args.mock)
+    mode = report_mode(sources)
+
+    # The async engine settles each source independently, so partial
+    # results can stream out before the slowest source finishes
+    engine = args.engine or ("async" if args.emit == "jsonl-stream" else "threads")
+    on_update = _emit_stream_update if args.emit == "jsonl-stream" else None
+    stages = pipeline.StreamingPipeline(from_date, to_date, on_update=on_update)
+
+    # Run research; each source is normalized, scored, and deduped as soon
+    # as its items are final
+    cache_ages = {}
+    research = run_research_async if engine == "async" else run_research
+    run_deadline = deadline.Deadline(args.deadline)
+    with deadline.active(run_deadline):
+        reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error = research(
+            args.topic,
+            sources,
+            config,
+            selected_models,
+            from_date,
+            to_date,
+            depth,
+            args.mock,
+            progress,
+            x_source=x_source or "xai",
+            run_youtube=has_ytdlp,
+            timeouts=timeouts,
+            cache_mode=cache_mode,
+            cache_ages=cache_ages,
+            on_source=stages.add,
         )
-    else:
-        selected_models = models.get_models(config)
-
-    # Determine mode string
-    if sources == "all":
-        mode = "all"  # reddit + x + web
-    elif sources == "both":
-        mode = "both"  # reddit + x
-    elif sources == "reddit":
-        mode = "reddit-only"
-    elif sources == "reddit-web":
-        mode = "reddit-web"
-    elif sources == "x":
-        mode = "x-only"
-    elif sources == "x-web":
-        mode = "x-web"
-    elif sources == "web":
-        mode = "web-only"
-    else:
-        mode = sources
 
-    # Run research
-    reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error = run_research(
-        args.topic,
-        sources,
-        config,
-        selected_models,
-        from_date,
-        to_date,
-        depth,
-        args.mock,
-        progress,
-        x_source=x_source or "xai",
-        run_youtube=has_ytdlp,
-        timeouts=timeouts,
-    )
+    if cache_ages:
+        progress.show_cached(max(cache_ages.values()))
+    if run_deadline.cut_short:
+        progress.show_error(
+            f"Deadline reached after {args.deadline:g}s — partial results "
+            f"(cut short: {', '.join(run_deadline.cut_short)})"
+        )
 
     # Processing phase
     progress.start_processing()
-
-    # Normalize items
-    normalized_reddit = normalize.normalize_reddit_items(reddit_items, from_date, to_date)
-    normalized_x = normalize.normalize_x_items(x_items, from_date, to_date)
-    normalized_youtube = normalize.normalize_youtube_items(youtube_items, from_date, to_date) if youtube_items else []
-    normalized_web = websearch.normalize_websearch_items(web_items, from_date, to_date) if web_items else []
-
-    # Hard date filter: exclude items with verified dates outside the range
-    # This is the safety net - even if prompts let old content through, this filters it
-    filtered_reddit = normalize.filter_by_date_range(normalized_reddit, from_date, to_date)
-    filtered_x = normalize.filter_by_date_range(normalized_x, from_date, to_date)
-    # YouTube: skip hard date filter — youtube_yt.py already applies a soft filter
-    # that prefers recent videos but keeps older ones for evergreen topics.
-    # YouTube content has a longer shelf life than tweets/posts.
-    filtered_youtube = normalized_youtube
-    filtered_web = normalize.filter_by_date_range(normalized_web, from_date, to_date) if normalized_web else []
-
-    # Score items
-    scored_reddit = score.score_reddit_items(filtered_reddit)
-    scored_x = score.score_x_items(filtered_x)
-    scored_youtube = score.score_youtube_items(filtered_youtube) if filtered_youtube else []
-    scored_web = score.score_websearch_items(filtered_web) if filtered_web else []
-
-    # Sort items
-    sorted_reddit = score.sort_items(scored_reddit)
-    sorted_x = score.sort_items(scored_x)
-    sorted_youtube = score.sort_items(scored_youtube) if scored_youtube else []
-    sorted_web = score.sort_items(scored_web) if scored_web else []
-
-    # Dedupe items
-    deduped_reddit = dedupe.dedupe_reddit(sorted_reddit)
-    deduped_x = dedupe.dedupe_x(sorted_x)
-    deduped_youtube = dedupe.dedupe_youtube(sorted_youtube) if sorted_youtube else []
-    deduped_web = websearch.dedupe_websearch(sorted_web) if sorted_web else []
-
-    # Minimum result guarantee: if all Reddit results were filtered out but
-    # we had raw results, keep top 3 by relevance regardless of score
-    if not deduped_reddit and normalized_reddit:
-        print("[REDDIT WARNING] All results scored below threshold, keeping top 3 by relevance", file=sys.stderr)
-        by_relevance = sorted(normalized_reddit, key=lambda item: item.relevance, reverse=True)
-        deduped_reddit = by_relevance[:3]
-
+    deduped_reddit, deduped_x, deduped_youtube, deduped_web = process_results(
+        reddit_items, x_items, youtube_items, web_items, from_date, to_date, stages,
+    )
     progress.end_processing()
 
     # Create report
@@ -1060,6 +2041,10 @@ def main():
     report.x_error = x_error
     report.youtube_error = youtube_error
     report.web_error = web_error
+    report.cut_short = run_deadline.cut_short
+    if cache_ages:
+        report.from_cache = True
+        report.cache_age_hours = round(max(cache_ages.values()), 2)
 
     # Generate context snippet
     report.context_snippet_md = render.render_context_snippet(report)
@@ -1086,6 +2071,8 @@ def main():
         source_info["youtube_skip_reason"] = "yt-dlp not installed — fix: brew install yt-dlp"
     if not web_source:
         source_info["web_skip_reason"] = "assistant will use WebSearch (add BRAVE_API_KEY for native search)"
+    if cache_ages:
+        source_info["cache_ages"] = cache_ages
 
     # Output result
     output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys, args.days, source_info)
@@ -1098,48 +2085,7 @@ def main():
         topic_id = topic_row["id"]
         run_id = store_mod.record_run(topic_id, source_mode=mode, status="completed")
 
-        findings = []
-        for item in deduped_reddit:
-            findings.append({
-                "source": "reddit",
-                "url": item.url,
-                "title": item.title,
-                "author": item.subreddit,
-                "content": item.title,
-                "engagement_score": item.engagement.score if item.engagement else 0,
-                "relevance_score": item.relevance,
-            })
-        for item in deduped_x:
-            findings.append({
-                "source": "x",
-                "url": item.url,
-                "title": item.text[:100],
-                "author": item.author_handle,
-                "content": item.text,
-                "engagement_score": item.engagement.likes if item.engagement else 0,
-                "relevance_score": item.relevance,
-            })
-        for item in deduped_youtube:
-            findings.append({
-                "source": "youtube",
-                "url": item.url,
-                "title": item.title,
-                "author": item.channel_name,
-                "content": item.transcript_snippet[:500] if item.transcript_snippet else item.title,
-                "engagement_score": item.engagement.views if item.engagement and item.engagement.views else 0,
-                "relevance_score": item.relevance,
-            })
-        for item in deduped_web:
-            findings.append({
-                "source": "web",
-                "url": item.url,
-                "title": item.title,
-                "author": item.source_domain,
-                "content": item.snippet,
-                "engagement_score": 0,
-                "relevance_score": item.relevance,
-            })
-
+        findings = findings_from_report(report)
         counts = store_mod.store_findings(run_id, topic_id, findings)
         store_mod.update_run(
             run_id,
@@ -1153,6 +2099,11 @@ def main():
         sys.stderr.flush()
 
 
+def _emit_stream_update(source: str, stages: pipeline.StreamingPipeline):
+    """Print the running ranked view as one JSON line (--emit=jsonl-stream)."""
+    print(json.dumps(stages.snapshot(source)), flush=True)
+
+
 def output_result(
     report: schema.Report,
     emit_mode: str,
@@ -1177,6 +2128,11 @@ def output_result(
         print(report.context_snippet_md)
     elif emit_mode == "path":
         print(render.get_context_path())
+    elif emit_mode == "jsonl-stream":
+        # Final line of the stream; WebSearch instructions ride along as a
+        # field so stdout stays valid JSONL
+        print(json.dumps({"event": "final", "web_needed": web_needed, "report": report.to_dict()}), flush=True)
+        return
 
     # Output WebSearch instructions if needed
     if web_needed:
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Thin client for a running `last30days.py serve`.
+
+Takes exactly the same arguments as last30days.py and streams the server's
+output back as it is produced. When no server is listening it runs
+last30days.py directly, so callers can always use this entry point.
+
+Usage:
+    python3 last30days_client.py <topic> [options]
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add lib to path
+SCRIPT_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from lib import daemon
+
+
+def main():
+    argv = sys.argv[1:]
+    code = daemon.request(argv) if argv[:1] != ["serve"] else None
+    if code is None:
+        script = str(SCRIPT_DIR / "last30days.py")
+        os.execv(sys.executable, [sys.executable, script, *argv])
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
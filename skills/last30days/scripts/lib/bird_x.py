@@ -4,19 +4,51 @@ Uses a vendored subset of @steipete/bird v0.8.0 (MIT License) to search X
 via Twitter's GraphQL API. No external `bird` CLI binary needed - just Node.js 22+.
 """
 
+import atexit
+import concurrent.futures
 import json
 import os
 import signal
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from . import deadline, singleflight
+from .deadline import current as current_deadline
+
 # Path to the vendored bird-search wrapper
 _BIRD_SEARCH_MJS = Path(__file__).parent / "vendor" / "bird-search" / "bird-search.mjs"
 
+# How long an auth check is trusted. `--whoami` starts Node and may read
+# browser cookies, and one run asks several times (status, missing keys,
+# source choice); a long-running `serve` process asks on every query.
+# A failed check is only trusted briefly, so logging in to x.com (or
+# exporting AUTH_TOKEN/CT0) takes effect without restarting `serve`.
+AUTH_PROBE_TTL = 600
+AUTH_PROBE_NEGATIVE_TTL = 30
+_auth_probe: Optional[Tuple[float, Optional[str]]] = None
+_auth_probe_lock = threading.Lock()
+
+# Set LAST30DAYS_BIRD_WORKER=0 to spawn one `node` per search instead of
+# keeping a resident worker
+_WORKER_DISABLED_VALUES = ("0", "off", "false", "no")
+
+# Longest single wait for a worker reply before re-checking the deadline
+_POLL_INTERVAL = 0.25
+
+# Phase 2 handle searches: handles OR'ed into one query, batches searched
+# at once, per-search timeout, and the budget for all of them (results that
+# arrive in time are kept when it runs out)
+HANDLE_BATCH_SIZE = 5
+HANDLE_SEARCH_WORKERS = 4
+HANDLE_SEARCH_TIMEOUT = 15
+HANDLE_SEARCH_BUDGET = 25
+
 # Depth configurations: number of results to request
 DEPTH_CONFIG = {
     "quick": 12,
@@ -103,9 +135,21 @@ def is_bird_authenticated() -> Optional[str]:
     Returns:
         Auth source string if authenticated, None otherwise.
     """
+    global _auth_probe
     if not is_bird_installed():
         return None
 
+    with _auth_probe_lock:
+        if _auth_probe:
+            ttl = AUTH_PROBE_TTL if _auth_probe[1] else AUTH_PROBE_NEGATIVE_TTL
+            if time.monotonic() - _auth_probe[0] < ttl:
+                return _auth_probe[1]
+        _auth_probe = (time.monotonic(), _probe_bird_auth())
+        return _auth_probe[1]
+
+
+def _probe_bird_auth() -> Optional[str]:
+    """Run `bird-search.mjs --whoami` (uncached)."""
     try:
         result = subprocess.run(
             ["node", str(_BIRD_SEARCH_MJS), "--whoami"],
@@ -159,9 +203,193 @@ def get_bird_status() -> Dict[str, Any]:
     }
 
 
+class BirdWorkerError(Exception):
+    """The resident Bird worker could not be started or died."""
+    pass
+
+
+class _Reply:
+    def __init__(self, proc: subprocess.Popen):
+        self.proc = proc
+        self.done = threading.Event()
+        self.message: Optional[Dict[str, Any]] = None
+
+
+class BirdWorker:
+    """A resident `bird-search.mjs --worker` process.
+
+    Node startup, module loading and cookie extraction happen once; searches
+    are sent as line-delimited JSON-RPC over stdin and may overlap, with a
+    reader thread matching each reply line to its request by id. The worker
+    is started on first use and restarted on the next call if it dies.
+    """
+
+    def __init__(self, cmd: Optional[List[str]] = None):
+        """
+        Args:
+            cmd: Worker command (default: node bird-search.mjs --worker)
+        """
+        self._cmd = cmd or ["node", str(_BIRD_SEARCH_MJS), "--worker"]
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._pending: Dict[int, _Reply] = {}
+        self._next_id = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        proc = self._proc
+        return proc.pid if proc and proc.poll() is None else None
+
+    def _start(self) -> subprocess.Popen:
+        """Return the running worker, starting one if needed (holds _lock)."""
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        try:
+            proc = subprocess.Popen(
+                self._cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                preexec_fn=os.setsid if hasattr(os, 'setsid') else None,
+            )
+        except OSError as e:
+            raise BirdWorkerError(f"Could not start Bird worker: {e}") from e
+        try:
+            from last30days import register_child_pid
+            register_child_pid(proc.pid)
+        except ImportError:
+            pass
+        threading.Thread(
+            target=self._read_replies, args=(proc,), name="bird-worker-reader", daemon=True,
+        ).start()
+        self._proc = proc
+        return proc
+
+    def _read_replies(self, proc: subprocess.Popen):
+        """Hand each reply line to the request waiting for it."""
+        for line in proc.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(message, dict):
+                continue
+            with self._lock:
+                reply = self._pending.pop(message.get("id"), None)
+            if reply:
+                reply.message = message
+                reply.done.set()
+        # EOF: the worker exited; fail whatever it still owed
+        proc.wait()
+        _forget_child(proc.pid)
+        with self._lock:
+            if self._proc is proc:
+                self._proc = None
+            orphaned = [rid for rid, reply in self._pending.items() if reply.proc is proc]
+            replies = [self._pending.pop(rid) for rid in orphaned]
+        for reply in replies:
+            reply.done.set()
+
+    def call(self, method: str, params: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """Send one request and wait for its reply.
+
+        Args:
+            method: JSON-RPC method ("search" or "ping")
+            params: Method parameters
+            timeout: Seconds to wait (capped by the run deadline)
+
+        Returns:
+            The reply message ({"id", "result"} or {"id", "error"}), or None
+            if it did not arrive in time
+
+        Raises:
+            BirdWorkerError: If the worker could not be started or exited
+                before replying
+        """
+        with self._lock:
+            proc = self._start()
+            self._next_id += 1
+            request_id = self._next_id
+            reply = self._pending[request_id] = _Reply(proc)
+        line = json.dumps({"id": request_id, "method": method, "params": params}) + "\n"
+        try:
+            with self._write_lock:
+                proc.stdin.write(line)
+                proc.stdin.flush()
+        except (OSError, ValueError) as e:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise BirdWorkerError(f"Bird worker unavailable: {e}") from e
+
+        # Re-check so an abandoned caller (cancelled deadline) stops waiting
+        wait_deadline = current_deadline().child(timeout)
+        while not reply.done.wait(min(wait_deadline.remaining(), _POLL_INTERVAL)):
+            if wait_deadline.expired():
+                with self._lock:
+                    self._pending.pop(request_id, None)
+                return None
+        if reply.message is None:
+            raise BirdWorkerError("Bird worker exited")
+        return reply.message
+
+    def close(self):
+        """Stop the worker (it finishes in-flight searches, then exits)."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            try:
+                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+            except (ProcessLookupError, PermissionError, OSError):
+                proc.kill()
+        _forget_child(proc.pid)
+
+
+def _forget_child(pid: int):
+    try:
+        from last30days import unregister_child_pid
+        unregister_child_pid(pid)
+    except ImportError:
+        pass
+
+
+_worker: Optional[BirdWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_worker() -> Optional[BirdWorker]:
+    """The process-wide Bird worker, or None if disabled (LAST30DAYS_BIRD_WORKER=0)."""
+    global _worker
+    if os.environ.get("LAST30DAYS_BIRD_WORKER", "").lower() in _WORKER_DISABLED_VALUES:
+        return None
+    with _worker_lock:
+        if _worker is None:
+            _worker = BirdWorker()
+            atexit.register(close_worker)
+        return _worker
+
+
+def close_worker():
+    """Stop the process-wide Bird worker, if one was started."""
+    global _worker
+    with _worker_lock:
+        worker, _worker = _worker, None
+    if worker is not None:
+        worker.close()
+
+
 def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
     """Run a search using the vendored bird-search.mjs module.
 
+    Identical searches running at the same time share one Bird call.
+
     Args:
         query: Full search query string (including since: filter)
         count: Number of results to request
@@ -170,6 +398,30 @@ def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
     Returns:
         Raw Bird JSON response or error dict.
     """
+    key = singleflight.make_key("bird search", query, count)
+    return singleflight.do(key, _bird_search, query, count, timeout)
+
+
+def _bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
+    """_run_bird_search() without coalescing: the resident worker, else one spawn."""
+    worker = get_worker()
+    if worker is not None:
+        try:
+            message = worker.call("search", {"query": query, "count": count}, timeout)
+        except BirdWorkerError as e:
+            _log(f"{e}; running search in a one-off process")
+        else:
+            if message is None:
+                return {"error": f"Search timed out after {timeout}s", "items": []}
+            if message.get("error"):
+                return {"error": message["error"], "items": []}
+            result = message.get("result")
+            return result if isinstance(result, (list, dict)) else {"items": []}
+    return _spawn_bird_search(query, count, timeout)
+
+
+def _spawn_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
+    """Run one search in its own `node` process."""
     cmd = [
         "node", str(_BIRD_SEARCH_MJS),
         query,
@@ -197,7 +449,7 @@ def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
             pass
 
         try:
-            stdout, stderr = proc.communicate(timeout=timeout)
+            stdout, stderr = proc.communicate(timeout=current_deadline().cap(timeout))
         except subprocess.TimeoutExpired:
             # Kill the entire process group
             try:
@@ -275,75 +527,130 @@ def search_handles(
     topic: str,
     from_date: str,
     count_per: int = 5,
+    merge: bool = True,
+    budget: float = HANDLE_SEARCH_BUDGET,
 ) -> List[Dict[str, Any]]:
     """Search specific X handles for topic-related content.
 
     Runs targeted Bird searches using `from:handle topic` syntax.
     Used in Phase 2 supplemental search after entity extraction.
 
+    With merge, up to HANDLE_BATCH_SIZE handles share one
+    `(from:a OR from:b) topic` query and the results are split back out by
+    author; otherwise each handle gets its own query. Queries run
+    concurrently (HANDLE_SEARCH_WORKERS at a time). A merged query that
+    returns a full page can be dominated by one prolific handle, so handles
+    left short of count_per then get a per-handle top-up query.
+
     Args:
         handles: List of X handles to search (without @)
         topic: Search topic (core subject, not full verbose query)
         from_date: Start date (YYYY-MM-DD)
         count_per: Results to request per handle
+        merge: Batch handles into OR queries
+        budget: Seconds for all searches; results of searches still running
+            then are dropped, the rest are returned
 
     Returns:
-        List of raw item dicts (same format as parse_bird_response output).
+        List of raw item dicts (same format as parse_bird_response output),
+        at most count_per per handle, in handle order.
     """
-    all_items = []
     core_topic = _extract_core_subject(topic)
-
+    unique, seen = [], set()
     for handle in handles:
         handle = handle.lstrip("@")
-        query = f"from:{handle} {core_topic} since:{from_date}"
-
-        cmd = [
-            "node", str(_BIRD_SEARCH_MJS),
-            query,
-            "--count", str(count_per),
-            "--json",
-        ]
-
-        preexec = os.setsid if hasattr(os, 'setsid') else None
-
-        try:
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                preexec_fn=preexec,
-            )
-
+        if handle and handle.lower() not in seen:
+            seen.add(handle.lower())
+            unique.append(handle)
+    if not unique:
+        return []
+    if current_deadline().expired():
+        _log("Run deadline reached, skipping handle searches")
+        return []
+
+    size = HANDLE_BATCH_SIZE if merge else 1
+    batches = [unique[i:i + size] for i in range(0, len(unique), size)]
+    search_deadline = current_deadline().child(budget)
+    pool = deadline.ThreadPoolExecutor(max_workers=min(HANDLE_SEARCH_WORKERS, len(unique)))
+    results: Dict[str, List[Dict[str, Any]]] = {}
+
+    def run_round(round_batches: List[List[str]]) -> List[str]:
+        with deadline.active(search_deadline):
+            futures = [
+                pool.submit(_search_handle_batch, batch, core_topic, from_date, count_per)
+                for batch in round_batches
+            ]
+        concurrent.futures.wait(futures, timeout=search_deadline.remaining())
+        starved = []
+        for batch, future in zip(round_batches, futures):
+            if not future.done():
+                deadline.abandon(future)
+                _log(f"Handle search timed out for @{', @'.join(batch)}")
+                continue
             try:
-                stdout, stderr = proc.communicate(timeout=15)
-            except subprocess.TimeoutExpired:
-                try:
-                    os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-                except (ProcessLookupError, PermissionError, OSError):
-                    proc.kill()
-                proc.wait(timeout=5)
-                _log(f"Handle search timed out for @{handle}")
+                by_handle, short = future.result()
+            except Exception as e:
+                _log(f"Handle search error for @{', @'.join(batch)}: {e}")
                 continue
+            for handle, items in by_handle.items():
+                urls = {item.get("url") for item in results.get(handle, [])}
+                results.setdefault(handle, []).extend(
+                    item for item in items if item.get("url") not in urls
+                )
+                del results[handle][count_per:]
+            starved.extend(short)
+        return starved
 
-            if proc.returncode != 0:
-                _log(f"Handle search failed for @{handle}: {(stderr or '').strip()}")
-                continue
+    try:
+        starved = run_round(batches)
+        # A merged query that came back full may have been crowded out by
+        # one prolific handle; the others get their own query
+        if starved and not search_deadline.expired():
+            _log(f"Topping up @{', @'.join(starved)} with per-handle searches")
+            run_round([[handle] for handle in starved])
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
-            output = (stdout or "").strip()
-            if not output:
-                continue
+    return [item for handle in unique for item in results.get(handle.lower(), [])]
 
-            response = json.loads(output)
-            items = parse_bird_response(response)
-            all_items.extend(items)
 
-        except json.JSONDecodeError:
-            _log(f"Invalid JSON from handle search for @{handle}")
-        except Exception as e:
-            _log(f"Handle search error for @{handle}: {e}")
+def _search_handle_batch(
+    batch: List[str],
+    core_topic: str,
+    from_date: str,
+    count_per: int,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], List[str]]:
+    """One Bird search covering every handle in batch.
 
-    return all_items
+    Returns:
+        (items per lowercased handle, at most count_per each; handles that
+        may have been crowded out: those short of count_per when the merged
+        query returned as many results as it asked for)
+    """
+    if len(batch) == 1:
+        query = f"from:{batch[0]} {core_topic} since:{from_date}"
+    else:
+        authors = " OR ".join(f"from:{handle}" for handle in batch)
+        query = f"({authors}) {core_topic} since:{from_date}"
+
+    count = count_per * len(batch)
+    response = _run_bird_search(query, count, HANDLE_SEARCH_TIMEOUT)
+    if isinstance(response, dict) and response.get("error"):
+        _log(f"Handle search failed for @{', @'.join(batch)}: {response['error']}")
+        return {}, []
+    items = parse_bird_response(response)
+    if len(batch) == 1:
+        return {batch[0].lower(): items[:count_per]}, []
+
+    # Split back out by author, keeping each handle to its own share
+    by_author: Dict[str, List[Dict[str, Any]]] = {handle.lower(): [] for handle in batch}
+    for item in items:
+        share = by_author.get((item.get("author_handle") or "").lower())
+        if share is not None and len(share) < count_per:
+            share.append(item)
+    saturated = len(items) >= count
+    starved = [handle for handle in batch if saturated and len(by_author[handle.lower()]) < count_per]
+    return by_author, starved
 
 
 def parse_bird_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
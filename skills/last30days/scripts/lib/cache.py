@@ -1,43 +1,213 @@
-"""Caching utilities for last30days skill."""
+"""Caching utilities for last30days skill.
 
+Research results live in a single SQLite file (results.db) in the cache
+directory, with indexed expiry, a byte budget enforced by LRU eviction and
+persistent hit/miss counters. Legacy one-JSON-file-per-key entries are
+migrated into it the first time it is opened.
+"""
+
+import atexit
 import hashlib
 import json
 import os
+import sqlite3
+import sys
 import tempfile
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 CACHE_DIR = Path.home() / ".cache" / "last30days"
 DEFAULT_TTL_HOURS = 24
 MODEL_CACHE_TTL_DAYS = 7
 MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
+CACHE_DB_FILE = CACHE_DIR / "results.db"
+
+
+def env_bytes(name: str, default: int) -> int:
+    """A positive byte budget from the environment, or default if unset or invalid."""
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        sys.stderr.write(f"[Cache] Ignoring {name}={raw!r}: not a positive byte count\n")
+        return default
+    return value
+
+
+CACHE_MAX_BYTES = env_bytes("LAST30DAYS_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+
+# Hit/miss counts and LRU bumps from lookups are buffered in memory and
+# written in one transaction at most this often (and before saves, stats
+# and close), so reads don't each take the write lock
+ACCESS_FLUSH_SECONDS = 5
+
+# Per-source result TTLs. X moves fastest; YouTube search results and
+# transcripts barely change within a day.
+SOURCE_TTL_HOURS = {
+    "reddit": 6,
+    "x": 3,
+    "youtube": 24,
+    "web": 12,
+}
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires_at);
+CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access);
+
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO stats (name, value) VALUES ('hits', 0);
+INSERT OR IGNORE INTO stats (name, value) VALUES ('misses', 0);
+INSERT OR IGNORE INTO stats (name, value) VALUES ('evictions', 0);
+INSERT OR IGNORE INTO stats (name, value) VALUES ('json_migrated', 0);
+"""
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_path: Optional[Path] = None
+_conn_lock = threading.RLock()
+_pending_access: Dict[str, float] = {}
+_pending_counts: Dict[str, int] = {}
+_last_flush = 0.0
 
 
 def ensure_cache_dir():
     """Ensure cache directory exists. Supports env override and sandbox fallback."""
-    global CACHE_DIR, MODEL_CACHE_FILE
+    global CACHE_DIR, MODEL_CACHE_FILE, CACHE_DB_FILE
     env_dir = os.environ.get("LAST30DAYS_CACHE_DIR")
     if env_dir:
         CACHE_DIR = Path(env_dir)
         MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
+        CACHE_DB_FILE = CACHE_DIR / "results.db"
 
     try:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
     except PermissionError:
         CACHE_DIR = Path(tempfile.gettempdir()) / "last30days" / "cache"
         MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
+        CACHE_DB_FILE = CACHE_DIR / "results.db"
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _get_conn() -> sqlite3.Connection:
+    """Return the shared results.db connection, opening it on first use.
+
+    Callers must hold _conn_lock. Reopens if CACHE_DB_FILE has moved
+    (env override or sandbox fallback applied after the first open).
+    """
+    global _conn, _conn_path
+    if _conn is not None and _conn_path == CACHE_DB_FILE:
+        return _conn
+
+    close()
+    ensure_cache_dir()
+    conn = sqlite3.connect(str(CACHE_DB_FILE), timeout=5, check_same_thread=False)
+    conn.executescript(_SCHEMA)
+    _conn, _conn_path = conn, CACHE_DB_FILE
+
+    migrated = conn.execute("SELECT value FROM stats WHERE name = 'json_migrated'").fetchone()[0]
+    if not migrated:
+        migrate_json_cache(conn)
+    return conn
+
+
+def close():
+    """Close the shared results.db connection (reopened lazily on next use)."""
+    global _conn, _conn_path
+    with _conn_lock:
+        if _conn is not None:
+            _flush_access(_conn)
+            try:
+                _conn.close()
+            except sqlite3.Error:
+                pass
+        _conn, _conn_path = None, None
+
+
+atexit.register(close)  # writes buffered lookups
+
+
+def migrate_json_cache(conn: Optional[sqlite3.Connection] = None) -> int:
+    """Move legacy <key>.json result files into results.db.
+
+    Each file keeps its mtime as created_at, so TTL checks behave exactly as
+    they did against the file. Files are removed once imported.
+
+    Returns:
+        Number of entries migrated
+    """
+    with _conn_lock:
+        conn = conn or _get_conn()
+        migrated = 0
+        for path in CACHE_DIR.glob("*.json"):
+            if path == MODEL_CACHE_FILE:
+                continue
+            try:
+                mtime = path.stat().st_mtime
+                value = path.read_text()
+                json.loads(value)
+            except (OSError, ValueError):
+                continue
+            with conn:
+                conn.execute(
+                    """INSERT OR IGNORE INTO entries
+                       (key, value, size, created_at, expires_at, last_access)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    (path.stem, value, len(value), mtime,
+                     mtime + DEFAULT_TTL_HOURS * 3600, mtime),
+                )
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            migrated += 1
+        with conn:
+            conn.execute("UPDATE stats SET value = 1 WHERE name = 'json_migrated'")
+        return migrated
+
+
 def get_cache_key(topic: str, from_date: str, to_date: str, sources: str) -> str:
     """Generate a cache key from query parameters."""
     key_data = f"{topic}|{from_date}|{to_date}|{sources}"
     return hashlib.sha256(key_data.encode()).hexdigest()[:16]
 
 
+def get_source_cache_key(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    source: str,
+    depth: str,
+    model: Optional[str],
+) -> str:
+    """Generate a cache key for a single source's research results."""
+    key_data = f"{topic}|{from_date}|{to_date}|{source}|{depth}|{model or ''}"
+    return hashlib.sha256(key_data.encode()).hexdigest()[:16]
+
+
 def get_cache_path(cache_key: str) -> Path:
-    """Get path to cache file."""
+    """Get path to a legacy one-file-per-key JSON cache entry."""
     return CACHE_DIR / f"{cache_key}.json"
 
 
@@ -56,18 +226,10 @@ def is_cache_valid(cache_path: Path, ttl_hours: int = DEFAULT_TTL_HOURS) -> bool
         return False
 
 
-def load_cache(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> Optional[dict]:
+def load_cache(cache_key: str, ttl_hours: float = DEFAULT_TTL_HOURS) -> Optional[dict]:
     """Load data from cache if valid."""
-    cache_path = get_cache_path(cache_key)
-
-    if not is_cache_valid(cache_path, ttl_hours):
-        return None
-
-    try:
-        with open(cache_path, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
+    data, _ = load_cache_with_age(cache_key, ttl_hours)
+    return data
 
 
 def get_cache_age_hours(cache_path: Path) -> Optional[float]:
@@ -83,40 +245,149 @@ def get_cache_age_hours(cache_path: Path) -> Optional[float]:
         return None
 
 
-def load_cache_with_age(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> tuple:
+def load_cache_with_age(cache_key: str, ttl_hours: float = DEFAULT_TTL_HOURS) -> tuple:
     """Load data from cache with age info.
 
+    A hit refreshes the entry's LRU position. Hits and misses are counted.
+    Both are buffered (see ACCESS_FLUSH_SECONDS) and best-effort: a busy
+    database never turns a hit into a miss.
+
     Returns:
         Tuple of (data, age_hours) or (None, None) if invalid
     """
-    cache_path = get_cache_path(cache_key)
-
-    if not is_cache_valid(cache_path, ttl_hours):
+    now = time.time()
+    try:
+        with _conn_lock:
+            conn = _get_conn()
+            row = conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (cache_key,)
+            ).fetchone()
+            age = (now - row[1]) / 3600 if row else None
+            hit = row is not None and age < ttl_hours
+            if hit:
+                _pending_access[cache_key] = now
+            counter = "hits" if hit else "misses"
+            _pending_counts[counter] = _pending_counts.get(counter, 0) + 1
+            if now - _last_flush >= ACCESS_FLUSH_SECONDS:
+                _flush_access(conn)
+        if not hit:
+            return None, None
+        return json.loads(row[0]), age
+    except (sqlite3.Error, ValueError, OSError):
         return None, None
 
-    age = get_cache_age_hours(cache_path)
 
+def save_cache(cache_key: str, data: dict, ttl_hours: float = DEFAULT_TTL_HOURS):
+    """Save data to cache, evicting least-recently-used entries over budget."""
+    now = time.time()
     try:
-        with open(cache_path, 'r') as f:
-            return json.load(f), age
-    except (json.JSONDecodeError, OSError):
-        return None, None
+        value = json.dumps(data)
+        with _conn_lock:
+            conn = _get_conn()
+            _flush_access(conn)  # eviction below goes by last_access
+            with conn:
+                conn.execute(
+                    """INSERT OR REPLACE INTO entries
+                       (key, value, size, created_at, expires_at, last_access)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    (cache_key, value, len(value), now, now + ttl_hours * 3600, now),
+                )
+                _evict(conn, CACHE_MAX_BYTES, now)
+    except (sqlite3.Error, TypeError, ValueError, OSError):
+        pass  # Silently fail on cache write errors
 
 
-def save_cache(cache_key: str, data: dict):
-    """Save data to cache."""
-    ensure_cache_dir()
-    cache_path = get_cache_path(cache_key)
+def _flush_access(conn: sqlite3.Connection):
+    """Write buffered LRU bumps and hit/miss counts (callers hold _conn_lock).
 
+    Best-effort: if the database is busy they stay buffered for next time.
+    """
+    global _last_flush
+    _last_flush = time.time()
+    if not _pending_access and not _pending_counts:
+        return
     try:
-        with open(cache_path, 'w') as f:
-            json.dump(data, f)
-    except OSError:
-        pass  # Silently fail on cache write errors
+        with conn:
+            conn.executemany(
+                "UPDATE entries SET last_access = MAX(last_access, ?) WHERE key = ?",
+                [(at, key) for key, at in _pending_access.items()],
+            )
+            conn.executemany(
+                "UPDATE stats SET value = value + ? WHERE name = ?",
+                [(n, name) for name, n in _pending_counts.items()],
+            )
+    except sqlite3.Error:
+        return
+    _pending_access.clear()
+    _pending_counts.clear()
+
+
+def _evict(conn: sqlite3.Connection, max_bytes: int, now: float):
+    """Trim entries to max_bytes: expired entries first, then LRU order."""
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    if total <= max_bytes:
+        return
+
+    evicted = conn.execute("DELETE FROM entries WHERE expires_at < ?", (now,)).rowcount
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    if total > max_bytes:
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            if total <= max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        evicted += len(victims)
+
+    conn.execute("UPDATE stats SET value = value + ? WHERE name = 'evictions'", (evicted,))
+
+
+def purge_expired() -> int:
+    """Delete every expired entry. Returns the number removed."""
+    try:
+        with _conn_lock:
+            conn = _get_conn()
+            with conn:
+                return conn.execute(
+                    "DELETE FROM entries WHERE expires_at < ?", (time.time(),)
+                ).rowcount
+    except sqlite3.Error:
+        return 0
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Get entry count, total bytes and hit/miss/eviction counters."""
+    try:
+        with _conn_lock:
+            conn = _get_conn()
+            _flush_access(conn)
+            entries, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+    except sqlite3.Error:
+        return {}
+    return {
+        "entries": entries,
+        "bytes": total,
+        "max_bytes": CACHE_MAX_BYTES,
+        "hits": counters.get("hits", 0),
+        "misses": counters.get("misses", 0),
+        "evictions": counters.get("evictions", 0),
+    }
 
 
 def clear_cache():
-    """Clear all cache files."""
+    """Clear all cached results (and any legacy cache files)."""
+    try:
+        with _conn_lock:
+            conn = _get_conn()
+            with conn:
+                conn.execute("DELETE FROM entries")
+    except sqlite3.Error:
+        pass
     if CACHE_DIR.exists():
         for f in CACHE_DIR.glob("*.json"):
             try:
@@ -0,0 +1,177 @@
+"""Adaptive concurrency control for last30days skill.
+
+An AdaptiveLimit caps how many calls to one provider run at once and tunes
+that cap AIMD-style: each healthy call raises it additively (by about one
+slot per round of calls), while a rate limit (429), a server error (5xx)
+or latency well above the observed baseline cuts it multiplicatively. A
+Retry-After from the provider pauses new calls until it has passed.
+
+Worker pools are sized for the limit's maximum. Workers block in the
+limiter, so the effective parallelism is whatever the provider currently
+tolerates.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from . import deadline
+
+# HTTP statuses that mean "slow down"
+OVERLOAD_STATUSES = (429, 500, 502, 503, 504)
+
+# Pause after an overload signal that came without a Retry-After
+DEFAULT_COOLDOWN = 1.0
+
+# Floor for the latency baseline, so near-instant calls (cache hits, mocks)
+# do not make every ordinary call look slow
+MIN_BASELINE = 0.05
+
+# Longest single wait in acquire() before re-checking the run deadline
+_POLL_INTERVAL = 0.25
+
+
+def overload_delay(error: BaseException) -> Optional[float]:
+    """Classify an exception from a provider call.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        Seconds to pause (the Retry-After, or 0 if none was given) if the
+        error means the provider is overloaded, else None
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if getattr(error, "status_code", None) in OVERLOAD_STATUSES or retry_after is not None:
+        return retry_after or 0.0
+    return None
+
+
+class AdaptiveLimit:
+    """AIMD concurrency limit shared by the workers calling one provider."""
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 16,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_factor: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            initial: Starting number of concurrent calls
+            minimum: Never go below this many
+            maximum: Never go above this many (size worker pools to it)
+            increase: Slots added per round of healthy calls
+            decrease: Factor applied to the limit on an overload signal
+            latency_factor: A call slower than this multiple of the baseline
+                latency counts as an overload signal
+            clock: Monotonic clock (for tests)
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._last_decrease = float("-inf")
+        self._baseline: Optional[float] = None
+        self._samples = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """Wait for a free slot (and for any Retry-After pause to pass).
+
+        Returns:
+            Start time, to pass back to release()
+
+        Raises:
+            deadline.DeadlineExceeded: If the run deadline (or the calling
+                task's deadline) passes while waiting
+        """
+        task_deadline = deadline.current()
+        with self._cond:
+            while True:
+                task_deadline.check("waiting for a concurrency slot")
+                wait = self._resume_at - self._clock()
+                if wait <= 0 and self._in_flight < int(self.limit):
+                    self._in_flight += 1
+                    return self._clock()
+                self._cond.wait(min(wait, _POLL_INTERVAL) if wait > 0 else _POLL_INTERVAL)
+
+    def release(self, started: float, overload: Optional[float] = None):
+        """Return a slot and adjust the limit from the call's outcome.
+
+        Args:
+            started: Value returned by acquire()
+            overload: None for a call the provider handled (success or an
+                ordinary failure); otherwise the pause the provider asked
+                for, in seconds (0 if it gave none)
+        """
+        now = self._clock()
+        latency = now - started
+        with self._cond:
+            self._in_flight -= 1
+            if overload is not None:
+                self._resume_at = max(self._resume_at, now + (overload or DEFAULT_COOLDOWN))
+                self._back_off(started, now)
+            elif self._is_slow(latency):
+                self._back_off(started, now)
+                self._record_latency(latency)
+            else:
+                self._record_latency(latency)
+                self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+            self._cond.notify_all()
+
+    def run(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        classify: Callable[[BaseException], Optional[float]] = overload_delay,
+    ) -> Any:
+        """Call fn(*args) in a slot, feeding its outcome back into the limit.
+
+        Args:
+            fn: The provider call
+            *args: Its arguments
+            classify: Maps an exception to a pause (see overload_delay)
+
+        Returns:
+            Whatever fn returns (exceptions propagate)
+        """
+        started = self.acquire()
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            self.release(started, classify(e) if isinstance(e, Exception) else None)
+            raise
+        self.release(started)
+        return result
+
+    def _back_off(self, started: float, now: float):
+        # Calls already in flight when the limit was last cut report the
+        # same congestion; only cut once per round
+        if started < self._last_decrease:
+            return
+        self.limit = max(float(self.minimum), self.limit * self.decrease)
+        self._last_decrease = now
+
+    def _is_slow(self, latency: float) -> bool:
+        return self._samples >= 3 and latency > max(self._baseline, MIN_BASELINE) * self.latency_factor
+
+    def _record_latency(self, latency: float):
+        self._samples += 1
+        if self._baseline is None:
+            self._baseline = latency
+        else:
+            self._baseline += 0.2 * (latency - self._baseline)
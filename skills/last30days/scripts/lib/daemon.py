@@ -0,0 +1,314 @@
+"""Persistent server mode for last30days skill (stdlib only).
+
+`last30days.py serve` keeps one process alive behind a Unix socket, so
+config, model selection, tool probes, the HTTP keep-alive pool and the
+SQLite connections stay warm between queries. Each request runs the normal
+CLI on one of a fixed set of worker threads; whatever that thread writes to
+stdout/stderr is streamed back to the client as it is written.
+
+Wire format: the client sends one JSON line {"argv": [...]}. The server
+replies with JSON lines {"stdout": text} / {"stderr": text} and a final
+{"exit": code}.
+
+Only argv is forwarded: a request runs with the server's environment (API
+keys, LAST30DAYS_* overrides such as the cache and output directories), not
+the client's.
+
+This module only imports the standard library (and the stdlib-only cache
+module) so the thin client starts fast.
+"""
+
+import contextvars
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, TextIO
+
+from . import cache
+
+DEFAULT_WORKERS = 4
+CONNECT_TIMEOUT = 1.0
+
+
+def _log(msg: str):
+    """Log daemon message to stderr."""
+    sys.stderr.write(f"[serve] {msg}\n")
+    sys.stderr.flush()
+
+
+def socket_path() -> Path:
+    """Default socket location (LAST30DAYS_SOCKET overrides it).
+
+    Lives in the cache directory, including its sandbox fallback, so the
+    server and its clients agree on it.
+    """
+    override = os.environ.get("LAST30DAYS_SOCKET")
+    if override:
+        return Path(override)
+    cache.ensure_cache_dir()
+    return cache.CACHE_DIR / "serve.sock"
+
+
+def is_supported() -> bool:
+    """Whether this platform has Unix sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+_local = threading.local()
+
+
+class _Sink:
+    """Line-buffered writer that frames one request's output onto its socket."""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self.lock = threading.Lock()
+        self.closed = False
+        self.pending = {"stdout": "", "stderr": ""}
+
+    def send(self, frame: dict):
+        if self.closed:
+            return
+        try:
+            self.wfile.write(json.dumps(frame).encode("utf-8") + b"\n")
+            self.wfile.flush()
+        except OSError:
+            # Client went away; let the request finish quietly
+            self.closed = True
+
+    def write(self, stream: str, text: str):
+        with self.lock:
+            buffered = self.pending[stream] + text
+            head, sep, tail = buffered.rpartition("\n")
+            self.pending[stream] = tail
+            if sep:
+                self.send({stream: head + sep})
+
+    def flush(self, stream: Optional[str] = None):
+        with self.lock:
+            for name in (stream,) if stream else tuple(self.pending):
+                if self.pending[name]:
+                    self.send({name: self.pending[name]})
+                    self.pending[name] = ""
+
+
+class _ThreadRouter(io.TextIOBase):
+    """Stands in for sys.stdout/sys.stderr while serving.
+
+    Writes from a thread that is handling a request go to that request's
+    client; everything else (including helper threads the request starts)
+    goes to the daemon's own stream.
+    """
+
+    def __init__(self, name: str, fallback: TextIO):
+        self.name = name
+        self.fallback = fallback
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        sink = getattr(_local, "sink", None)
+        if sink is None:
+            return self.fallback.write(text)
+        sink.write(self.name, text)
+        return len(text)
+
+    def flush(self):
+        sink = getattr(_local, "sink", None)
+        if sink is None:
+            self.fallback.flush()
+        else:
+            sink.flush(self.name)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            argv = json.loads(line)["argv"]
+            if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+                raise ValueError("argv must be a list of strings")
+        except (ValueError, KeyError, TypeError) as e:
+            self.wfile.write(json.dumps({"stderr": f"Bad request: {e}\n", "exit": 2}).encode() + b"\n")
+            return
+
+        sink = _Sink(self.wfile)
+        _local.sink = sink
+        code = 0
+        try:
+            # A fresh context per request: context variables a run sets
+            # (its deadline, --debug) don't carry over to the next request
+            # on this worker thread
+            contextvars.copy_context().run(self.server.run, argv)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                sink.write("stderr", f"{e.code}\n")
+                code = 1
+        except Exception as e:
+            sink.write("stderr", f"Error: {type(e).__name__}: {e}\n")
+            code = 1
+        finally:
+            _local.sink = None
+        sink.flush()
+        sink.send({"exit": code})
+
+
+class Server(socketserver.UnixStreamServer):
+    """Unix socket server that runs requests on a fixed pool of threads.
+
+    Worker threads are reused, so per-thread state such as the store's
+    SQLite connection survives from one request to the next.
+    """
+
+    def __init__(self, path: Path, run: Callable[[List[str]], None], workers: int = DEFAULT_WORKERS):
+        self.run = run
+        self.workers = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="serve")
+        super().__init__(str(path), _RequestHandler)
+
+    def process_request(self, request, client_address):
+        self.workers.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.workers.shutdown(wait=False, cancel_futures=True)
+
+
+def _claim_socket(path: Path):
+    """Remove a stale socket file; refuse if a daemon is already listening."""
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(CONNECT_TIMEOUT)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A last30days server is already listening on {path}")
+
+
+def serve(run: Callable[[List[str]], None], path: Optional[Path] = None, workers: int = DEFAULT_WORKERS):
+    """Serve CLI requests on a Unix socket until interrupted.
+
+    Args:
+        run: Called with each request's argv on a worker thread; its
+            stdout/stderr output is streamed to the client and SystemExit
+            becomes the exit code
+        path: Socket path (default: socket_path())
+        workers: Requests handled concurrently
+    """
+    if not is_supported():
+        raise RuntimeError("last30days serve needs Unix domain sockets")
+    path = path or socket_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        raise RuntimeError(f"Cannot create socket directory {path.parent}: {e}") from e
+    _claim_socket(path)
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, _stop)
+
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    server = Server(path, run, workers)
+    os.chmod(path, 0o600)
+    sys.stdout = _ThreadRouter("stdout", real_stdout)
+    sys.stderr = _ThreadRouter("stderr", real_stderr)
+    _log(f"Listening on {path} ({workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+        server.server_close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        _log("Stopped")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def request(
+    argv: List[str],
+    path: Optional[Path] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """Run a CLI invocation on the server, streaming its output.
+
+    Args:
+        argv: Arguments as they would be passed to last30days.py
+        path: Socket path (default: socket_path())
+        stdout: Where to write the request's stdout (default: sys.stdout)
+        stderr: Where to write the request's stderr (default: sys.stderr)
+
+    Returns:
+        The exit code, or None if no server is listening
+    """
+    if not is_supported():
+        return None
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path or socket_path()))
+    except OSError:
+        sock.close()
+        return None
+
+    # Research can take minutes; only the connect is time-bounded
+    sock.settimeout(None)
+    with sock, sock.makefile("rwb") as f:
+        f.write(json.dumps({"argv": argv}).encode("utf-8") + b"\n")
+        f.flush()
+        for line in f:
+            frame = json.loads(line)
+            if "stdout" in frame:
+                stdout.write(frame["stdout"])
+                stdout.flush()
+            if "stderr" in frame:
+                stderr.write(frame["stderr"])
+                stderr.flush()
+            if "exit" in frame:
+                return frame["exit"]
+    stderr.write("last30days server closed the connection\n")
+    return 1
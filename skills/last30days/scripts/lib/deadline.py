@@ -0,0 +1,192 @@
+"""Cooperative run deadlines for last30days skill.
+
+A Deadline is created once per research run (--deadline) and made current
+with `active()`. Code that waits — HTTP attempts and retry sleeps, future
+results, subprocess calls — caps its own timeout with `current().cap()`, so
+when time runs out outstanding work fails fast and the caller can still
+process and render whatever already arrived. Sources whose work was
+interrupted are recorded with `mark()`.
+
+The current deadline lives in a context variable. Pools created with this
+module's ThreadPoolExecutor run each task in a copy of the submitter's
+context under a child deadline, so worker threads see the same deadline,
+and a task whose future is given up on can be told to stop with
+`abandon()`.
+"""
+
+import concurrent.futures
+import contextvars
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """Work was refused because the run's deadline has passed."""
+
+
+class Deadline:
+    """A point in time after which a run stops starting new work.
+
+    A child deadline (see child()) ends no later than its parent, is
+    cancelled with it, and records cut-short sources on the root.
+    """
+
+    def __init__(
+        self,
+        seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        parent: Optional["Deadline"] = None,
+    ):
+        self.seconds = seconds
+        self.parent = parent
+        self._clock = clock
+        self.expires_at = None if seconds is None else clock() + seconds
+        self._cancelled = threading.Event()
+        self._children: "weakref.WeakSet[Deadline]" = weakref.WeakSet()
+        self._cut_short: List[str] = []
+        self._lock = threading.Lock()
+        if parent is not None:
+            with parent._lock:
+                parent._children.add(self)
+            if parent._cancelled.is_set():
+                self._cancelled.set()
+
+    def child(self, seconds: Optional[float] = None) -> "Deadline":
+        """A deadline that also ends after `seconds` and can be cancelled alone."""
+        return Deadline(seconds, self._clock, parent=self)
+
+    def remaining(self) -> float:
+        """Seconds left (inf without a deadline, 0 once expired or cancelled)."""
+        if self._cancelled.is_set():
+            return 0.0
+        left = float("inf") if self.expires_at is None else max(0.0, self.expires_at - self._clock())
+        if self.parent is not None:
+            left = min(left, self.parent.remaining())
+        return left
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def cancel(self):
+        """Expire now (children too), waking anything blocked in sleep()."""
+        self._cancelled.set()
+        with self._lock:
+            children = list(self._children)
+        for child in children:
+            child.cancel()
+
+    def cap(self, timeout: Optional[float]) -> Optional[float]:
+        """Shorten a timeout to the time left (None means no timeout)."""
+        left = self.remaining()
+        if left == float("inf"):
+            return timeout
+        return left if timeout is None else min(timeout, left)
+
+    def check(self, what: str = "work"):
+        """Raise DeadlineExceeded if the deadline has passed."""
+        if self.expired():
+            raise DeadlineExceeded(f"Deadline reached before {what}")
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleep, unless that would run past the deadline.
+
+        Returns:
+            True after a full sleep; False at once if the deadline would be
+            reached first, or as soon as the deadline is cancelled
+        """
+        if seconds >= self.remaining():
+            return False
+        return not self._cancelled.wait(seconds)
+
+    def mark(self, source: str):
+        """Record that a source's work was cut short by the deadline."""
+        if self.parent is not None:
+            self.parent.mark(source)
+            return
+        with self._lock:
+            if source not in self._cut_short:
+                self._cut_short.append(source)
+
+    @property
+    def cut_short(self) -> List[str]:
+        """Sources marked cut short, in the order they were marked."""
+        if self.parent is not None:
+            return self.parent.cut_short
+        with self._lock:
+            return list(self._cut_short)
+
+    def describe(self) -> str:
+        """Short reason used in source error messages."""
+        if self.parent is not None:
+            return self.parent.describe()
+        if self.seconds is None:
+            return "Cut short: run cancelled"
+        return f"Cut short by --deadline ({self.seconds:g}s)"
+
+
+NO_DEADLINE = Deadline()
+_current: contextvars.ContextVar = contextvars.ContextVar("last30days_deadline", default=NO_DEADLINE)
+
+
+def current() -> Deadline:
+    """The deadline of the run in progress (one that never expires if none)."""
+    return _current.get()
+
+
+@contextmanager
+def active(deadline: Deadline) -> Iterator[Deadline]:
+    """Make `deadline` current for the duration of the block."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def abandon(future: concurrent.futures.Future):
+    """Give up on a future: cancel it if queued, else cancel its deadline.
+
+    A running task submitted through this module's ThreadPoolExecutor then
+    stops at its next deadline check (an HTTP attempt or retry wait),
+    freeing the worker thread instead of retrying for a caller that left.
+    """
+    if future.cancel():
+        return
+    task_deadline = getattr(future, "deadline", None)
+    if task_deadline is not None:
+        task_deadline.cancel()
+
+
+class ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
+    """ThreadPoolExecutor whose tasks see the submitter's current deadline.
+
+    Each task runs under its own child of that deadline (future.deadline),
+    so it can be abandoned on its own. Leaving a `with` block after the
+    deadline has passed abandons unfinished tasks instead of waiting.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._futures: "weakref.WeakSet[concurrent.futures.Future]" = weakref.WeakSet()
+
+    def submit(self, fn, /, *args, **kwargs):
+        task_deadline = current().child()
+        context = contextvars.copy_context()
+        context.run(_current.set, task_deadline)
+        future = super().submit(context.run, fn, *args, **kwargs)
+        future.deadline = task_deadline
+        self._futures.add(future)
+        return future
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if current().expired():
+            for future in list(self._futures):
+                if not future.done():
+                    abandon(future)
+            self.shutdown(wait=False, cancel_futures=True)
+        else:
+            self.shutdown(wait=True)
+        return False
@@ -1,10 +1,42 @@
-"""Near-duplicate detection for last30days skill."""
+"""Near-duplicate detection for last30days skill.
 
+Items are deduped within each source first; cluster_cross_source then
+merges the same story seen on several platforms into one item.
+
+Small lists are compared pair by pair. Larger lists go through a MinHash +
+LSH banding index that only proposes likely pairs; every candidate is then
+checked with the exact trigram Jaccard similarity, so the threshold means
+the same thing either way.
+"""
+
+import hashlib
+import random
 import re
-from typing import List, Set, Tuple, Union
+from typing import Dict, Hashable, List, Optional, Set, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 from . import schema
 
+# MinHash signature length; LSH splits it into bands of rows
+NUM_PERM = 64
+# Below this many items the exact pairwise loop is cheaper than hashing
+# (crossover is around 400 items, see tests/bench_dedupe.py)
+LSH_MIN_ITEMS = 400
+# Required chance that a pair sitting exactly at the threshold is proposed
+LSH_RECALL = 0.98
+
+
+def _perm_masks(count: int, seed: int = 30) -> List[int]:
+    """XOR masks that turn one 64-bit hash into `count` different orderings.
+
+    The seed is fixed so signatures (and results) are the same on every run.
+    """
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+_PERM_MASKS = _perm_masks(NUM_PERM)
+
 
 def normalize_text(text: str) -> str:
     """Normalize text for comparison.
@@ -32,20 +64,132 @@ def jaccard_similarity(set1: Set[str], set2: Set[str]) -> float:
     if not set1 or not set2:
         return 0.0
     intersection = len(set1 & set2)
-    union = len(set1 | set2)
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, without building the union set
+    union = len(set1) + len(set2) - intersection
     return intersection / union if union > 0 else 0.0
 
 
-def get_item_text(item: Union[schema.RedditItem, schema.XItem, schema.YouTubeItem]) -> str:
+def get_item_text(item: Union[schema.RedditItem, schema.XItem, schema.YouTubeItem, schema.WebSearchItem]) -> str:
     """Get comparable text from an item."""
     if isinstance(item, schema.RedditItem):
         return item.title
     elif isinstance(item, schema.YouTubeItem):
         return f"{item.title} {item.channel_name}"
+    elif isinstance(item, schema.WebSearchItem):
+        return item.title
     else:
         return item.text
 
 
+def minhash_signature(
+    ngrams: Set[str],
+    hash_cache: Optional[Dict[str, int]] = None,
+) -> Tuple[int, ...]:
+    """Compute the MinHash signature of a set of n-grams.
+
+    Args:
+        ngrams: N-gram set (from get_ngrams)
+        hash_cache: Optional dict reused across calls to memoize n-gram hashes
+
+    Returns:
+        Tuple of NUM_PERM minimum hash values
+    """
+    if hash_cache is None:
+        hash_cache = {}
+    hashes = []
+    for gram in ngrams:
+        h = hash_cache.get(gram)
+        if h is None:
+            h = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big")
+            hash_cache[gram] = h
+        hashes.append(h)
+    if not hashes:
+        return ()
+    return tuple(min(map(mask.__xor__, hashes)) for mask in _PERM_MASKS)
+
+
+def lsh_params(threshold: float, num_perm: int = NUM_PERM) -> Tuple[int, int]:
+    """Pick (bands, rows) for a similarity threshold.
+
+    Uses the most rows per band (fewest spurious candidates) that still
+    proposes a pair at exactly `threshold` with probability >= LSH_RECALL.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        recall = 1 - (1 - threshold ** rows) ** bands
+        if recall < LSH_RECALL:
+            break
+        best = (bands, rows)
+    return best
+
+
+class LSHIndex:
+    """Banded LSH index over MinHash signatures.
+
+    Keys whose signatures agree on every row of at least one band become
+    candidates; callers verify candidates with the exact similarity.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = NUM_PERM):
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [{} for _ in range(self.bands)]
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for b in range(self.bands):
+            yield b, signature[b * self.rows:(b + 1) * self.rows]
+
+    def query(self, signature: Tuple[int, ...]) -> Set[Hashable]:
+        """Keys sharing at least one band with signature."""
+        found = set()
+        if not signature:
+            return found
+        for b, band in self._band_keys(signature):
+            found.update(self._buckets[b].get(band, ()))
+        return found
+
+    def add(self, key: Hashable, signature: Tuple[int, ...]):
+        """Index a signature under key."""
+        if not signature:
+            return
+        for b, band in self._band_keys(signature):
+            self._buckets[b].setdefault(band, []).append(key)
+
+
+def find_duplicates_exact(
+    ngrams: List[Set[str]],
+    threshold: float = 0.7,
+) -> List[Tuple[int, int]]:
+    """Compare every pair of n-gram sets. Returns (i, j) pairs with i < j."""
+    duplicates = []
+    for i in range(len(ngrams)):
+        for j in range(i + 1, len(ngrams)):
+            if jaccard_similarity(ngrams[i], ngrams[j]) >= threshold:
+                duplicates.append((i, j))
+    return duplicates
+
+
+def find_duplicates_lsh(
+    ngrams: List[Set[str]],
+    threshold: float = 0.7,
+) -> List[Tuple[int, int]]:
+    """Find similar pairs via MinHash/LSH candidates plus exact verification.
+
+    Returns (i, j) pairs with i < j, in the same order as the exact loop.
+    """
+    index = LSHIndex(threshold)
+    hash_cache: Dict[str, int] = {}
+    duplicates = []
+    for j, grams in enumerate(ngrams):
+        signature = minhash_signature(grams, hash_cache)
+        for i in index.query(signature):
+            if jaccard_similarity(ngrams[i], grams) >= threshold:
+                duplicates.append((i, j))
+        index.add(j, signature)
+    duplicates.sort()
+    return duplicates
+
+
 def find_duplicates(
     items: List[Union[schema.RedditItem, schema.XItem]],
     threshold: float = 0.7,
@@ -59,18 +203,12 @@ def find_duplicates(
     Returns:
         List of (i, j) index pairs where i < j and items are similar
     """
-    duplicates = []
-
     # Pre-compute n-grams
     ngrams = [get_ngrams(get_item_text(item)) for item in items]
 
-    for i in range(len(items)):
-        for j in range(i + 1, len(items)):
-            similarity = jaccard_similarity(ngrams[i], ngrams[j])
-            if similarity >= threshold:
-                duplicates.append((i, j))
-
-    return duplicates
+    if len(items) < LSH_MIN_ITEMS:
+        return find_duplicates_exact(ngrams, threshold)
+    return find_duplicates_lsh(ngrams, threshold)
 
 
 def dedupe_items(
@@ -128,3 +266,206 @@ def dedupe_youtube(
 ) -> List[schema.YouTubeItem]:
     """Dedupe YouTube items."""
     return dedupe_items(items, threshold)
+
+
+# ---------------------------------------------------------------------------
+# Cross-source clustering
+# ---------------------------------------------------------------------------
+
+# Query parameters that only track where a click came from, on any site
+# (plus every utm_* parameter)
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid"}
+# Share/tracking parameters that are only noise on one platform; elsewhere
+# names like `s` or `t` can select the page
+HOST_TRACKING_PARAMS = {
+    "x.com": {"s", "t", "ref_src", "ref_url"},
+    "youtube.com": {"si", "feature"},
+}
+HOST_ALIASES = {"twitter.com": "x.com", "youtu.be": "youtube.com"}
+HOST_PREFIXES = ("www.", "m.", "mobile.", "old.", "new.")
+
+_REDDIT_POST = re.compile(r"^/r/[^/]+/comments/([a-z0-9]+)")
+_X_STATUS = re.compile(r"^/[^/]+/status(?:es)?/(\d+)")
+
+
+def canonical_url(url: str) -> str:
+    """Reduce a URL to a key shared by every link to the same page.
+
+    Drops scheme, www./m./old. prefixes, fragments, tracking parameters and
+    trailing slashes, and folds platform aliases (twitter.com, youtu.be,
+    YouTube shorts, Reddit slugs) onto one form.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    host = HOST_ALIASES.get(host, host)
+    path = parts.path.rstrip("/")
+    query = parse_qsl(parts.query)
+
+    if host == "youtube.com":
+        video_id = dict(query).get("v")
+        if parts.hostname and parts.hostname.lower().endswith("youtu.be"):
+            video_id = path.lstrip("/")
+        elif path.startswith("/shorts/"):
+            video_id = path[len("/shorts/"):]
+        if video_id:
+            return f"youtube.com/watch?v={video_id}"
+    elif host == "reddit.com":
+        match = _REDDIT_POST.match(path.lower())
+        if match:
+            return f"reddit.com/comments/{match.group(1)}"
+    elif host == "x.com":
+        match = _X_STATUS.match(path)
+        if match:
+            return f"x.com/status/{match.group(1)}"
+
+    host_params = HOST_TRACKING_PARAMS.get(host, set())
+    query = sorted(
+        (k, v) for k, v in query
+        if k.lower() not in TRACKING_PARAMS and k.lower() not in host_params
+        and not k.lower().startswith("utm_")
+    )
+    key = f"{host}{path}"
+    if query:
+        key += "?" + urlencode(query)
+    return key
+
+
+def cluster_items(items: List, threshold: float = 0.7) -> List[List[int]]:
+    """Group items that share a canonical URL or have near-duplicate text.
+
+    Args:
+        items: Scored items from any mix of sources
+        threshold: Text similarity threshold (0-1)
+
+    Returns:
+        Clusters as lists of indices into items, each in input order;
+        clusters are ordered by their first member
+    """
+    parent = list(range(len(items)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int):
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    first_by_url: Dict[str, int] = {}
+    for i, item in enumerate(items):
+        key = canonical_url(item.url)
+        if not key:
+            continue
+        if key in first_by_url:
+            union(first_by_url[key], i)
+        else:
+            first_by_url[key] = i
+
+    for i, j in find_duplicates(items, threshold):
+        union(i, j)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(items)):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
+
+
+def _source_name(item) -> str:
+    if isinstance(item, schema.RedditItem):
+        return "reddit"
+    if isinstance(item, schema.XItem):
+        return "x"
+    if isinstance(item, schema.YouTubeItem):
+        return "youtube"
+    return "web"
+
+
+def to_sighting(item) -> schema.Sighting:
+    """Describe an item as a sighting of a cluster."""
+    if isinstance(item, schema.RedditItem):
+        label, title = f"r/{item.subreddit}", item.title
+    elif isinstance(item, schema.XItem):
+        label, title = f"@{item.author_handle}", item.text[:100]
+    elif isinstance(item, schema.YouTubeItem):
+        label, title = item.channel_name, item.title
+    else:
+        label, title = item.source_domain, item.title
+    return schema.Sighting(
+        source=_source_name(item),
+        url=item.url,
+        label=label,
+        title=title,
+        date=item.date,
+        engagement=getattr(item, "engagement", None),
+    )
+
+
+def merge_engagement(engagements: List[Optional[schema.Engagement]]) -> Optional[schema.Engagement]:
+    """Sum engagement counts across sightings.
+
+    upvote_ratio is a ratio, not a count, so the first one seen is kept.
+    """
+    present = [e for e in engagements if e is not None]
+    if not present:
+        return None
+    merged = schema.Engagement()
+    for name in ("score", "num_comments", "likes", "reposts", "replies", "quotes", "views"):
+        values = [getattr(e, name) for e in present if getattr(e, name) is not None]
+        if values:
+            setattr(merged, name, sum(values))
+    merged.upvote_ratio = next((e.upvote_ratio for e in present if e.upvote_ratio is not None), None)
+    return merged
+
+
+def cluster_cross_source(
+    reddit: List[schema.RedditItem],
+    x: List[schema.XItem],
+    youtube: List[schema.YouTubeItem],
+    web: List[schema.WebSearchItem],
+    threshold: float = 0.7,
+) -> Tuple[List[schema.RedditItem], List[schema.XItem], List[schema.YouTubeItem], List[schema.WebSearchItem]]:
+    """Merge the same story seen on several platforms into one item.
+
+    Each cluster is represented by its best-scored item that carries
+    engagement (web items only represent web-only clusters). The others are
+    dropped from their source lists and recorded on the representative as
+    sightings, and the representative's engagement becomes the sum over
+    the whole cluster.
+
+    Returns:
+        (reddit, x, youtube, web) with clustered duplicates removed
+    """
+    items = list(reddit) + list(x) + list(youtube) + list(web)
+    dropped = set()
+    for cluster in cluster_items(items, threshold):
+        if len(cluster) < 2:
+            continue
+        members = [items[i] for i in cluster]
+        rep_idx = min(
+            cluster,
+            key=lambda i: (isinstance(items[i], schema.WebSearchItem), -items[i].score),
+        )
+        rep = items[rep_idx]
+        others = [items[i] for i in cluster if i != rep_idx]
+        rep.sightings = rep.sightings + [to_sighting(item) for item in others]
+        for item in others:
+            rep.sightings.extend(item.sightings)
+        if not isinstance(rep, schema.WebSearchItem):
+            rep.engagement = merge_engagement(
+                [getattr(item, "engagement", None) for item in members]
+            )
+        dropped.update(id(item) for item in others)
+
+    def keep(source_items):
+        return [item for item in source_items if id(item) not in dropped]
+
+    return keep(reddit), keep(x), keep(youtube), keep(web)
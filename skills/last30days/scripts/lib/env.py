@@ -21,12 +21,21 @@ else:
     CONFIG_FILE = CONFIG_DIR / ".env"
 
 
+# Parsed .env files keyed by path, reused while the file's mtime is unchanged
+_env_file_cache: Dict[Path, tuple] = {}
+
+
 def load_env_file(path: Path) -> Dict[str, str]:
     """Load environment variables from a file."""
-    env = {}
-    if not path.exists():
-        return env
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    cached = _env_file_cache.get(path)
+    if cached and cached[0] == mtime:
+        return dict(cached[1])
 
+    env = {}
     with open(path, 'r') as f:
         for line in f:
             line = line.strip()
@@ -41,7 +50,8 @@ def load_env_file(path: Path) -> Dict[str, str]:
                     value = value[1:-1]
                 if key and value:
                     env[key] = value
-    return env
+    _env_file_cache[path] = (mtime, env)
+    return dict(env)
 
 
 def get_config() -> Dict[str, Any]:
@@ -1,34 +1,243 @@
-"""HTTP utilities for last30days skill (stdlib only)."""
+"""HTTP utilities for last30days skill (stdlib only).
 
+Requests go through a small keep-alive connection pool (one idle list of
+http.client connections per scheme/host/port, shared by all threads), so
+repeated calls to the same API skip the TCP and TLS handshakes. When an
+HTTP(S) proxy is configured in the environment, requests fall back to
+urllib, which knows how to tunnel through it.
+"""
+
+import contextvars
+import hashlib
+import http.client
 import json
 import os
+import random
 import sys
-import time
+import threading
 import urllib.error
 import urllib.request
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from . import deadline, ratelimit, singleflight
 
 DEFAULT_TIMEOUT = 30
 DEBUG = os.environ.get("LAST30DAYS_DEBUG", "").lower() in ("1", "true", "yes")
 
+# --debug for one run only (a daemon request shares the process with others)
+_debug: contextvars.ContextVar = contextvars.ContextVar("last30days_debug", default=False)
+
+
+def enable_debug():
+    """Turn on debug logging for the current context (one run and the tasks it starts)."""
+    _debug.set(True)
+
+
+def debug_enabled() -> bool:
+    """Whether debug logging is on, process-wide (LAST30DAYS_DEBUG) or for this run."""
+    return DEBUG or _debug.get()
+
 
 def log(msg: str):
     """Log debug message to stderr."""
-    if DEBUG:
+    if debug_enabled():
         sys.stderr.write(f"[DEBUG] {msg}\n")
         sys.stderr.flush()
 MAX_RETRIES = 5
 RETRY_DELAY = 2.0
+# A request's attempts and retry waits together get at most this many
+# timeouts' worth of wall time, so a flaky endpoint cannot hold a worker for
+# minutes after its caller has given up on it
+REQUEST_BUDGET_TIMEOUTS = 2
 USER_AGENT = "last30days-skill/2.1 (Assistant Skill)"
+MAX_REDIRECTS = 5
+MAX_IDLE_PER_HOST = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
 
 
 class HTTPError(Exception):
     """HTTP request error with status code."""
-    def __init__(self, message: str, status_code: Optional[int] = None, body: Optional[str] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        body: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.body = body
+        self.retry_after = retry_after
+
+
+class ConnectionPool:
+    """Thread-safe pool of idle keep-alive connections keyed by (scheme, host, port)."""
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Tuple[str, str, int], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Check out a connection. Returns (conn, reused)."""
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            try:
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            except OSError:
+                conn.close()
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection):
+        """Return a connection whose response has been fully read."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close_all(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_pool = ConnectionPool()
+
+
+def close_connections():
+    """Close all pooled keep-alive connections."""
+    _pool.close_all()
+
+
+# Errors from a reused keep-alive connection the server had already closed,
+# raised before any response bytes arrive
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+def _send_pooled(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: float,
+) -> Tuple[int, Any, bytes]:
+    """Send one request over a pooled connection. Returns (status, headers, body).
+
+    A reused connection the server has already closed fails on first use,
+    before any response arrives; that case is retried on a fresh connection.
+    Anything else (a read timeout, a broken response) propagates, since the
+    server may already have acted on the request.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        raise urllib.error.URLError(f"unsupported URL scheme: {scheme}")
+    key = (scheme, parts.hostname or "", parts.port or (443 if scheme == "https" else 80))
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+
+    while True:
+        conn, reused = _pool.acquire(key, timeout)
+        try:
+            conn.request(method, target, body=data, headers=headers)
+            response = conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if reused:
+                log(f"Stale keep-alive connection to {key[1]}, reconnecting")
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        try:
+            body = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            _pool.release(key, conn)
+        return response.status, response.headers, body
+
+
+def _send_urllib(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: float,
+) -> Tuple[int, Any, bytes]:
+    """Send one request via urllib (proxy-aware). Returns (status, headers, body)."""
+    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        try:
+            body = e.read()
+        except Exception:
+            body = b""
+        return e.code, e.headers, body
+
+
+def _send(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: float,
+) -> Tuple[int, Any, bytes]:
+    """Send one request, following redirects. Returns (status, headers, body).
+
+    Raises:
+        OSError / http.client.HTTPException on connection-level failures
+    """
+    if urllib.request.getproxies().get(urlsplit(url).scheme.lower()):
+        return _send_urllib(method, url, headers, data, timeout)
+
+    for _ in range(MAX_REDIRECTS + 1):
+        status, resp_headers, body = _send_pooled(method, url, headers, data, timeout)
+        location = resp_headers.get("Location") if status in REDIRECT_CODES else None
+        if not location:
+            return status, resp_headers, body
+        url = urljoin(url, location)
+        if status == 303 or (status in (301, 302) and method == "POST"):
+            method, data = "GET", None
+        log(f"Redirect {status} -> {url}")
+    return status, resp_headers, body
+
+
+def _retry_after(headers) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds form), if present."""
+    value = headers.get("Retry-After") if headers else None
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+def _backoff(attempt: int) -> float:
+    """Jittered exponential backoff: uniform in [d/2, d], d = RETRY_DELAY * 2**attempt."""
+    delay = RETRY_DELAY * (2 ** attempt)
+    return random.uniform(delay / 2, delay)
 
 
 def request(
@@ -38,6 +247,8 @@ def request(
     json_data: Optional[Dict[str, Any]] = None,
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = MAX_RETRIES,
+    budget: Optional[float] = None,
+    decode: Optional[Callable[[str], Any]] = None,
 ) -> Dict[str, Any]:
     """Make an HTTP request and return JSON response.
 
@@ -48,13 +259,53 @@ def request(
         json_data: Optional JSON body (for POST)
         timeout: Request timeout in seconds
         retries: Number of retries on failure
+        budget: Wall-clock seconds for all attempts and retry waits
+            (default: REQUEST_BUDGET_TIMEOUTS * timeout)
+        decode: Parses a successful response body (default: json.loads);
+            ValueError from it is reported as invalid JSON
+
+    The request runs under a child of the current deadline that also ends
+    when the budget is spent: each attempt's timeout is capped by the time
+    left, and no retry wait starts that would end past it. Cancelling that
+    deadline (deadline.abandon() on the owning future) stops the retries.
+
+    Each attempt first takes a token from the host's cross-process rate
+    limit bucket (see ratelimit), waiting for one if needed.
+
+    Identical concurrent requests (same method, URL, body and headers, so
+    credentials in Authorization, x-api-key, Cookie and the like) share one
+    in-flight call and its result (see singleflight).
 
     Returns:
         Parsed JSON response
 
     Raises:
         HTTPError: On request failure
+        deadline.DeadlineExceeded: If the run deadline passed before the
+            first attempt
     """
+    body = json.dumps(json_data, sort_keys=True) if json_data is not None else ""
+    sent = "\0".join(sorted(f"{k.lower()}: {v}" for k, v in (headers or {}).items()))
+    key = singleflight.make_key(
+        method, url, hashlib.sha256((body + "\0" + sent).encode("utf-8")).hexdigest(),
+        getattr(decode, "__qualname__", None),
+    )
+    return singleflight.do(
+        key, _request, method, url, headers, json_data, timeout, retries, budget, decode,
+    )
+
+
+def _request(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]],
+    json_data: Optional[Dict[str, Any]],
+    timeout: int,
+    retries: int,
+    budget: Optional[float],
+    decode: Optional[Callable[[str], Any]],
+) -> Dict[str, Any]:
+    """request() without coalescing."""
     headers = headers or {}
     headers.setdefault("User-Agent", USER_AGENT)
 
@@ -63,64 +314,77 @@ def request(
         data = json.dumps(json_data).encode('utf-8')
         headers.setdefault("Content-Type", "application/json")
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-
     log(f"{method} {url}")
     if json_data:
         log(f"Payload keys: {list(json_data.keys())}")
 
+    if budget is None:
+        budget = REQUEST_BUDGET_TIMEOUTS * timeout
+    request_deadline = deadline.current().child(budget)
+    host = urlsplit(url).hostname
     last_error = None
     for attempt in range(retries):
+        if last_error is None:
+            request_deadline.check(f"{method} {url}")
+        elif request_deadline.expired():
+            log("Not retrying: request budget or run deadline spent")
+            break
+        wait = ratelimit.reserve(host, request_deadline.remaining())
+        if wait is None:
+            log(f"Rate limit for {host} would outlast the request budget")
+            last_error = last_error or HTTPError(f"Rate limit for {host} would outlast the request budget")
+            break
+        if wait > 0:
+            log(f"Rate limit: waiting {wait:.2f}s for {host}")
+            if not request_deadline.sleep(wait):
+                last_error = last_error or HTTPError(f"Gave up waiting for the {host} rate limit")
+                break
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                body = response.read().decode('utf-8')
-                log(f"Response: {response.status} ({len(body)} bytes)")
-                return json.loads(body) if body else {}
-        except urllib.error.HTTPError as e:
-            body = None
+            status, resp_headers, raw = _send(method, url, headers, data, request_deadline.cap(timeout))
+        except (OSError, http.client.HTTPException) as e:
+            # Handle socket-level errors (DNS, connection reset, timeout, etc.)
+            reason = getattr(e, "reason", None) or e
+            log(f"Connection error: {type(e).__name__}: {reason}")
+            last_error = HTTPError(f"Connection error: {type(e).__name__}: {reason}")
+            if attempt < retries - 1 and not request_deadline.sleep(_backoff(attempt)):
+                log("Not retrying: request budget or run deadline would run out first")
+                break
+            continue
+
+        body = raw.decode('utf-8', errors='replace')
+
+        if status < 400:
+            log(f"Response: {status} ({len(body)} bytes)")
             try:
-                body = e.read().decode('utf-8')
-            except:
-                pass
-            log(f"HTTP Error {e.code}: {e.reason}")
-            if body:
-                log(f"Error body: {body[:500]}")
-            last_error = HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body)
-
-            # Don't retry client errors (4xx) except rate limits
-            if 400 <= e.code < 500 and e.code != 429:
-                raise last_error
-
-            if attempt < retries - 1:
-                if e.code == 429:
-                    # Respect Retry-After header, fall back to exponential backoff
-                    retry_after = e.headers.get("Retry-After") if hasattr(e, 'headers') else None
-                    if retry_after:
-                        try:
-                            delay = float(retry_after)
-                        except ValueError:
-                            delay = RETRY_DELAY * (2 ** attempt) + 1
-                    else:
-                        delay = RETRY_DELAY * (2 ** attempt) + 1  # 2s, 5s, 9s...
-                    log(f"Rate limited (429). Waiting {delay:.1f}s before retry {attempt + 2}/{retries}")
-                else:
-                    delay = RETRY_DELAY * (2 ** attempt)
-                time.sleep(delay)
-        except urllib.error.URLError as e:
-            log(f"URL Error: {e.reason}")
-            last_error = HTTPError(f"URL Error: {e.reason}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-        except json.JSONDecodeError as e:
-            log(f"JSON decode error: {e}")
-            last_error = HTTPError(f"Invalid JSON response: {e}")
+                return (decode or json.loads)(body) if body else {}
+            except ValueError as e:
+                log(f"JSON decode error: {e}")
+                raise HTTPError(f"Invalid JSON response: {e}")
+
+        reason = http.client.responses.get(status, "")
+        log(f"HTTP Error {status}: {reason}")
+        if body:
+            log(f"Error body: {body[:500]}")
+        last_error = HTTPError(f"HTTP {status}: {reason}", status, body, _retry_after(resp_headers))
+        if status == 429 and last_error.retry_after:
+            ratelimit.penalize(host, last_error.retry_after)
+
+        # Don't retry client errors (4xx) except rate limits
+        if 400 <= status < 500 and status != 429:
             raise last_error
-        except (OSError, TimeoutError, ConnectionResetError) as e:
-            # Handle socket-level errors (connection reset, timeout, etc.)
-            log(f"Connection error: {type(e).__name__}: {e}")
-            last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+
+        if attempt < retries - 1:
+            if status == 429:
+                # Respect Retry-After header, fall back to exponential backoff
+                delay = last_error.retry_after
+                if delay is None:
+                    delay = _backoff(attempt) + 1  # ~2s, ~4s, ~7s...
+                log(f"Rate limited (429). Waiting {delay:.1f}s before retry {attempt + 2}/{retries}")
+            else:
+                delay = _backoff(attempt)
+            if not request_deadline.sleep(delay):
+                log("Not retrying: request budget or run deadline would run out first")
+                break
 
     if last_error:
         raise last_error
@@ -137,13 +401,21 @@ def post(url: str, json_data: Dict[str, Any], headers: Optional[Dict[str, str]]
     return request("POST", url, headers=headers, json_data=json_data, **kwargs)
 
 
-def get_reddit_json(path: str, timeout: int = DEFAULT_TIMEOUT, retries: int = MAX_RETRIES) -> Dict[str, Any]:
+def get_reddit_json(
+    path: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = MAX_RETRIES,
+    params: Optional[Dict[str, Any]] = None,
+    decode: Optional[Callable[[str], Any]] = None,
+) -> Dict[str, Any]:
     """Fetch Reddit thread JSON.
 
     Args:
         path: Reddit path (e.g., /r/subreddit/comments/id/title)
         timeout: HTTP timeout per attempt in seconds
         retries: Number of retries on failure
+        params: Extra query parameters (e.g., {"id": "t3_abc,t3_def"})
+        decode: Custom body parser (see request())
 
     Returns:
         Parsed JSON response
@@ -157,11 +429,11 @@ def get_reddit_json(path: str, timeout: int = DEFAULT_TIMEOUT, retries: int = MA
     if not path.endswith('.json'):
         path = path + '.json'
 
-    url = f"https://www.reddit.com{path}?raw_json=1"
+    url = f"https://www.reddit.com{path}?{urlencode({'raw_json': 1, **(params or {})})}"
 
     headers = {
         "User-Agent": USER_AGENT,
         "Accept": "application/json",
     }
 
-    return get(url, headers=headers, timeout=timeout, retries=retries)
+    return get(url, headers=headers, timeout=timeout, retries=retries, decode=decode)
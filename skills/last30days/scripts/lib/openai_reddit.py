@@ -6,6 +6,7 @@ import sys
 from typing import Any, Dict, List, Optional
 
 from . import http
+from .deadline import DeadlineExceeded
 
 # Fallback models when the selected model isn't accessible (e.g., org not verified for GPT-5)
 # Note: gpt-4o-mini does NOT support web_search with filters param, so exclude it
@@ -269,6 +270,9 @@ def search_subreddits(
 
                 all_items.append(item)
 
+        except DeadlineExceeded:
+            _log_info("Run deadline reached, skipping remaining subreddits")
+            break
         except http.HTTPError as e:
             _log_info(f"Subreddit search failed for r/{sub}: {e}")
             if e.status_code == 429:
@@ -302,7 +306,7 @@ def parse_reddit_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         error = response["error"]
         err_msg = error.get("message", str(error)) if isinstance(error, dict) else str(error)
         _log_error(f"OpenAI API error: {err_msg}")
-        if http.DEBUG:
+        if http.debug_enabled():
             _log_error(f"Full error response: {json.dumps(response, indent=2)[:1000]}")
         return items
 
@@ -0,0 +1,151 @@
+"""Streaming processing pipeline for last30days skill.
+
+Each source goes through normalize -> date filter -> score -> sort -> dedupe
+on its own. Scores are normalized within a source, so a source can be
+processed the moment its results arrive without waiting for (or being
+changed by) the others. StreamingPipeline keeps the processed sources and a
+running ranked view across all of them.
+"""
+
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from . import dedupe, normalize, schema, score, websearch
+
+SOURCES = ("reddit", "x", "youtube", "web")
+
+# Items per partial ranked view in --emit=jsonl-stream
+STREAM_TOP_N = 30
+
+
+def process_source(
+    source: str,
+    raw_items: List[Dict[str, Any]],
+    from_date: str,
+    to_date: str,
+) -> List:
+    """Run one source's raw items through every processing stage.
+
+    Args:
+        source: 'reddit', 'x', 'youtube', or 'web'
+        raw_items: Raw item dicts as returned by the source search
+        from_date: Start of date range (YYYY-MM-DD)
+        to_date: End of date range (YYYY-MM-DD)
+
+    Returns:
+        Deduplicated schema items, best first
+    """
+    if not raw_items:
+        return []
+
+    if source == "reddit":
+        normalized = normalize.normalize_reddit_items(raw_items, from_date, to_date)
+        # Hard date filter: exclude items with verified dates outside the range
+        filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+        deduped = dedupe.dedupe_reddit(score.sort_items(score.score_reddit_items(filtered)))
+        # Minimum result guarantee: if all Reddit results were filtered out but
+        # we had raw results, keep top 3 by relevance regardless of score
+        if not deduped and normalized:
+            print("[REDDIT WARNING] All results scored below threshold, keeping top 3 by relevance", file=sys.stderr)
+            deduped = sorted(normalized, key=lambda item: item.relevance, reverse=True)[:3]
+        return deduped
+
+    if source == "x":
+        normalized = normalize.normalize_x_items(raw_items, from_date, to_date)
+        filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+        return dedupe.dedupe_x(score.sort_items(score.score_x_items(filtered)))
+
+    if source == "youtube":
+        # No hard date filter — youtube_yt.py already applies a soft filter
+        # that prefers recent videos but keeps older ones for evergreen topics.
+        normalized = normalize.normalize_youtube_items(raw_items, from_date, to_date)
+        return dedupe.dedupe_youtube(score.sort_items(score.score_youtube_items(normalized)))
+
+    if source == "web":
+        normalized = websearch.normalize_websearch_items(raw_items, from_date, to_date)
+        filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+        return websearch.dedupe_websearch(score.sort_items(score.score_websearch_items(filtered)))
+
+    raise ValueError(f"Unknown source: {source}")
+
+
+def source_of(item) -> str:
+    """Return the source name for a schema item."""
+    if isinstance(item, schema.RedditItem):
+        return "reddit"
+    if isinstance(item, schema.XItem):
+        return "x"
+    if isinstance(item, schema.YouTubeItem):
+        return "youtube"
+    return "web"
+
+
+class StreamingPipeline:
+    """Processes sources as they complete and keeps a running ranked view.
+
+    Calling add() again for a source replaces its earlier results, so a
+    source can be re-submitted once it has been enriched or extended.
+    """
+
+    def __init__(
+        self,
+        from_date: str,
+        to_date: str,
+        on_update: Optional[Callable[[str, "StreamingPipeline"], None]] = None,
+    ):
+        self.from_date = from_date
+        self.to_date = to_date
+        self.on_update = on_update
+        self._results: Dict[str, List] = {}
+        self._lock = threading.Lock()
+
+    def add(self, source: str, raw_items: List[Dict[str, Any]]) -> List:
+        """Process one source's raw items and publish the updated view.
+
+        Returns:
+            The source's processed items
+        """
+        processed = process_source(source, raw_items, self.from_date, self.to_date)
+        with self._lock:
+            self._results[source] = processed
+        if self.on_update:
+            self.on_update(source, self)
+        return processed
+
+    def has(self, source: str) -> bool:
+        """Whether a source has been processed."""
+        with self._lock:
+            return source in self._results
+
+    def done(self) -> List[str]:
+        """Sources processed so far, in arrival order."""
+        with self._lock:
+            return list(self._results)
+
+    def items(self, source: str) -> List:
+        """Processed items for one source (empty if not processed)."""
+        with self._lock:
+            return list(self._results.get(source, []))
+
+    def ranked(self, limit: Optional[int] = None) -> List:
+        """All processed items across sources, best first."""
+        with self._lock:
+            merged = [item for items in self._results.values() for item in items]
+        ranked = score.sort_items(merged)
+        return ranked[:limit] if limit is not None else ranked
+
+    def snapshot(self, source: str, limit: int = STREAM_TOP_N) -> Dict[str, Any]:
+        """Partial ranked view for --emit=jsonl-stream, after `source` arrived."""
+        with self._lock:
+            counts = {s: len(items) for s, items in self._results.items()}
+        return {
+            "event": "partial",
+            "source": source,
+            "sources_done": list(counts),
+            "counts": counts,
+            "items": [
+                {"source": source_of(item), **item.to_dict()}
+                for item in self.ranked(limit)
+            ],
+        }
@@ -0,0 +1,201 @@
+"""Cross-process per-host rate limiting for last30days skill.
+
+Every HTTP attempt to a rate-limited host first takes a token from that
+host's bucket. Buckets live in ratelimit.db in the cache directory, so all
+last30days processes on the machine (parallel agents, the watchlist, the
+serve daemon) draw from the same buckets and together stay just under the
+provider's limit instead of each retrying through 429s on its own.
+
+Tokens are reserved, not polled for: a caller that finds the bucket empty
+takes the next future token and sleeps until it is due, so concurrent
+callers are spaced 1/rate apart. A 429 with Retry-After pushes the bucket
+back so every process waits it out.
+
+Limits are "rate/burst" (tokens per second / bucket size) per host, and can
+be overridden with LAST30DAYS_RATE_LIMITS, e.g.
+"www.reddit.com=0.5/5,api.x.ai=off".
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from . import cache
+
+# host -> (tokens per second, burst)
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "www.reddit.com": (1.0, 10),
+    "api.openai.com": (3.0, 10),
+    "api.x.ai": (1.0, 5),
+}
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+
+CREATE TABLE IF NOT EXISTS buckets (
+    host TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_path: Optional[Path] = None
+_lock = threading.Lock()
+_parsed: Tuple[Optional[str], Dict[str, Optional[Tuple[float, float]]]] = (None, {})
+
+
+def _log(msg: str):
+    """Log rate limiter problems to stderr."""
+    sys.stderr.write(f"[RateLimit] {msg}\n")
+    sys.stderr.flush()
+
+
+def parse_limits(spec: str) -> Dict[str, Optional[Tuple[float, float]]]:
+    """Parse a LAST30DAYS_RATE_LIMITS value.
+
+    Args:
+        spec: Comma-separated "host=rate/burst" or "host=off" entries
+
+    Returns:
+        Dict mapping host to (rate, burst), or None for "off"
+    """
+    limits = {}
+    for entry in spec.split(","):
+        host, sep, value = entry.strip().partition("=")
+        if not sep or not host:
+            continue
+        value = value.strip().lower()
+        if value in ("off", "0", "none"):
+            limits[host.lower()] = None
+            continue
+        rate, _, burst = value.partition("/")
+        try:
+            rate = float(rate)
+            burst = float(burst) if burst else max(1.0, rate)
+        except ValueError:
+            _log(f"Ignoring bad rate limit {entry!r}")
+            continue
+        if rate > 0:
+            limits[host.lower()] = (rate, max(1.0, burst))
+    return limits
+
+
+def limit_for(host: Optional[str]) -> Optional[Tuple[float, float]]:
+    """The (rate, burst) limit that applies to a host, or None."""
+    global _parsed
+    if not host:
+        return None
+    host = host.lower()
+    spec = os.environ.get("LAST30DAYS_RATE_LIMITS", "")
+    if spec != _parsed[0]:
+        _parsed = (spec, parse_limits(spec))
+    overrides = _parsed[1]
+    if host in overrides:
+        return overrides[host]
+    return DEFAULT_LIMITS.get(host)
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the ratelimit.db connection (callers hold _lock)."""
+    global _conn, _conn_path
+    cache.ensure_cache_dir()
+    path = cache.CACHE_DIR / "ratelimit.db"
+    if _conn is not None and _conn_path == path:
+        return _conn
+    if _conn is not None:
+        _conn.close()
+    conn = sqlite3.connect(str(path), timeout=5, isolation_level=None, check_same_thread=False)
+    conn.executescript(_SCHEMA)
+    _conn, _conn_path = conn, path
+    return conn
+
+
+def _update(host: str, rate: float, burst: float, change) -> Optional[float]:
+    """Run one bucket transaction; change(tokens) -> (new_tokens, result)."""
+    with _lock:
+        conn = _get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM buckets WHERE host = ?", (host,)
+            ).fetchone()
+            if row is None:
+                tokens, updated = burst, now
+            else:
+                tokens = min(burst, row[0] + max(0.0, now - row[1]) * rate)
+                updated = max(now, row[1])
+            new_tokens, result = change(tokens)
+            if new_tokens is None:
+                conn.execute("ROLLBACK")
+                return result
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (host, tokens, updated_at) VALUES (?, ?, ?)",
+                (host, new_tokens, updated),
+            )
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+
+def reserve(host: Optional[str], max_wait: float = float("inf")) -> Optional[float]:
+    """Take a token for one request to host.
+
+    Args:
+        host: Request host (unlimited hosts return 0 at once)
+        max_wait: Longest acceptable wait in seconds
+
+    Returns:
+        Seconds to wait before sending (0 if a token was free), or None if
+        the next token is further away than max_wait (nothing is taken)
+    """
+    limit = limit_for(host)
+    if limit is None:
+        return 0.0
+    rate, burst = limit
+
+    def take(tokens):
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+        if wait > max_wait:
+            return None, None
+        return tokens - 1, wait
+
+    try:
+        return _update(host.lower(), rate, burst, take)
+    except sqlite3.Error as e:
+        # Never block requests on a broken limiter database
+        _log(f"Limiter unavailable: {e}")
+        return 0.0
+
+
+def penalize(host: Optional[str], seconds: float):
+    """Hold back every process's next request to host for `seconds`.
+
+    Used when the provider answers 429 with a Retry-After.
+    """
+    limit = limit_for(host)
+    if limit is None or seconds <= 0:
+        return
+    rate, burst = limit
+    try:
+        _update(host.lower(), rate, burst, lambda tokens: (min(tokens, 1 - seconds * rate), None))
+    except sqlite3.Error as e:
+        _log(f"Limiter unavailable: {e}")
+
+
+def close():
+    """Close the ratelimit.db connection (reopened lazily on next use)."""
+    global _conn, _conn_path
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+        _conn, _conn_path = None, None
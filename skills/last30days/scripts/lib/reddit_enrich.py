@@ -1,10 +1,41 @@
 """Reddit thread enrichment with real engagement metrics."""
 
+import json
 import re
+import time
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
-from . import http, dates
+from . import cache, http, dates
+
+# /api/info accepts at most 100 fullnames per call
+INFO_BATCH_SIZE = 100
+
+# Thread fetches ask Reddit for a bounded, top-sorted, top-level-only
+# comment tree; enrichment only ever reads the best top-level comments
+THREAD_FETCH_PARAMS = {"limit": 25, "depth": 1, "sort": "top"}
+
+# Fields parse_thread_data reads; the lean decoder drops everything else
+_THREAD_FIELDS = frozenset({
+    "kind", "data", "children",
+    "id", "title", "selftext", "body", "author", "permalink",
+    "score", "num_comments", "upvote_ratio", "created_utc",
+})
+
+# Parsed threads are cached in results.db. Comments on a new thread keep
+# moving, so its entry goes stale quickly; once a thread is a few days old
+# its top comments are treated as stable.
+THREAD_CACHE_TTL_HOURS = (
+    (1, 2),    # fetched within a day of posting: 2 hours
+    (3, 12),   # within three days: 12 hours
+)
+THREAD_STABLE_TTL_HOURS = 7 * 24
+
+# A cached thread is refetched anyway when its comment count (from the
+# batched /api/info refresh) has grown by this fraction, and at least
+# COMMENT_DELTA_MIN comments, since it was cached
+COMMENT_DELTA_REFETCH = 0.25
+COMMENT_DELTA_MIN = 10
 
 
 def extract_reddit_path(url: str) -> Optional[str]:
@@ -25,9 +56,51 @@ def extract_reddit_path(url: str) -> Optional[str]:
         return None
 
 
+def extract_post_id(url: str) -> Optional[str]:
+    """Extract the base-36 post ID from a Reddit thread URL.
+
+    Args:
+        url: Reddit thread URL (.../comments/<id>/...)
+
+    Returns:
+        Post ID or None
+    """
+    path = extract_reddit_path(url)
+    if not path:
+        return None
+    match = re.search(r"/comments/([a-z0-9]+)", path, re.IGNORECASE)
+    return match.group(1).lower() if match else None
+
+
 class RedditRateLimitError(Exception):
     """Raised when Reddit returns HTTP 429 (rate limited)."""
-    pass
+    status_code = 429
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _keep_thread_fields(pairs: List[tuple]) -> Dict[str, Any]:
+    return {k: v for k, v in pairs if k in _THREAD_FIELDS}
+
+
+def decode_thread_json(text: str) -> Any:
+    """Decode a thread response, keeping only what parse_thread_data needs.
+
+    Fields outside _THREAD_FIELDS (including every `replies` subtree) are
+    dropped as each object finishes decoding, so the returned listings are
+    small and the dropped subtrees can be freed early. Peak memory is not
+    much lower, though: the raw text is held whole, and each `replies`
+    subtree is fully decoded before its parent discards it.
+
+    Args:
+        text: Raw thread JSON
+
+    Returns:
+        The thread listings in the usual shape, with only the kept fields
+    """
+    return json.loads(text, object_pairs_hook=_keep_thread_fields)
 
 
 def fetch_thread_data(
@@ -35,6 +108,7 @@ def fetch_thread_data(
     mock_data: Optional[Dict] = None,
     timeout: int = 30,
     retries: int = 3,
+    lean: bool = True,
 ) -> Optional[Dict[str, Any]]:
     """Fetch Reddit thread JSON data.
 
@@ -43,6 +117,8 @@ def fetch_thread_data(
         mock_data: Mock data for testing
         timeout: HTTP timeout per attempt in seconds
         retries: Number of retries on failure
+        lean: Request a shallow top-comment tree (THREAD_FETCH_PARAMS) and
+            decode it with decode_thread_json; False fetches the full thread
 
     Returns:
         Thread data dict or None on failure
@@ -58,14 +134,66 @@ def fetch_thread_data(
         return None
 
     try:
-        data = http.get_reddit_json(path, timeout=timeout, retries=retries)
-        return data
+        if lean:
+            return http.get_reddit_json(
+                path, timeout=timeout, retries=retries,
+                params=THREAD_FETCH_PARAMS, decode=decode_thread_json,
+            )
+        return http.get_reddit_json(path, timeout=timeout, retries=retries)
     except http.HTTPError as e:
         if e.status_code == 429:
-            raise RedditRateLimitError(f"Reddit rate limited (429) fetching {url}") from e
+            raise RedditRateLimitError(f"Reddit rate limited (429) fetching {url}", e.retry_after) from e
         return None
 
 
+def fetch_info_data(
+    post_ids: List[str],
+    mock_data: Optional[Dict] = None,
+    timeout: int = 10,
+    retries: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch submission data for many posts via /api/info.json.
+
+    One request covers up to INFO_BATCH_SIZE posts, so engagement for a whole
+    result set costs a call or two instead of one thread fetch per post.
+
+    Args:
+        post_ids: Base-36 post IDs (without the t3_ prefix)
+        mock_data: Mock /api/info listing for testing
+        timeout: HTTP timeout per attempt in seconds
+        retries: Number of retries on failure
+
+    Returns:
+        Dict mapping post ID to its submission data (missing posts are absent)
+
+    Raises:
+        RedditRateLimitError: When Reddit returns 429 (caller should bail)
+    """
+    found = {}
+    for start in range(0, len(post_ids), INFO_BATCH_SIZE):
+        batch = post_ids[start:start + INFO_BATCH_SIZE]
+        if mock_data is not None:
+            data = mock_data
+        else:
+            fullnames = ",".join(f"t3_{post_id}" for post_id in batch)
+            try:
+                data = http.get_reddit_json(
+                    "/api/info", timeout=timeout, retries=retries, params={"id": fullnames},
+                )
+            except http.HTTPError as e:
+                if e.status_code == 429:
+                    raise RedditRateLimitError(
+                        "Reddit rate limited (429) fetching /api/info", e.retry_after,
+                    ) from e
+                continue
+        children = data.get("data", {}).get("children", []) if isinstance(data, dict) else []
+        for child in children:
+            sub_data = child.get("data", {})
+            if sub_data.get("id") in batch:
+                found[sub_data["id"]] = sub_data
+    return found
+
+
 def parse_thread_data(data: Any) -> Dict[str, Any]:
     """Parse Reddit thread JSON into structured data.
 
@@ -123,6 +251,66 @@ def parse_thread_data(data: Any) -> Dict[str, Any]:
     return result
 
 
+def thread_ttl_hours(created_utc: Optional[float], fetched_at: float) -> float:
+    """How long a cached thread stays fresh, from its age when fetched.
+
+    Args:
+        created_utc: Thread creation time (None if unknown)
+        fetched_at: When the thread was fetched (Unix time)
+
+    Returns:
+        Freshness window in hours
+    """
+    if created_utc is None:
+        return THREAD_CACHE_TTL_HOURS[0][1]
+    age_days = (fetched_at - created_utc) / 86400
+    for max_age_days, ttl_hours in THREAD_CACHE_TTL_HOURS:
+        if age_days < max_age_days:
+            return ttl_hours
+    return THREAD_STABLE_TTL_HOURS
+
+
+def _thread_cache_key(url: str) -> Optional[str]:
+    post_id = extract_post_id(url)
+    return f"reddit_thread:{post_id}" if post_id else None
+
+
+def load_cached_thread(url: str, num_comments: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Load a parsed thread from the thread cache if it is still fresh.
+
+    Args:
+        url: Reddit thread URL
+        num_comments: Current comment count, if known; a cached thread that
+            has since gained many comments is treated as stale
+
+    Returns:
+        Parsed thread (as from parse_thread_data) or None
+    """
+    key = _thread_cache_key(url)
+    if not key:
+        return None
+    data, age_hours = cache.load_cache_with_age(key, THREAD_STABLE_TTL_HOURS)
+    if not data:
+        return None
+    submission = data.get("submission") or {}
+    fetched_at = time.time() - age_hours * 3600
+    if age_hours >= thread_ttl_hours(submission.get("created_utc"), fetched_at):
+        return None
+    cached_comments = submission.get("num_comments")
+    if num_comments is not None and cached_comments is not None:
+        growth = num_comments - cached_comments
+        if growth >= max(COMMENT_DELTA_MIN, cached_comments * COMMENT_DELTA_REFETCH):
+            return None
+    return data
+
+
+def save_cached_thread(url: str, parsed: Dict[str, Any]):
+    """Store a parsed thread (submission and top comments) in the thread cache."""
+    key = _thread_cache_key(url)
+    if key:
+        cache.save_cache(key, parsed, THREAD_STABLE_TTL_HOURS)
+
+
 def get_top_comments(comments: List[Dict], limit: int = 10) -> List[Dict[str, Any]]:
     """Get top comments sorted by score.
 
@@ -192,19 +380,107 @@ def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
     return insights
 
 
+def apply_engagement(item: Dict[str, Any], submission: Dict[str, Any]) -> Dict[str, Any]:
+    """Update an item's engagement metrics and date from submission data.
+
+    Args:
+        item: Reddit item dict
+        submission: Submission fields (score, num_comments, upvote_ratio, created_utc)
+
+    Returns:
+        The updated item
+    """
+    item["engagement"] = {
+        "score": submission.get("score"),
+        "num_comments": submission.get("num_comments"),
+        "upvote_ratio": submission.get("upvote_ratio"),
+    }
+
+    # Update date from actual data
+    created_utc = submission.get("created_utc")
+    if created_utc:
+        item["date"] = dates.timestamp_to_date(created_utc)
+    return item
+
+
+def refresh_engagement(
+    items: List[Dict[str, Any]],
+    mock_info_data: Optional[Dict] = None,
+    timeout: int = 10,
+    retries: int = 1,
+) -> List[int]:
+    """Refresh engagement for all items with batched /api/info calls.
+
+    This is the cheap first tier of enrichment: scores, comment counts and
+    upvote ratios for every item, without fetching any comment trees.
+
+    Args:
+        items: Reddit item dicts (updated in place)
+        mock_info_data: Mock /api/info listing for testing
+        timeout: HTTP timeout per attempt
+        retries: Number of retries
+
+    Returns:
+        Indices of the items that were refreshed
+
+    Raises:
+        RedditRateLimitError: Propagated so caller can skip the comment tier
+    """
+    ids = {i: extract_post_id(item.get("url", "")) for i, item in enumerate(items)}
+    wanted = list(dict.fromkeys(post_id for post_id in ids.values() if post_id))
+    if not wanted:
+        return []
+    found = fetch_info_data(wanted, mock_info_data, timeout=timeout, retries=retries)
+    refreshed = []
+    for i, post_id in ids.items():
+        if post_id in found:
+            apply_engagement(items[i], found[post_id])
+            refreshed.append(i)
+    return refreshed
+
+
+def select_for_comments(items: List[Dict[str, Any]], limit: int) -> List[int]:
+    """Pick the threads worth a full comment-tree fetch.
+
+    Threads with no comments are skipped; the rest are ranked by comment
+    count, then score, using whatever engagement is known (refresh first).
+
+    Args:
+        items: Reddit item dicts
+        limit: Maximum number of threads to pick
+
+    Returns:
+        Indices into items, busiest thread first
+    """
+    def engagement(i: int):
+        eng = items[i].get("engagement") or {}
+        return eng.get("num_comments"), eng.get("score") or 0
+
+    candidates = [i for i in range(len(items)) if engagement(i)[0] != 0]
+    candidates.sort(key=lambda i: (engagement(i)[0] or 0, engagement(i)[1]), reverse=True)
+    return candidates[:limit]
+
+
 def enrich_reddit_item(
     item: Dict[str, Any],
     mock_thread_data: Optional[Dict] = None,
     timeout: int = 10,
     retries: int = 1,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """Enrich a Reddit item with real engagement data.
 
+    Fresh threads are served from the thread cache. Their engagement is
+    left as the batched /api/info refresh set it, so only score and comment
+    deltas cost a request.
+
     Args:
         item: Reddit item dict
         mock_thread_data: Mock data for testing
         timeout: HTTP timeout per attempt (default 10s for enrichment)
         retries: Number of retries (default 1 — fail fast for enrichment)
+        use_cache: Serve fresh threads from the thread cache (fetched
+            threads are cached either way)
 
     Returns:
         Enriched item dict
@@ -214,27 +490,28 @@ def enrich_reddit_item(
     """
     url = item.get("url", "")
 
-    # Fetch thread data (RedditRateLimitError propagates to caller)
-    thread_data = fetch_thread_data(url, mock_thread_data, timeout=timeout, retries=retries)
-    if not thread_data:
-        return item
+    engagement = item.get("engagement") or {}
+    parsed = None
+    if use_cache and mock_thread_data is None:
+        parsed = load_cached_thread(url, engagement.get("num_comments"))
+    from_cache = parsed is not None
+
+    if parsed is None:
+        # Fetch thread data (RedditRateLimitError propagates to caller)
+        thread_data = fetch_thread_data(url, mock_thread_data, timeout=timeout, retries=retries)
+        if not thread_data:
+            return item
+        parsed = parse_thread_data(thread_data)
+        parsed["comments"] = get_top_comments(parsed["comments"])
+        if mock_thread_data is None:
+            save_cached_thread(url, parsed)
 
-    parsed = parse_thread_data(thread_data)
     submission = parsed.get("submission")
     comments = parsed.get("comments", [])
 
-    # Update engagement metrics
-    if submission:
-        item["engagement"] = {
-            "score": submission.get("score"),
-            "num_comments": submission.get("num_comments"),
-            "upvote_ratio": submission.get("upvote_ratio"),
-        }
-
-        # Update date from actual data
-        created_utc = submission.get("created_utc")
-        if created_utc:
-            item["date"] = dates.timestamp_to_date(created_utc)
+    # Update engagement metrics (a cached copy is older than the refresh)
+    if submission and not (from_cache and engagement):
+        apply_engagement(item, submission)
 
     # Get top comments
     top_comments = get_top_comments(comments)
@@ -45,6 +45,17 @@ def _assess_data_freshness(report: schema.Report) -> dict:
     }
 
 
+SOURCE_LABELS = {"reddit": "Reddit", "x": "X", "youtube": "YouTube", "web": "Web"}
+
+
+def _sightings_str(item) -> str:
+    """One-line summary of where else a clustered story was seen."""
+    parts = []
+    for s in item.sightings:
+        parts.append(f"{SOURCE_LABELS.get(s.source, s.source)} {s.label}".strip())
+    return ", ".join(parts)
+
+
 def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "none") -> str:
     """Render compact output for the assistant to synthesize.
 
@@ -88,6 +99,12 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
         lines.append(f"**⚡ CACHED RESULTS** ({age_str}) - use `--refresh` for fresh data")
         lines.append("")
 
+    # Deadline indicator
+    if report.cut_short:
+        cut = ", ".join(SOURCE_LABELS.get(s, s) for s in report.cut_short)
+        lines.append(f"**⏱️ PARTIAL RESULTS** - deadline reached before {cut} finished")
+        lines.append("")
+
     lines.append(f"**Date Range:** {report.range_from} to {report.range_to}")
     lines.append(f"**Mode:** {report.mode}")
     if report.openai_model_used:
@@ -136,6 +153,8 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
             lines.append(f"**{item.id}** (score:{item.score}) r/{item.subreddit}{date_str}{conf_str}{eng_str}")
             lines.append(f"  {item.title}")
             lines.append(f"  {item.url}")
+            if item.sightings:
+                lines.append(f"  Also seen: {_sightings_str(item)}")
             lines.append(f"  *{item.why_relevant}*")
 
             # Top comment insights
@@ -178,6 +197,8 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
             lines.append(f"**{item.id}** (score:{item.score}) @{item.author_handle}{date_str}{conf_str}{eng_str}")
             lines.append(f"  {item.text[:200]}...")
             lines.append(f"  {item.url}")
+            if item.sightings:
+                lines.append(f"  Also seen: {_sightings_str(item)}")
             lines.append(f"  *{item.why_relevant}*")
             lines.append("")
 
@@ -207,6 +228,8 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
             lines.append(f"**{item.id}** (score:{item.score}) {item.channel_name}{date_str}{eng_str}")
             lines.append(f"  {item.title}")
             lines.append(f"  {item.url}")
+            if item.sightings:
+                lines.append(f"  Also seen: {_sightings_str(item)}")
             if item.transcript_snippet:
                 snippet = item.transcript_snippet[:200]
                 if len(item.transcript_snippet) > 200:
@@ -231,6 +254,8 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
             lines.append(f"**{item.id}** [WEB] (score:{item.score}) {item.source_domain}{date_str}{conf_str}")
             lines.append(f"  {item.title}")
             lines.append(f"  {item.url}")
+            if item.sightings:
+                lines.append(f"  Also seen: {_sightings_str(item)}")
             lines.append(f"  {item.snippet[:150]}...")
             lines.append(f"  *{item.why_relevant}*")
             lines.append("")
@@ -238,19 +263,33 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
     return "\n".join(lines)
 
 
+def _cache_note(cache_ages: dict, source: str) -> str:
+    """Age marker for a source served from the result cache."""
+    if source not in cache_ages:
+        return ""
+    return f" (cached, {cache_ages[source]:.1f}h old)"
+
+
+def _cut_note(report: schema.Report, source: str) -> str:
+    """Marker for a source whose results were cut short by --deadline."""
+    return " (partial — cut short by deadline)" if source in report.cut_short else ""
+
+
 def render_source_status(report: schema.Report, source_info: dict = None) -> str:
     """Render source status footer showing what was used/skipped and why.
 
     Args:
         report: Report data
         source_info: Dict with source availability info:
-            x_skip_reason, youtube_skip_reason, web_skip_reason
+            x_skip_reason, youtube_skip_reason, web_skip_reason,
+            cache_ages ({source: age_hours} for sources served from cache)
 
     Returns:
         Source status markdown string
     """
     if source_info is None:
         source_info = {}
+    cache_ages = source_info.get("cache_ages", {})
 
     lines = []
     lines.append("---")
@@ -260,7 +299,7 @@ def render_source_status(report: schema.Report, source_info: dict = None) -> str
     if report.reddit_error:
         lines.append(f"  ❌ Reddit: error — {report.reddit_error}")
     elif report.reddit:
-        lines.append(f"  ✅ Reddit: {len(report.reddit)} threads")
+        lines.append(f"  ✅ Reddit: {len(report.reddit)} threads{_cache_note(cache_ages, 'reddit')}{_cut_note(report, 'reddit')}")
     elif report.mode in ("both", "reddit-only", "all", "reddit-web"):
         lines.append("  ⚠️ Reddit: 0 threads found")
     else:
@@ -271,7 +310,7 @@ def render_source_status(report: schema.Report, source_info: dict = None) -> str
     if report.x_error:
         lines.append(f"  ❌ X: error — {report.x_error}")
     elif report.x:
-        lines.append(f"  ✅ X: {len(report.x)} posts")
+        lines.append(f"  ✅ X: {len(report.x)} posts{_cache_note(cache_ages, 'x')}{_cut_note(report, 'x')}")
     elif report.mode in ("both", "x-only", "all", "x-web"):
         lines.append("  ⚠️ X: 0 posts found")
     else:
@@ -283,7 +322,7 @@ def render_source_status(report: schema.Report, source_info: dict = None) -> str
         lines.append(f"  ❌ YouTube: error — {report.youtube_error}")
     elif report.youtube:
         with_transcripts = sum(1 for v in report.youtube if getattr(v, 'transcript_snippet', None))
-        lines.append(f"  ✅ YouTube: {len(report.youtube)} videos ({with_transcripts} with transcripts)")
+        lines.append(f"  ✅ YouTube: {len(report.youtube)} videos ({with_transcripts} with transcripts){_cache_note(cache_ages, 'youtube')}{_cut_note(report, 'youtube')}")
     else:
         reason = source_info.get("youtube_skip_reason", "yt-dlp not installed (brew install yt-dlp)")
         lines.append(f"  ⏭️ YouTube: skipped — {reason}")
@@ -292,7 +331,7 @@ def render_source_status(report: schema.Report, source_info: dict = None) -> str
     if report.web_error:
         lines.append(f"  ❌ Web: error — {report.web_error}")
     elif report.web:
-        lines.append(f"  ✅ Web: {len(report.web)} pages")
+        lines.append(f"  ✅ Web: {len(report.web)} pages{_cache_note(cache_ages, 'web')}{_cut_note(report, 'web')}")
     else:
         reason = source_info.get("web_skip_reason", "assistant will use WebSearch")
         lines.append(f"  ⚡ Web: {reason}")
@@ -381,6 +420,8 @@ def render_full_report(report: schema.Report) -> str:
             lines.append(f"- **Date:** {item.date or 'Unknown'} (confidence: {item.date_confidence})")
             lines.append(f"- **Score:** {item.score}/100")
             lines.append(f"- **Relevance:** {item.why_relevant}")
+            if item.sightings:
+                lines.append(f"- **Also seen:** {_sightings_str(item)}")
 
             if item.engagement:
                 eng = item.engagement
@@ -405,6 +446,8 @@ def render_full_report(report: schema.Report) -> str:
             lines.append(f"- **Date:** {item.date or 'Unknown'} (confidence: {item.date_confidence})")
             lines.append(f"- **Score:** {item.score}/100")
             lines.append(f"- **Relevance:** {item.why_relevant}")
+            if item.sightings:
+                lines.append(f"- **Also seen:** {_sightings_str(item)}")
 
             if item.engagement:
                 eng = item.engagement
@@ -426,6 +469,8 @@ def render_full_report(report: schema.Report) -> str:
             lines.append(f"- **Date:** {item.date or 'Unknown'} (confidence: {item.date_confidence})")
             lines.append(f"- **Score:** {item.score}/100")
             lines.append(f"- **Relevance:** {item.why_relevant}")
+            if item.sightings:
+                lines.append(f"- **Also seen:** {_sightings_str(item)}")
             lines.append("")
             lines.append(f"> {item.snippet}")
             lines.append("")
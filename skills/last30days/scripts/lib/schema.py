@@ -62,6 +62,46 @@ class Comment:
         }
 
 
+@dataclass
+class Sighting:
+    """Another appearance of the same story, merged into a cluster."""
+    source: str  # 'reddit', 'x', 'youtube', 'web'
+    url: str
+    label: str  # r/subreddit, @handle, channel name, or domain
+    title: str
+    date: Optional[str] = None
+    engagement: Optional[Engagement] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'source': self.source,
+            'url': self.url,
+            'label': self.label,
+            'title': self.title,
+            'date': self.date,
+            'engagement': self.engagement.to_dict() if self.engagement else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Sighting":
+        eng = Engagement(**data['engagement']) if data.get('engagement') else None
+        return cls(
+            source=data['source'],
+            url=data['url'],
+            label=data.get('label', ''),
+            title=data.get('title', ''),
+            date=data.get('date'),
+            engagement=eng,
+        )
+
+
+def _add_sightings(d: Dict[str, Any], sightings: List[Sighting]) -> Dict[str, Any]:
+    """Attach sightings to an item dict (only when the item is a cluster)."""
+    if sightings:
+        d['sightings'] = [s.to_dict() for s in sightings]
+    return d
+
+
 @dataclass
 class SubScores:
     """Component scores."""
@@ -93,9 +133,10 @@ class RedditItem:
     why_relevant: str = ""
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
+    sightings: List[Sighting] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        return _add_sightings({
             'id': self.id,
             'title': self.title,
             'url': self.url,
@@ -109,7 +150,7 @@ class RedditItem:
             'why_relevant': self.why_relevant,
             'subs': self.subs.to_dict(),
             'score': self.score,
-        }
+        }, self.sightings)
 
 
 @dataclass
@@ -126,9 +167,10 @@ class XItem:
     why_relevant: str = ""
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
+    sightings: List[Sighting] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        return _add_sightings({
             'id': self.id,
             'text': self.text,
             'url': self.url,
@@ -140,7 +182,7 @@ class XItem:
             'why_relevant': self.why_relevant,
             'subs': self.subs.to_dict(),
             'score': self.score,
-        }
+        }, self.sightings)
 
 
 @dataclass
@@ -157,9 +199,10 @@ class WebSearchItem:
     why_relevant: str = ""
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
+    sightings: List[Sighting] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        return _add_sightings({
             'id': self.id,
             'title': self.title,
             'url': self.url,
@@ -171,7 +214,7 @@ class WebSearchItem:
             'why_relevant': self.why_relevant,
             'subs': self.subs.to_dict(),
             'score': self.score,
-        }
+        }, self.sightings)
 
 
 @dataclass
@@ -189,9 +232,10 @@ class YouTubeItem:
     why_relevant: str = ""
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
+    sightings: List[Sighting] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        return _add_sightings({
             'id': self.id,
             'title': self.title,
             'url': self.url,
@@ -204,7 +248,7 @@ class YouTubeItem:
             'why_relevant': self.why_relevant,
             'subs': self.subs.to_dict(),
             'score': self.score,
-        }
+        }, self.sightings)
 
 
 @dataclass
@@ -232,6 +276,8 @@ class Report:
     # Cache info
     from_cache: bool = False
     cache_age_hours: Optional[float] = None
+    # Sources interrupted by --deadline (results may be partial)
+    cut_short: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         d = {
@@ -264,6 +310,8 @@ class Report:
             d['from_cache'] = self.from_cache
         if self.cache_age_hours is not None:
             d['cache_age_hours'] = self.cache_age_hours
+        if self.cut_short:
+            d['cut_short'] = self.cut_short
         return d
 
     @classmethod
@@ -296,6 +344,7 @@ class Report:
                 why_relevant=r.get('why_relevant', ''),
                 subs=subs,
                 score=r.get('score', 0),
+                sightings=[Sighting.from_dict(s) for s in r.get('sightings', [])],
             ))
 
         # Reconstruct X items
@@ -317,6 +366,7 @@ class Report:
                 why_relevant=x.get('why_relevant', ''),
                 subs=subs,
                 score=x.get('score', 0),
+                sightings=[Sighting.from_dict(s) for s in x.get('sightings', [])],
             ))
 
         # Reconstruct Web items
@@ -335,6 +385,7 @@ class Report:
                 why_relevant=w.get('why_relevant', ''),
                 subs=subs,
                 score=w.get('score', 0),
+                sightings=[Sighting.from_dict(s) for s in w.get('sightings', [])],
             ))
 
         # Reconstruct YouTube items
@@ -357,6 +408,7 @@ class Report:
                 why_relevant=y.get('why_relevant', ''),
                 subs=subs,
                 score=y.get('score', 0),
+                sightings=[Sighting.from_dict(s) for s in y.get('sightings', [])],
             ))
 
         return cls(
@@ -380,6 +432,7 @@ class Report:
             youtube_error=data.get('youtube_error'),
             from_cache=data.get('from_cache', False),
             cache_age_hours=data.get('cache_age_hours'),
+            cut_short=data.get('cut_short', []),
         )
 
 
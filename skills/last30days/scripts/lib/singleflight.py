@@ -0,0 +1,281 @@
+"""Request coalescing ("singleflight") for last30days skill.
+
+When several threads ask for the same thing at once (the same HTTP request,
+the same yt-dlp or Bird search), only the first one (the leader) does the
+work; the others wait for it and get a copy of its result. Phase 1 and
+Phase 2, concurrent watchlist topics and daemon requests often overlap like
+this.
+
+With LAST30DAYS_SINGLEFLIGHT=shared, leaders in different processes are
+coalesced too: the leader holds an flock on a file in the cache directory
+while it works and publishes a JSON result next to it, which processes
+that were waiting on the lock pick up instead of repeating the call. Only
+JSON-native results (dicts with string keys, lists, strings, numbers,
+booleans, None) are published, so waiters get exactly what the call
+returns; anything else (a tuple, say) is not shared, and each waiting
+process makes the call itself.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process coalescing only
+    fcntl = None
+
+from . import cache, deadline
+
+# How long a published cross-process result stays usable / on disk
+SHARED_RESULT_TTL = 60
+
+# Longest single wait before re-checking the run deadline
+_POLL_INTERVAL = 0.05
+
+_MISSING = object()
+
+
+def make_key(*parts: Any) -> str:
+    """Stable key for a call from its identifying parts (hashed)."""
+    blob = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def shared_enabled() -> bool:
+    """Whether cross-process coalescing is on (LAST30DAYS_SINGLEFLIGHT=shared)."""
+    return fcntl is not None and os.environ.get("LAST30DAYS_SINGLEFLIGHT", "").lower() == "shared"
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class Group:
+    """A set of in-flight calls, coalesced by key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: str, fn: Callable[..., Any], *args, shared: Optional[bool] = None) -> Any:
+        """Run fn(*args), or wait for an identical call already running.
+
+        Args:
+            key: Identifies the call (see make_key)
+            fn: The call
+            *args: Its arguments
+            shared: Also coalesce across processes (default: shared_enabled())
+
+        Returns:
+            fn's result; waiting callers get a deep copy of the leader's
+
+        Raises:
+            Whatever fn raised (waiting callers get the leader's exception),
+            or deadline.DeadlineExceeded if the caller's deadline passes
+            while it waits
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if leader:
+            try:
+                if shared if shared is not None else shared_enabled():
+                    result = _run_shared(key, fn, args)
+                else:
+                    result = fn(*args)
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                    waiters = call.waiters
+                # Waiters copy a snapshot, so the leader may mutate its result
+                if call.error is None and waiters:
+                    call.result = copy.deepcopy(result)
+                call.done.set()
+            return result
+
+        waiter_deadline = deadline.current()
+        while not call.done.wait(min(waiter_deadline.remaining(), _POLL_INTERVAL)):
+            waiter_deadline.check("waiting for an identical request")
+        if call.error is None:
+            return copy.deepcopy(call.result)
+        # The leader gave up for its own reasons (its deadline, an
+        # interrupt); a caller with time left makes the call itself
+        leader_quit = isinstance(call.error, deadline.DeadlineExceeded) or not isinstance(call.error, Exception)
+        if leader_quit and not waiter_deadline.expired():
+            return self.do(key, fn, *args, shared=shared)
+        raise call.error
+
+
+_group = Group()
+
+
+def do(key: str, fn: Callable[..., Any], *args, shared: Optional[bool] = None) -> Any:
+    """Group.do on the module's shared group."""
+    return _group.do(key, fn, *args, shared=shared)
+
+
+# ---------------------------------------------------------------------------
+# Cross-process coalescing
+# ---------------------------------------------------------------------------
+
+
+def _flight_dir() -> Path:
+    cache.ensure_cache_dir()
+    path = cache.CACHE_DIR / "inflight"
+    path.mkdir(exist_ok=True)
+    return path
+
+
+def _read_result(path: Path, since: float) -> Any:
+    try:
+        if path.stat().st_mtime < since:
+            return _MISSING
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return _MISSING
+
+
+def _json_native(value: Any) -> bool:
+    """Whether value survives a JSON round trip unchanged."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_json_native(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _json_native(v) for k, v in value.items())
+    return False
+
+
+def _same_file(fd: int, path: Path) -> bool:
+    """Whether fd is still the file at path (not one swept and recreated)."""
+    try:
+        return os.fstat(fd).st_ino == os.stat(path).st_ino
+    except OSError:
+        return False
+
+
+def _write_result(directory: Path, path: Path, result: Any):
+    tmp = None
+    if not _json_native(result):
+        # Would not round-trip (tuples, objects): waiters make the call themselves
+        return
+    try:
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        # Not serializable after all (or no disk): waiters make the call themselves
+        if tmp:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        return
+    _sweep(directory)
+
+
+def _sweep(directory: Path):
+    """Remove results nobody picked up, and lock files nobody holds."""
+    cutoff = time.time() - SHARED_RESULT_TTL
+    for old in directory.iterdir():
+        try:
+            if old.suffix not in (".json", ".lock") or old.stat().st_mtime >= cutoff:
+                continue
+            if old.suffix == ".json":
+                old.unlink()
+                continue
+            # A lock file may only go while we hold it; a leader on a long
+            # yt-dlp/Bird run still has it locked
+            fd = os.open(str(old), os.O_RDWR)
+        except OSError:
+            continue
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if _same_file(fd, old):
+                old.unlink()
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _acquire(path: Path, waited_since: list) -> int:
+    """Open and flock path, waiting for any other holder.
+
+    Returns:
+        The locked fd. If another process held the lock, waited_since gets
+        the time waiting began (so a fresh result can be picked up).
+    """
+    waiter_deadline = deadline.current()
+    while True:
+        fd = os.open(str(path), os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            if not waited_since:
+                # A result published just before we looked is fresh enough too
+                waited_since.append(time.time() - 1)
+            waiter_deadline.check("waiting for an identical request in another process")
+            time.sleep(_POLL_INTERVAL)
+            continue
+        except BaseException:
+            os.close(fd)
+            raise
+        if _same_file(fd, path):
+            return fd
+        # Swept and recreated while we waited: lock the current file instead
+        os.close(fd)
+
+
+def _run_shared(key: str, fn: Callable[..., Any], args: tuple) -> Any:
+    """Run fn under a cross-process lock, reusing another process's result."""
+    try:
+        directory = _flight_dir()
+    except OSError:
+        return fn(*args)
+    result_path = directory / f"{key}.json"
+    waited_since: list = []
+    try:
+        fd = _acquire(directory / f"{key}.lock", waited_since)
+    except OSError:
+        return fn(*args)
+    try:
+        if waited_since:
+            # Another process was making this call: use its result
+            result = _read_result(result_path, waited_since[0])
+            if result is not _MISSING:
+                return result
+        result = fn(*args)
+        _write_result(directory, result_path, result)
+        return result
+    finally:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
@@ -0,0 +1,183 @@
+"""On-disk YouTube transcript store for last30days skill.
+
+A video's auto-captions never change, so once a transcript has been fetched
+and cleaned it is kept for good, keyed by video_id, in transcripts.db in the
+cache directory: zlib-compressed cleaned text, with a SHA-256 of the text
+checked on read. Videos that turned out to have no captions get a negative
+marker instead, which expires (YouTube can add auto-captions a few hours
+after upload). The store has its own byte budget, enforced by evicting
+expired markers first and then least-recently-used transcripts.
+
+Every last30days process shares the store, so recurring watchlist topics
+and repeated agent queries skip yt-dlp for videos already seen.
+"""
+
+import hashlib
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from . import cache
+
+MAX_BYTES = cache.env_bytes("LAST30DAYS_TRANSCRIPT_MAX_BYTES", 64 * 1024 * 1024)
+
+# How long "this video has no captions" is trusted
+NEGATIVE_TTL_HOURS = 24
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id TEXT PRIMARY KEY,
+    body BLOB,
+    sha256 TEXT,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_transcripts_access ON transcripts(last_access);
+"""
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_path: Optional[Path] = None
+_lock = threading.Lock()
+
+
+def _log(msg: str):
+    """Log store problems to stderr."""
+    sys.stderr.write(f"[Transcripts] {msg}\n")
+    sys.stderr.flush()
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the transcripts.db connection (callers hold _lock)."""
+    global _conn, _conn_path
+    cache.ensure_cache_dir()
+    path = cache.CACHE_DIR / "transcripts.db"
+    if _conn is not None and _conn_path == path:
+        return _conn
+    if _conn is not None:
+        _conn.close()
+    conn = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+    conn.executescript(_SCHEMA)
+    _conn, _conn_path = conn, path
+    return conn
+
+
+def get(video_id: str) -> Tuple[bool, Optional[str]]:
+    """Look up a video's stored transcript.
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        (True, cleaned text) for a stored transcript, (True, None) for a
+        fresh "no captions" marker, (False, None) if the video must be
+        fetched
+    """
+    now = time.time()
+    try:
+        with _lock:
+            conn = _get_conn()
+            row = conn.execute(
+                "SELECT body, sha256, created_at FROM transcripts WHERE video_id = ?", (video_id,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            body, digest, created_at = row
+            if body is None and now - created_at >= NEGATIVE_TTL_HOURS * 3600:
+                return False, None
+            with conn:
+                conn.execute("UPDATE transcripts SET last_access = ? WHERE video_id = ?", (now, video_id))
+    except sqlite3.Error as e:
+        _log(f"Store unavailable: {e}")
+        return False, None
+
+    if body is None:
+        return True, None
+    try:
+        text = zlib.decompress(body).decode("utf-8")
+    except (zlib.error, UnicodeDecodeError):
+        return False, None
+    if hashlib.sha256(text.encode("utf-8")).hexdigest() != digest:
+        return False, None
+    return True, text
+
+
+def put(video_id: str, text: Optional[str]):
+    """Store a video's cleaned transcript, or a "no captions" marker.
+
+    Args:
+        video_id: YouTube video ID
+        text: Cleaned transcript text; None or "" records that the video
+            has no captions
+    """
+    now = time.time()
+    if text:
+        raw = text.encode("utf-8")
+        body, digest = zlib.compress(raw, 6), hashlib.sha256(raw).hexdigest()
+        size = len(body)
+    else:
+        body, digest, size = None, None, 0
+    try:
+        with _lock:
+            conn = _get_conn()
+            with conn:
+                conn.execute(
+                    """INSERT OR REPLACE INTO transcripts
+                       (video_id, body, sha256, size, created_at, last_access)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    (video_id, body, digest, size, now, now),
+                )
+                _evict(conn, MAX_BYTES, now)
+    except sqlite3.Error as e:
+        _log(f"Store unavailable: {e}")
+
+
+def _evict(conn: sqlite3.Connection, max_bytes: int, now: float):
+    """Trim the store to max_bytes: expired markers first, then LRU order."""
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM transcripts").fetchone()[0]
+    if total <= max_bytes:
+        return
+
+    conn.execute(
+        "DELETE FROM transcripts WHERE body IS NULL AND created_at < ?",
+        (now - NEGATIVE_TTL_HOURS * 3600,),
+    )
+    victims = []
+    for video_id, size in conn.execute(
+        "SELECT video_id, size FROM transcripts WHERE body IS NOT NULL ORDER BY last_access"
+    ):
+        if total <= max_bytes:
+            break
+        victims.append((video_id,))
+        total -= size
+    conn.executemany("DELETE FROM transcripts WHERE video_id = ?", victims)
+
+
+def stats() -> Dict[str, Any]:
+    """Transcript and marker counts and stored bytes."""
+    try:
+        with _lock:
+            transcripts, markers, total = _get_conn().execute(
+                """SELECT COUNT(body), COUNT(*) - COUNT(body), COALESCE(SUM(size), 0)
+                   FROM transcripts"""
+            ).fetchone()
+    except sqlite3.Error:
+        return {}
+    return {"transcripts": transcripts, "no_captions": markers, "bytes": total, "max_bytes": MAX_BYTES}
+
+
+def close():
+    """Close the transcripts.db connection (reopened lazily on next use)."""
+    global _conn, _conn_path
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+        _conn, _conn_path = None, None
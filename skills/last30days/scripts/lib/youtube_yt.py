@@ -2,6 +2,10 @@
 
 Uses yt-dlp (https://github.com/yt-dlp/yt-dlp) for both YouTube search and
 transcript extraction. No API keys needed — just have yt-dlp installed.
+When the yt_dlp package is importable it is driven in-process, so searches
+and transcript fetches skip yt-dlp's interpreter startup and extractor
+loading; otherwise (or with LAST30DAYS_YTDLP=subprocess) the `yt-dlp` CLI is
+run once per call.
 
 Inspired by Peter Steinberger's toolchain approach (yt-dlp + summarize CLI).
 """
@@ -15,9 +19,19 @@ import shutil
 import subprocess
 import sys
 import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import yt_dlp
+except ImportError:  # CLI backend only
+    yt_dlp = None
+
+from . import singleflight, transcript_store
+from .concurrency import AdaptiveLimit
+from .deadline import ThreadPoolExecutor, current as current_deadline
 
 # Depth configurations: how many videos to search / transcribe
 DEPTH_CONFIG = {
@@ -35,6 +49,53 @@ TRANSCRIPT_LIMITS = {
 # Max words to keep from each transcript
 TRANSCRIPT_MAX_WORDS = 500
 
+# Parallel transcript fetches: an adaptive limit starts here and may grow to
+# TRANSCRIPT_MAX_WORKERS while YouTube keeps up
+TRANSCRIPT_INITIAL_WORKERS = 4
+TRANSCRIPT_MAX_WORKERS = 8
+
+# While a streamed search is still running, transcripts are started early
+# for up to this multiple of the transcript limit (in-window videos, in the
+# order yt-dlp emits them); the final top-by-views pick reuses them
+TRANSCRIPT_PREFETCH_FACTOR = 2
+
+# Tries per video when YouTube rate-limits the subtitle download
+TRANSCRIPT_ATTEMPTS = 2
+
+# Wall-clock budgets (seconds) for one search and one subtitle download,
+# on either backend
+SEARCH_TIMEOUT = 120
+TRANSCRIPT_TIMEOUT = 30
+
+
+# Options for in-process YoutubeDL instances ("search" and "subtitles")
+_YDL_OPTIONS = {
+    "search": {},
+    "subtitles": {
+        "writeautomaticsub": True,
+        "subtitleslangs": ["en"],
+        "subtitlesformat": "vtt",
+        # Several requests have to fit in TRANSCRIPT_TIMEOUT
+        "socket_timeout": 10,
+    },
+}
+_YDL_COMMON_OPTIONS = {
+    "quiet": True,
+    "no_warnings": True,
+    "noprogress": True,
+    "skip_download": True,
+    "ignore_no_formats_error": True,
+    "socket_timeout": 30,
+}
+
+# YoutubeDL is not thread-safe: each thread keeps its own instances
+_ydl_local = threading.local()
+
+
+class TranscriptRateLimitError(Exception):
+    """yt-dlp reported HTTP 429 while fetching subtitles."""
+    status_code = 429
+
 
 def _log(msg: str):
     """Log to stderr."""
@@ -43,8 +104,48 @@ def _log(msg: str):
 
 
 def is_ytdlp_installed() -> bool:
-    """Check if yt-dlp is available in PATH."""
-    return shutil.which("yt-dlp") is not None
+    """Check if yt-dlp is available (importable, or in PATH)."""
+    return _use_inprocess() or shutil.which("yt-dlp") is not None
+
+
+def _use_inprocess() -> bool:
+    """Whether to drive yt_dlp in-process instead of running the CLI."""
+    return yt_dlp is not None and os.environ.get("LAST30DAYS_YTDLP", "").lower() != "subprocess"
+
+
+class _QuietLogger:
+    """Swallow yt-dlp's console output; failures surface as exceptions."""
+
+    def debug(self, msg):
+        pass
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        pass
+
+
+def _ydl(kind: str, budget: Optional[float] = None):
+    """This thread's YoutubeDL instance for kind (see _YDL_OPTIONS).
+
+    With less than one socket timeout of budget (seconds) left, a one-off
+    instance whose socket timeout fits the budget is returned instead.
+    """
+    options = dict(_YDL_COMMON_OPTIONS, logger=_QuietLogger())
+    options.update(_YDL_OPTIONS[kind])
+    if budget is not None and budget < options["socket_timeout"]:
+        options["socket_timeout"] = max(1.0, budget)
+        return yt_dlp.YoutubeDL(options)
+    instances = getattr(_ydl_local, "instances", None)
+    if instances is None:
+        instances = _ydl_local.instances = {}
+    if kind not in instances:
+        instances[kind] = yt_dlp.YoutubeDL(options)
+    return instances[kind]
 
 
 def _extract_core_subject(topic: str) -> str:
@@ -93,6 +194,8 @@ def search_youtube(
 ) -> Dict[str, Any]:
     """Search YouTube via yt-dlp. No API key needed.
 
+    Identical searches running at the same time share one yt-dlp process.
+
     Args:
         topic: Search topic
         from_date: Start date (YYYY-MM-DD)
@@ -102,6 +205,22 @@ def search_youtube(
     Returns:
         Dict with 'items' list of video metadata dicts.
     """
+    key = singleflight.make_key("yt-dlp search", _extract_core_subject(topic), from_date, depth)
+    return singleflight.do(key, _search_youtube, topic, from_date, depth)
+
+
+def _search_youtube(
+    topic: str,
+    from_date: str,
+    depth: str,
+    on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """search_youtube() without coalescing.
+
+    Args:
+        on_item: Optional callback, given each video item as soon as yt-dlp
+            emits it (before the date filter and sort)
+    """
     if not is_ytdlp_installed():
         return {"items": [], "error": "yt-dlp not installed"}
 
@@ -110,6 +229,45 @@ def search_youtube(
 
     _log(f"Searching YouTube for '{core_topic}' (since {from_date}, count={count})")
 
+    items = []
+
+    def on_video(video: Dict[str, Any]):
+        item = _video_item(video, core_topic)
+        items.append(item)
+        if on_item:
+            on_item(item)
+
+    search = _search_inprocess if _use_inprocess() else _search_subprocess
+    error = search(core_topic, count, on_video)
+    if error and not items:
+        return {"items": [], "error": error}
+    if not items:
+        _log("YouTube search returned 0 results")
+        return {"items": []}
+
+    # Soft date filter: prefer recent items but fall back to all if too few
+    recent = [i for i in items if i["date"] and i["date"] >= from_date]
+    if len(recent) >= 3:
+        items = recent
+        _log(f"Found {len(items)} videos within date range")
+    else:
+        _log(f"Found {len(items)} videos ({len(recent)} within date range, keeping all)")
+
+    # Sort by views descending
+    items.sort(key=lambda x: x["engagement"]["views"], reverse=True)
+
+    return {"items": items}
+
+
+def _search_subprocess(core_topic: str, count: int, on_video: Callable[[Dict[str, Any]], None]) -> Optional[str]:
+    """Run `yt-dlp ytsearchN:`, handing each JSON line to on_video as it arrives.
+
+    yt-dlp prints one video per line as soon as it has extracted it, so
+    callers can start work on early results while the search continues.
+
+    Returns:
+        Error message, or None (videos emitted before a timeout are kept)
+    """
     # yt-dlp search with full metadata (no --flat-playlist so dates are real).
     # No --dateafter — we filter by date in Python with a soft fallback,
     # because YouTube search returns relevance-sorted results and strict date
@@ -128,77 +286,120 @@ def search_youtube(
         proc = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
+            bufsize=1,
             preexec_fn=preexec,
         )
-        try:
-            stdout, stderr = proc.communicate(timeout=120)
-        except subprocess.TimeoutExpired:
-            try:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-            except (ProcessLookupError, PermissionError, OSError):
-                proc.kill()
-            proc.wait(timeout=5)
-            _log("YouTube search timed out (120s)")
-            return {"items": [], "error": "Search timed out"}
     except FileNotFoundError:
-        return {"items": [], "error": "yt-dlp not found"}
+        return "yt-dlp not found"
 
-    if not (stdout or "").strip():
-        _log("YouTube search returned 0 results")
-        return {"items": []}
+    timed_out = threading.Event()
 
-    # Parse JSON-per-line output
-    items = []
-    for line in stdout.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
+    def kill():
         try:
-            video = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        video_id = video.get("id", "")
-        view_count = video.get("view_count") or 0
-        like_count = video.get("like_count") or 0
-        comment_count = video.get("comment_count") or 0
-        upload_date = video.get("upload_date", "")  # YYYYMMDD
-
-        # Convert YYYYMMDD to YYYY-MM-DD
-        date_str = None
-        if upload_date and len(upload_date) == 8:
-            date_str = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
-
-        items.append({
-            "video_id": video_id,
-            "title": video.get("title", ""),
-            "url": f"https://www.youtube.com/watch?v={video_id}",
-            "channel_name": video.get("channel", video.get("uploader", "")),
-            "date": date_str,
-            "engagement": {
-                "views": view_count,
-                "likes": like_count,
-                "comments": comment_count,
-            },
-            "duration": video.get("duration"),
-            "relevance": 0.7,  # Default; no LLM relevance scoring for YouTube
-            "why_relevant": f"YouTube video about {core_topic}",
-        })
-
-    # Soft date filter: prefer recent items but fall back to all if too few
-    recent = [i for i in items if i["date"] and i["date"] >= from_date]
-    if len(recent) >= 3:
-        items = recent
-        _log(f"Found {len(items)} videos within date range")
-    else:
-        _log(f"Found {len(items)} videos ({len(recent)} within date range, keeping all)")
-
-    # Sort by views descending
-    items.sort(key=lambda x: x["engagement"]["views"], reverse=True)
+            os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+        except (ProcessLookupError, PermissionError, OSError):
+            proc.kill()
+
+    def on_timeout():
+        timed_out.set()
+        kill()
+
+    # Reading stdout blocks, so the timeout kills the process instead
+    timer = threading.Timer(current_deadline().cap(SEARCH_TIMEOUT), on_timeout)
+    timer.daemon = True
+    timer.start()
+    try:
+        for line in proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                video = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            on_video(video)
+    except BaseException:
+        kill()
+        raise
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+        proc.wait(timeout=5)
+
+    if timed_out.is_set():
+        _log(f"YouTube search timed out ({SEARCH_TIMEOUT}s)")
+        return "Search timed out"
+    return None
+
+
+def _search_inprocess(core_topic: str, count: int, on_video: Callable[[Dict[str, Any]], None]) -> Optional[str]:
+    """Resolve `ytsearchN:` with yt_dlp in-process, one video at a time.
+
+    Like the CLI, each result gets its full metadata and is handed to
+    on_video as soon as it is extracted; the run deadline and the
+    SEARCH_TIMEOUT budget are checked between videos, every request's
+    socket timeout is capped by the budget left, and videos that fail to
+    extract are skipped.
 
-    return {"items": items}
+    Returns:
+        Error message, or None (videos extracted before a timeout are kept)
+    """
+    budget = current_deadline().child(SEARCH_TIMEOUT)
+    ydl = _ydl("search", budget.remaining())
+    try:
+        playlist = ydl.extract_info(f"ytsearch{count}:{core_topic}", download=False, process=False)
+        # Entries are produced lazily, page by page
+        entries = list((playlist or {}).get("entries") or [])
+    except Exception as e:
+        return f"yt-dlp search failed: {e}"
+
+    for done, entry in enumerate(entries):
+        if current_deadline().expired():
+            _log(f"Run deadline reached, keeping {done} videos")
+            break
+        if budget.expired():
+            _log(f"YouTube search timed out ({SEARCH_TIMEOUT}s), keeping {done} videos")
+            return "Search timed out"
+        ydl = _ydl("search", budget.remaining())
+        try:
+            video = ydl.extract_info(entry.get("url") or entry.get("id"), download=False, ie_key=entry.get("ie_key"))
+        except Exception:
+            continue
+        if video:
+            on_video(video)
+    return None
+
+
+def _video_item(video: Dict[str, Any], core_topic: str) -> Dict[str, Any]:
+    """Map one yt-dlp video info dict to a search item."""
+    video_id = video.get("id", "")
+    view_count = video.get("view_count") or 0
+    like_count = video.get("like_count") or 0
+    comment_count = video.get("comment_count") or 0
+    upload_date = video.get("upload_date", "")  # YYYYMMDD
+
+    # Convert YYYYMMDD to YYYY-MM-DD
+    date_str = None
+    if upload_date and len(upload_date) == 8:
+        date_str = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
+
+    return {
+        "video_id": video_id,
+        "title": video.get("title", ""),
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "channel_name": video.get("channel", video.get("uploader", "")),
+        "date": date_str,
+        "engagement": {
+            "views": view_count,
+            "likes": like_count,
+            "comments": comment_count,
+        },
+        "duration": video.get("duration"),
+        "relevance": 0.7,  # Default; no LLM relevance scoring for YouTube
+        "why_relevant": f"YouTube video about {core_topic}",
+    }
 
 
 def _clean_vtt(vtt_text: str) -> str:
@@ -226,12 +427,61 @@ def _clean_vtt(vtt_text: str) -> str:
 def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
     """Fetch auto-generated transcript for a YouTube video.
 
+    Served from the transcript store when the video has been seen before.
+
     Args:
         video_id: YouTube video ID
         temp_dir: Temporary directory for subtitle files
 
     Returns:
         Plaintext transcript string, or None if no captions available.
+
+    Raises:
+        TranscriptRateLimitError: If YouTube answered 429
+    """
+    stored, text = transcript_store.get(video_id)
+    if not stored:
+        text = _download_transcript(video_id, temp_dir)
+    return _truncate_transcript(text)
+
+
+def _download_transcript(video_id: str, temp_dir: str) -> Optional[str]:
+    """Download and clean a video's captions, recording the outcome in the store.
+
+    Returns:
+        Full cleaned text ("" if the video has no captions), or None if the
+        download failed (nothing is stored then)
+    """
+    if current_deadline().expired():
+        return None
+
+    if _use_inprocess():
+        raw = _fetch_vtt_inprocess(video_id)
+    else:
+        raw = _fetch_vtt_subprocess(video_id, temp_dir)
+    if raw is None:
+        return None
+
+    text = _clean_vtt(raw) if raw else ""
+    transcript_store.put(video_id, text)
+    return text
+
+
+def _truncate_transcript(text: Optional[str]) -> Optional[str]:
+    """Cut a cleaned transcript to TRANSCRIPT_MAX_WORDS (None if empty)."""
+    if not text:
+        return None
+    words = text.split()
+    if len(words) > TRANSCRIPT_MAX_WORDS:
+        return ' '.join(words[:TRANSCRIPT_MAX_WORDS]) + '...'
+    return text
+
+
+def _fetch_vtt_subprocess(video_id: str, temp_dir: str) -> Optional[str]:
+    """Download a video's English auto-captions with the yt-dlp CLI.
+
+    Returns:
+        VTT text, "" if the video has none, or None if yt-dlp failed
     """
     cmd = [
         "yt-dlp",
@@ -255,7 +505,7 @@ def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
             preexec_fn=preexec,
         )
         try:
-            proc.communicate(timeout=30)
+            _, stderr = proc.communicate(timeout=current_deadline().cap(TRANSCRIPT_TIMEOUT))
         except subprocess.TimeoutExpired:
             try:
                 os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
@@ -265,6 +515,10 @@ def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
             return None
     except FileNotFoundError:
         return None
+    if "HTTP Error 429" in (stderr or ""):
+        raise TranscriptRateLimitError(f"YouTube rate limited (429) fetching subtitles for {video_id}")
+    if proc.returncode != 0:
+        return None
 
     # yt-dlp may save as .en.vtt or .en-orig.vtt
     vtt_path = Path(temp_dir) / f"{video_id}.en.vtt"
@@ -274,26 +528,120 @@ def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
             vtt_path = p
             break
         else:
-            return None
+            return ""  # yt-dlp succeeded: there are no English captions
 
     try:
-        raw = vtt_path.read_text(encoding="utf-8", errors="replace")
+        return vtt_path.read_text(encoding="utf-8", errors="replace")
     except OSError:
         return None
 
-    transcript = _clean_vtt(raw)
 
-    # Truncate to max words
-    words = transcript.split()
-    if len(words) > TRANSCRIPT_MAX_WORDS:
-        transcript = ' '.join(words[:TRANSCRIPT_MAX_WORDS]) + '...'
+def _fetch_vtt_inprocess(video_id: str) -> Optional[str]:
+    """Fetch a video's English auto-captions with yt_dlp in-process.
+
+    Socket timeouts are capped by what is left of TRANSCRIPT_TIMEOUT, and a
+    download that runs past it counts as failed, as on the CLI path.
+
+    Returns:
+        VTT text, "" if the video has none, or None if extraction failed
+    """
+    budget = current_deadline().child(TRANSCRIPT_TIMEOUT)
+    try:
+        ydl = _ydl("subtitles", budget.remaining())
+        info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+        if budget.expired():
+            return None
+        track = ((info or {}).get("requested_subtitles") or {}).get("en")
+        if not track:
+            return "" if info else None
+        if track.get("data") is not None:
+            return track["data"]
+        ydl = _ydl("subtitles", budget.remaining())
+        with ydl.urlopen(track["url"]) as response:
+            return response.read().decode("utf-8", errors="replace")
+    except Exception as e:
+        if "HTTP Error 429" in str(e):
+            raise TranscriptRateLimitError(f"YouTube rate limited (429) fetching subtitles for {video_id}") from e
+        return None
+
+
+def _fetch_transcript_limited(video_id: str, temp_dir: str, limiter: AdaptiveLimit) -> Optional[str]:
+    """fetch_transcript through the adaptive limiter, retrying after a 429.
+
+    Stored transcripts are returned without taking a slot.
+    """
+    stored, text = transcript_store.get(video_id)
+    if stored:
+        return _truncate_transcript(text)
+    for attempt in range(TRANSCRIPT_ATTEMPTS):
+        try:
+            return _truncate_transcript(limiter.run(_download_transcript, video_id, temp_dir))
+        except TranscriptRateLimitError:
+            if attempt == TRANSCRIPT_ATTEMPTS - 1:
+                raise
 
-    return transcript if transcript else None
+
+class _TranscriptPool:
+    """Transcript fetches sharing one adaptive limit, submitted as videos turn up.
+
+    Parallelism adapts (see concurrency.AdaptiveLimit): it starts at
+    TRANSCRIPT_INITIAL_WORKERS, grows while fetches stay fast and halves
+    when YouTube rate-limits or slows down.
+    """
+
+    def __init__(self, max_workers: int = TRANSCRIPT_MAX_WORKERS):
+        self._limiter = AdaptiveLimit(TRANSCRIPT_INITIAL_WORKERS, maximum=max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._temp_dir = tempfile.mkdtemp(prefix="last30days-subs-")
+        self._futures: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self._futures
+
+    def submit(self, video_id: str):
+        """Start fetching a video's transcript (once per video)."""
+        if video_id not in self._futures:
+            self._futures[video_id] = self._executor.submit(
+                _fetch_transcript_limited, video_id, self._temp_dir, self._limiter,
+            )
+
+    def results(self, video_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Wait for the transcripts of video_ids (starting any not yet started)."""
+        for vid in video_ids:
+            self.submit(vid)
+        futures = {self._futures[vid]: vid for vid in video_ids}
+        results = {}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception:
+                results[futures[future]] = None
+        return results
+
+    def close(self):
+        """Drop queued fetches nobody waited for; clean up once running ones end."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+        def cleanup():
+            self._executor.shutdown(wait=True)
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+
+        threading.Thread(target=cleanup, name="transcript-cleanup", daemon=True).start()
+
+    def __enter__(self) -> "_TranscriptPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
 
 
 def fetch_transcripts_parallel(
     video_ids: List[str],
-    max_workers: int = 5,
+    max_workers: int = TRANSCRIPT_MAX_WORKERS,
 ) -> Dict[str, Optional[str]]:
     """Fetch transcripts for multiple videos in parallel.
 
@@ -309,19 +657,8 @@ def fetch_transcripts_parallel(
 
     _log(f"Fetching transcripts for {len(video_ids)} videos")
 
-    results = {}
-    with tempfile.TemporaryDirectory() as temp_dir:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(fetch_transcript, vid, temp_dir): vid
-                for vid in video_ids
-            }
-            for future in as_completed(futures):
-                vid = futures[future]
-                try:
-                    results[vid] = future.result()
-                except Exception:
-                    results[vid] = None
+    with _TranscriptPool(max_workers) as pool:
+        results = pool.results(video_ids)
 
     got = sum(1 for v in results.values() if v)
     _log(f"Got transcripts for {got}/{len(video_ids)} videos")
@@ -333,29 +670,57 @@ def search_and_transcribe(
     from_date: str,
     to_date: str,
     depth: str = "default",
+    stream: bool = True,
 ) -> Dict[str, Any]:
     """Full YouTube search: find videos, then fetch transcripts for top results.
 
+    Identical calls running at the same time share one search.
+
     Args:
         topic: Search topic
         from_date: Start date (YYYY-MM-DD)
         to_date: End date (YYYY-MM-DD)
         depth: 'quick', 'default', or 'deep'
+        stream: Start transcript fetches for videos inside the date window
+            while the search is still running, instead of after it
 
     Returns:
         Dict with 'items' list. Each item has a 'transcript_snippet' field.
     """
-    # Step 1: Search
-    search_result = search_youtube(topic, from_date, to_date, depth)
-    items = search_result.get("items", [])
+    key = singleflight.make_key(
+        "yt-dlp search+transcripts", _extract_core_subject(topic), from_date, depth, stream,
+    )
+    return singleflight.do(key, _search_and_transcribe, topic, from_date, depth, stream)
 
-    if not items:
-        return search_result
 
-    # Step 2: Fetch transcripts for top N by views
+def _search_and_transcribe(topic: str, from_date: str, depth: str, stream: bool) -> Dict[str, Any]:
+    """search_and_transcribe() without coalescing."""
     transcript_limit = TRANSCRIPT_LIMITS.get(depth, TRANSCRIPT_LIMITS["default"])
-    top_ids = [item["video_id"] for item in items[:transcript_limit]]
-    transcripts = fetch_transcripts_parallel(top_ids)
+
+    with _TranscriptPool() as pool:
+        on_item = None
+        if stream:
+            prefetch = transcript_limit * TRANSCRIPT_PREFETCH_FACTOR
+
+            def on_item(item: Dict[str, Any]):
+                if item["date"] and item["date"] >= from_date and len(pool) < prefetch:
+                    pool.submit(item["video_id"])
+
+        # Step 1: Search (streamed videos start their transcripts right away)
+        search_result = _search_youtube(topic, from_date, depth, on_item)
+        items = search_result.get("items", [])
+
+        if not items:
+            return search_result
+
+        # Step 2: Transcripts for top N by views
+        top_ids = [item["video_id"] for item in items[:transcript_limit]]
+        started = sum(1 for vid in top_ids if vid in pool)
+        _log(f"Fetching transcripts for {len(top_ids)} videos ({started} already started)")
+        transcripts = pool.results(top_ids)
+
+    got = sum(1 for v in transcripts.values() if v)
+    _log(f"Got transcripts for {got}/{len(top_ids)} videos")
 
     # Step 3: Attach transcripts to items
     for item in items:
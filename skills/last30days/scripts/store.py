@@ -6,17 +6,21 @@ Stores topics, research runs, and findings with:
 - FTS5 full-text search with porter+unicode61 tokenizer
 - URL-based dedup with engagement metric updates on re-sighting
 - Lightweight schema migrations without external dependencies
+- One long-lived, tuned connection per thread (see connection())
 
 Database location: ~/.local/share/last30days/research.db
 """
 
 import argparse
+import atexit
 import json
 import sqlite3
 import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 DB_DIR = Path.home() / ".local" / "share" / "last30days"
 DB_PATH = DB_DIR / "research.db"
@@ -129,24 +133,145 @@ INSERT OR IGNORE INTO settings (key, value) VALUES ('default_schedule', '0 8 * *
 
 # Future migrations keyed by version number
 MIGRATIONS: Dict[int, str] = {
-    # 2: "ALTER TABLE findings ADD COLUMN tags TEXT DEFAULT '[]';",
+    # Only re-index FTS when indexed columns change, not on every re-sighting
+    2: """
+DROP TRIGGER IF EXISTS findings_au;
+CREATE TRIGGER findings_au AFTER UPDATE OF content, summary, source_title, author ON findings BEGIN
+    INSERT INTO findings_fts(findings_fts, rowid, content, summary, source_title, author)
+    VALUES ('delete', old.id, old.content, old.summary, old.source_title, old.author);
+    INSERT INTO findings_fts(rowid, content, summary, source_title, author)
+    VALUES (new.id, new.content, new.summary, new.source_title, new.author);
+END;
+""",
 }
 
+# Per-connection staging table for store_findings
+STAGED_FINDINGS = """
+CREATE TEMP TABLE IF NOT EXISTS staged_findings (
+    seq INTEGER PRIMARY KEY,
+    source TEXT,
+    source_url TEXT,
+    source_title TEXT,
+    author TEXT,
+    content TEXT,
+    summary TEXT,
+    engagement_score REAL,
+    relevance_score REAL
+)
+"""
+
+
+# Connection tuning, applied once per connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-64000",  # 64 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA temp_store=MEMORY",
+)
+# Prepared statements kept per connection (sqlite3's statement cache)
+STATEMENT_CACHE_SIZE = 256
+
+_local = threading.local()
+_open_conns: List[sqlite3.Connection] = []
+_open_lock = threading.Lock()
+_initialized_paths = set()
+
 
 def _connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
-    """Open a connection with WAL mode and row factory."""
+    """Open a new tuned connection with WAL mode and row factory.
+
+    Most callers want connection(), which reuses one connection per thread.
+    """
     path = db_path or _get_db_path()
-    conn = sqlite3.connect(str(path))
+    conn = sqlite3.connect(
+        str(path),
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=False,  # only so close_all() can close it at exit
+    )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA synchronous=NORMAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _thread_connection() -> sqlite3.Connection:
+    """This thread's long-lived connection to the current database."""
+    path = _get_db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path != path:
+        _close_thread_connection()
+        conn = None
+    if conn is None:
+        conn = _connect(path)
+        _local.conn, _local.path, _local.depth = conn, path, 0
+        with _open_lock:
+            _open_conns.append(conn)
     return conn
 
 
+def _close_thread_connection():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        return
+    with _open_lock:
+        if conn in _open_conns:
+            _open_conns.remove(conn)
+    conn.close()
+    _local.conn = None
+
+
+@contextmanager
+def connection() -> Iterator[sqlite3.Connection]:
+    """Use this thread's connection; commit on success, roll back on error.
+
+    Nested blocks share the connection and the outermost block commits, so
+    a batch of store calls can be wrapped in one transaction.
+    """
+    conn = _thread_connection()
+    _local.depth += 1
+    try:
+        yield conn
+    except BaseException:
+        if _local.depth == 1:
+            conn.rollback()
+        raise
+    else:
+        if _local.depth == 1:
+            conn.commit()
+    finally:
+        _local.depth -= 1
+
+
+def close():
+    """Close the calling thread's connection."""
+    _close_thread_connection()
+
+
+def close_all():
+    """Close every connection opened by this process."""
+    with _open_lock:
+        conns, _open_conns[:] = list(_open_conns), []
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(close_all)
+
+
 def init_db(db_path: Optional[Path] = None) -> Path:
-    """Create database and tables if they don't exist. Returns the DB path."""
+    """Create database and tables if they don't exist. Returns the DB path.
+
+    Runs once per database per process; later calls return immediately.
+    """
     path = db_path or _get_db_path()
+    if path in _initialized_paths:
+        return path
     path.parent.mkdir(parents=True, exist_ok=True)
 
     conn = _connect(path)
@@ -158,6 +283,7 @@ def init_db(db_path: Optional[Path] = None) -> Path:
     finally:
         conn.close()
 
+    _initialized_paths.add(path)
     return path
 
 
@@ -185,8 +311,7 @@ def add_topic(
 ) -> Dict[str, Any]:
     """Add a topic to the watchlist. Returns the topic dict."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         queries_json = json.dumps(search_queries) if search_queries else None
         conn.execute(
             """INSERT INTO topics (name, search_queries, schedule)
@@ -197,20 +322,16 @@ def add_topic(
                    updated_at = datetime('now')""",
             (name, queries_json, schedule),
         )
-        conn.commit()
         row = conn.execute(
             "SELECT * FROM topics WHERE name = ?", (name,)
         ).fetchone()
         return dict(row)
-    finally:
-        conn.close()
 
 
 def remove_topic(name: str) -> bool:
     """Remove a topic from the watchlist. Returns True if found."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         row = conn.execute(
             "SELECT id FROM topics WHERE name = ?", (name,)
         ).fetchone()
@@ -221,17 +342,13 @@ def remove_topic(name: str) -> bool:
         conn.execute("DELETE FROM findings WHERE topic_id = ?", (topic_id,))
         conn.execute("DELETE FROM research_runs WHERE topic_id = ?", (topic_id,))
         conn.execute("DELETE FROM topics WHERE id = ?", (topic_id,))
-        conn.commit()
         return True
-    finally:
-        conn.close()
 
 
 def list_topics() -> List[Dict[str, Any]]:
     """List all topics with stats."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         rows = conn.execute(
             """SELECT t.*,
                       (SELECT COUNT(*) FROM findings WHERE topic_id = t.id) as finding_count,
@@ -242,21 +359,16 @@ def list_topics() -> List[Dict[str, Any]]:
                ORDER BY t.name"""
         ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 def get_topic(name: str) -> Optional[Dict[str, Any]]:
     """Get a topic by name."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         row = conn.execute(
             "SELECT * FROM topics WHERE name = ?", (name,)
         ).fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
 # --- Research Runs ---
@@ -273,8 +385,7 @@ def record_run(
     token_cost: float = 0,
 ) -> int:
     """Record a research run. Returns the run ID."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         cursor = conn.execute(
             """INSERT INTO research_runs
                (topic_id, run_date, source_mode, status, error_message,
@@ -285,22 +396,15 @@ def record_run(
                 duration_seconds, prompt_tokens, completion_tokens, token_cost,
             ),
         )
-        conn.commit()
         return cursor.lastrowid
-    finally:
-        conn.close()
 
 
 def update_run(run_id: int, **kwargs):
     """Update a research run's fields."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         sets = ", ".join(f"{k} = ?" for k in kwargs)
         values = list(kwargs.values()) + [run_id]
         conn.execute(f"UPDATE research_runs SET {sets} WHERE id = ?", values)
-        conn.commit()
-    finally:
-        conn.close()
 
 
 # --- Findings ---
@@ -311,69 +415,71 @@ def store_findings(
     topic_id: int,
     findings: List[Dict[str, Any]],
 ) -> Dict[str, int]:
-    """Store findings with URL-based dedup. Returns counts of new/updated."""
-    conn = _connect()
-    new_count = 0
-    updated_count = 0
+    """Store findings with URL-based dedup. Returns counts of new/updated.
+
+    The batch is staged in a temp table, new vs. existing URLs are counted
+    with one join, and everything is written by a single
+    INSERT ... ON CONFLICT(source_url) DO UPDATE. A URL repeated within the
+    batch counts as new once and as updated for each repeat.
+    """
+    rows = []
+    for f in findings:
+        url = f.get("source_url") or f.get("url")
+        if not url:
+            continue
+        rows.append((
+            len(rows),
+            f.get("source", "unknown"),
+            url,
+            f.get("source_title") or f.get("title", ""),
+            f.get("author", ""),
+            f.get("content") or f.get("text", ""),
+            f.get("summary", ""),
+            f.get("engagement_score", 0),
+            f.get("relevance_score", 0),
+        ))
+
+    with connection() as conn:
+        conn.execute(STAGED_FINDINGS)
+        conn.execute("DELETE FROM staged_findings")
+        conn.executemany(
+            "INSERT INTO staged_findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows,
+        )
 
-    try:
-        for f in findings:
-            url = f.get("source_url") or f.get("url")
-            if not url:
-                continue
-
-            existing = conn.execute(
-                "SELECT id, engagement_score, sighting_count FROM findings WHERE source_url = ?",
-                (url,),
-            ).fetchone()
-
-            if existing:
-                # Update engagement and re-sighting info
-                new_engagement = f.get("engagement_score", 0)
-                conn.execute(
-                    """UPDATE findings SET
-                           last_seen = datetime('now'),
-                           sighting_count = sighting_count + 1,
-                           engagement_score = ?,
-                           run_id = ?
-                       WHERE id = ?""",
-                    (
-                        max(new_engagement, existing["engagement_score"] or 0),
-                        run_id,
-                        existing["id"],
-                    ),
-                )
-                updated_count += 1
-            else:
-                # New finding
-                conn.execute(
-                    """INSERT INTO findings
-                       (run_id, topic_id, source, source_url, source_title,
-                        author, content, summary, engagement_score, relevance_score)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        run_id,
-                        topic_id,
-                        f.get("source", "unknown"),
-                        url,
-                        f.get("source_title") or f.get("title", ""),
-                        f.get("author", ""),
-                        f.get("content") or f.get("text", ""),
-                        f.get("summary", ""),
-                        f.get("engagement_score", 0),
-                        f.get("relevance_score", 0),
-                    ),
-                )
-                new_count += 1
+        distinct_urls, existing_urls = conn.execute(
+            """SELECT COUNT(DISTINCT s.source_url), COUNT(DISTINCT f.source_url)
+               FROM staged_findings s
+               LEFT JOIN findings f ON f.source_url = s.source_url"""
+        ).fetchone()
+        new_count = distinct_urls - existing_urls
+        updated_count = len(rows) - new_count
+
+        # Re-sightings bump last_seen/sighting_count and keep the best
+        # engagement seen so far
+        conn.execute(
+            """INSERT INTO findings
+               (run_id, topic_id, source, source_url, source_title,
+                author, content, summary, engagement_score, relevance_score)
+               SELECT ?, ?, source, source_url, source_title,
+                      author, content, summary, engagement_score, relevance_score
+               FROM staged_findings WHERE true ORDER BY seq
+               ON CONFLICT(source_url) DO UPDATE SET
+                   last_seen = datetime('now'),
+                   sighting_count = sighting_count + 1,
+                   engagement_score = MAX(
+                       COALESCE(excluded.engagement_score, 0),
+                       COALESCE(findings.engagement_score, 0)
+                   ),
+                   run_id = excluded.run_id""",
+            (run_id, topic_id),
+        )
+        conn.execute("DELETE FROM staged_findings")
 
         # Update run stats
         conn.execute(
             "UPDATE research_runs SET findings_new = ?, findings_updated = ? WHERE id = ?",
             (new_count, updated_count, run_id),
         )
-        conn.commit()
-    finally:
-        conn.close()
 
     return {"new": new_count, "updated": updated_count}
 
@@ -383,8 +489,7 @@ def get_new_findings(
     since: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """Get findings for a topic, optionally since a date."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         if since:
             rows = conn.execute(
                 """SELECT * FROM findings
@@ -400,14 +505,11 @@ def get_new_findings(
                 (topic_id,),
             ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 def search_findings(query: str, limit: int = 20) -> List[Dict[str, Any]]:
     """FTS5 search across all findings with BM25 ranking."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         rows = conn.execute(
             """SELECT f.*, bm25(findings_fts) as rank, t.name as topic_name
                FROM findings_fts
@@ -419,30 +521,20 @@ def search_findings(query: str, limit: int = 20) -> List[Dict[str, Any]]:
             (query, limit),
         ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 def update_finding(finding_id: int, **kwargs):
     """Update a finding's fields."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         sets = ", ".join(f"{k} = ?" for k in kwargs)
         values = list(kwargs.values()) + [finding_id]
         conn.execute(f"UPDATE findings SET {sets} WHERE id = ?", values)
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def delete_finding(finding_id: int):
     """Delete a finding."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         conn.execute("DELETE FROM findings WHERE id = ?", (finding_id,))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def dismiss_finding(finding_id: int):
@@ -455,8 +547,7 @@ def dismiss_finding(finding_id: int):
 
 def get_daily_cost(date: Optional[str] = None) -> float:
     """Get total token cost for a given day (default: today)."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         if not date:
             date = datetime.now().strftime("%Y-%m-%d")
         row = conn.execute(
@@ -466,8 +557,29 @@ def get_daily_cost(date: Optional[str] = None) -> float:
             (date,),
         ).fetchone()
         return row["total"]
-    finally:
-        conn.close()
+
+
+def get_topic_run_stats(days: int = 30) -> Dict[int, Dict[str, Any]]:
+    """Per-topic run history used to schedule watchlist runs.
+
+    Returns:
+        {topic_id: {"last_success", "avg_new", "avg_cost", "runs"}} over
+        the last `days` days; topics with no runs have None/0 values
+    """
+    with connection() as conn:
+        rows = conn.execute(
+            """SELECT t.id AS topic_id,
+                      MAX(CASE WHEN r.status = 'completed' THEN r.run_date END) AS last_success,
+                      AVG(CASE WHEN r.status = 'completed' THEN r.findings_new END) AS avg_new,
+                      AVG(CASE WHEN r.status = 'completed' THEN r.token_cost END) AS avg_cost,
+                      COUNT(r.id) AS runs
+               FROM topics t
+               LEFT JOIN research_runs r
+                   ON r.topic_id = t.id AND r.run_date >= datetime('now', ?)
+               GROUP BY t.id""",
+            (f"-{days} days",),
+        ).fetchall()
+        return {r["topic_id"]: dict(r) for r in rows}
 
 
 # --- Settings ---
@@ -476,21 +588,17 @@ def get_daily_cost(date: Optional[str] = None) -> float:
 def get_setting(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get a setting value."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         row = conn.execute(
             "SELECT value FROM settings WHERE key = ?", (key,)
         ).fetchone()
         return row["value"] if row else default
-    finally:
-        conn.close()
 
 
 def set_setting(key: str, value: str):
     """Set a setting value."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         conn.execute(
             """INSERT INTO settings (key, value, updated_at)
                VALUES (?, ?, datetime('now'))
@@ -499,9 +607,6 @@ def set_setting(key: str, value: str):
                    updated_at = datetime('now')""",
             (key, value),
         )
-        conn.commit()
-    finally:
-        conn.close()
 
 
 # --- Stats ---
@@ -509,8 +614,7 @@ def set_setting(key: str, value: str):
 
 def get_stats() -> Dict[str, Any]:
     """Get overall database stats."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         topic_count = conn.execute("SELECT COUNT(*) FROM topics WHERE enabled = 1").fetchone()[0]
         finding_count = conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
 
@@ -552,14 +656,11 @@ def get_stats() -> Dict[str, Any]:
             "sources": sources,
             "daily_budget": get_setting("daily_budget", "5.00"),
         }
-    finally:
-        conn.close()
 
 
 def get_trending(days: int = 7) -> List[Dict[str, Any]]:
     """Get topics ranked by recent finding activity."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
         rows = conn.execute(
             """SELECT t.name, t.id,
@@ -573,8 +674,6 @@ def get_trending(days: int = 7) -> List[Dict[str, Any]]:
             (since,),
         ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 # --- CLI interface ---
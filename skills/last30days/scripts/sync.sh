@@ -21,7 +21,7 @@ for t in "${TARGETS[@]}"; do
   cp "$SRC/SKILL.md" "$t/"
 
   # Main script
-  cp "$SRC/scripts/last30days.py" "$t/scripts/"
+  cp "$SRC/scripts/last30days.py" "$SRC/scripts/last30days_client.py" "$t/scripts/"
 
   # All lib modules
   cp "$SRC/scripts/lib/"*.py "$t/scripts/lib/"
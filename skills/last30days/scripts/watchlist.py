@@ -9,7 +9,7 @@ Usage:
     python3 watchlist.py add "NVIDIA news" --weekly
     python3 watchlist.py remove "AI video tools"
     python3 watchlist.py list
-    python3 watchlist.py run-all
+    python3 watchlist.py run-all [--jobs 4] [--isolate]
     python3 watchlist.py run-one "AI video tools"
     python3 watchlist.py config delivery telegram
     python3 watchlist.py config budget 10.00
@@ -17,17 +17,42 @@ Usage:
 
 import argparse
 import json
-import subprocess
+import math
+import multiprocessing
+import os
+import signal
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(SCRIPT_DIR))
 
 import store
 
+# Topic launches allowed per provider per minute in `run-all --jobs N`
+PROVIDER_LAUNCHES_PER_MINUTE = {
+    "openai": 12,
+    "reddit": 6,  # thread enrichment hits reddit.com directly
+    "xai": 12,
+    "bird": 6,
+    "youtube": 8,
+}
+# Reserved against daily_budget for a topic with no recorded cost (no runs,
+# or only runs that recorded a token_cost of 0)
+DEFAULT_RUN_COST = 0.05
+# Per-topic research deadline; sources still running then are cut short
+TOPIC_TIMEOUT = 300
+# Extra time a --isolate worker gets to return its partial report before it
+# is killed
+TOPIC_KILL_GRACE = 30
+
 
 def cmd_add(args):
     """Add a topic to the watchlist."""
@@ -89,8 +114,135 @@ def cmd_run_one(args):
     _run_topic(topic)
 
 
+class BudgetLedger:
+    """Tracks today's spend plus costs reserved by runs still in flight.
+
+    A topic reserves its estimated cost before it launches, so parallel
+    runs cannot overshoot daily_budget between cost checks.
+    """
+
+    def __init__(self, limit: float, spent: float):
+        self.limit = limit
+        self.spent = spent
+        self.reserved = 0.0
+        self._lock = threading.Lock()
+
+    def committed(self) -> float:
+        with self._lock:
+            return self.spent + self.reserved
+
+    def reserve(self, amount: float) -> bool:
+        """Reserve amount if it fits under the limit."""
+        with self._lock:
+            if self.spent + self.reserved >= self.limit:
+                return False
+            if amount and self.spent + self.reserved + amount > self.limit:
+                return False
+            self.reserved += amount
+            return True
+
+    def settle(self, amount: float, spent: float):
+        """Release a reservation and record the latest actual spend."""
+        with self._lock:
+            self.reserved = max(0.0, self.reserved - amount)
+            self.spent = spent
+
+
+class ProviderRateLimiter:
+    """Token buckets limiting topic launches per provider per minute."""
+
+    def __init__(self, per_minute: Dict[str, int], clock=time.monotonic, sleep=time.sleep):
+        self.per_minute = per_minute
+        self._clock = clock
+        self._sleep = sleep
+        now = clock()
+        self._tokens = {p: float(n) for p, n in per_minute.items()}
+        self._updated = {p: now for p in per_minute}
+        self._lock = threading.Lock()
+
+    def _refill(self, provider: str, now: float):
+        rate = self.per_minute[provider] / 60.0
+        capacity = float(self.per_minute[provider])
+        elapsed = now - self._updated[provider]
+        self._tokens[provider] = min(capacity, self._tokens[provider] + elapsed * rate)
+        self._updated[provider] = now
+
+    def acquire(self, providers: Iterable[str]):
+        """Block until every provider has a launch token, then take them."""
+        providers = [p for p in providers if p in self.per_minute]
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = 0.0
+                for p in providers:
+                    self._refill(p, now)
+                    if self._tokens[p] < 1:
+                        wait = max(wait, (1 - self._tokens[p]) * 60.0 / self.per_minute[p])
+                if wait == 0.0:
+                    for p in providers:
+                        self._tokens[p] -= 1
+                    return
+            self._sleep(wait)
+
+
+def _topic_providers() -> List[str]:
+    """Providers a research run will call, given the current config."""
+    from lib import env
+
+    config = env.get_config()
+    providers = []
+    if config.get("OPENAI_API_KEY"):
+        providers += ["openai", "reddit"]
+    x_source = env.get_x_source(config)
+    if x_source:
+        providers.append(x_source)
+    if env.is_ytdlp_available():
+        providers.append("youtube")
+    return providers
+
+
+def _prioritize(topics: List[dict], stats: Dict[int, dict], now: Optional[datetime] = None) -> List[dict]:
+    """Order topics by staleness, weighted by how much they usually yield.
+
+    Topics without a successful run in the stats window go first.
+    """
+    # run_date is stored as naive UTC (SQLite datetime('now'))
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def priority(topic):
+        st = stats.get(topic["id"]) or {}
+        last = st.get("last_success")
+        if not last:
+            return (1, 0.0)
+        try:
+            stale_hours = (now - datetime.fromisoformat(last)).total_seconds() / 3600
+        except ValueError:
+            return (1, 0.0)
+        return (0, max(stale_hours, 0.0) * (1 + math.log1p(st.get("avg_new") or 0)))
+
+    return sorted(topics, key=priority, reverse=True)
+
+
+def _estimate_cost(stats: Dict[int, dict], topic: dict) -> float:
+    """Expected cost of a run: the topic's average, else the watchlist's.
+
+    A zero average counts as unknown: runs that never recorded a cost store
+    token_cost 0, and reserving 0 would never hold a launch back.
+    """
+    st = stats.get(topic["id"]) or {}
+    if st.get("avg_cost"):
+        return st["avg_cost"]
+    known = [v["avg_cost"] for v in stats.values() if v.get("avg_cost")]
+    return sum(known) / len(known) if known else DEFAULT_RUN_COST
+
+
 def cmd_run_all(args):
-    """Run research for all enabled topics with budget guard."""
+    """Run research for all enabled topics with budget guard.
+
+    Topics run stalest first (weighted by historical yield), up to --jobs at
+    a time. Each reserves its estimated cost against daily_budget before it
+    launches, and launches are rate-limited per provider.
+    """
     topics = store.list_topics()
     enabled = [t for t in topics if t["enabled"]]
 
@@ -98,22 +250,40 @@ def cmd_run_all(args):
         print(json.dumps({"message": "No enabled topics to research."}))
         return
 
+    jobs = max(1, getattr(args, "jobs", 1) or 1)
     budget_limit = float(store.get_setting("daily_budget", "5.00"))
-    results = []
-
-    for topic in enabled:
-        # Budget guard
-        daily_cost = store.get_daily_cost()
-        if daily_cost >= budget_limit:
-            results.append({
-                "topic": topic["name"],
-                "status": "skipped",
-                "reason": f"Budget exceeded: ${daily_cost:.2f}/${budget_limit:.2f}",
-            })
-            continue
-
-        result = _run_topic(topic)
-        results.append(result)
+    stats = store.get_topic_run_stats()
+    ordered = _prioritize(enabled, stats)
+    ledger = BudgetLedger(budget_limit, store.get_daily_cost())
+    limiter = ProviderRateLimiter(PROVIDER_LAUNCHES_PER_MINUTE)
+    providers = _topic_providers() if jobs > 1 else []
+    slots = threading.Semaphore(jobs)
+    results: List[Optional[dict]] = [None] * len(ordered)
+    workers = WorkerPool(jobs) if getattr(args, "isolate", False) else None
+
+    def run(i: int, topic: dict, estimate: float):
+        try:
+            results[i] = _run_topic(topic, workers)
+        finally:
+            ledger.settle(estimate, store.get_daily_cost())
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for i, topic in enumerate(ordered):
+            slots.acquire()
+            estimate = _estimate_cost(stats, topic)
+            if not ledger.reserve(estimate):
+                slots.release()
+                results[i] = {
+                    "topic": topic["name"],
+                    "status": "skipped",
+                    "reason": f"Budget exceeded: ${ledger.committed():.2f}/${budget_limit:.2f}",
+                }
+                continue
+            limiter.acquire(providers)
+            pool.submit(run, i, topic, estimate)
+    if workers:
+        workers.shutdown()
 
     print(json.dumps({
         "action": "run_all",
@@ -123,8 +293,96 @@ def cmd_run_all(args):
     }, default=str))
 
 
-def _run_topic(topic: dict) -> dict:
-    """Run research for a single topic and store findings."""
+def _research_findings(name: str, deadline_seconds: float = TOPIC_TIMEOUT) -> List[dict]:
+    """Research a topic in this process and return store findings.
+
+    Sources still running after deadline_seconds are cut short, so one hung
+    topic cannot stall `run-all`.
+    """
+    import last30days
+
+    report = last30days.research_topic(name, deadline_seconds=deadline_seconds)
+    return last30days.findings_from_report(report)
+
+
+def _report_worker_pid(pids):
+    """WorkerPool initializer: tell the parent this worker's PID."""
+    pids.put(os.getpid())
+
+
+class WorkerPool:
+    """Worker processes for `run-all --isolate`.
+
+    Workers are reused across topics. If one dies or hangs past its
+    timeout, the pool is torn down (its processes killed; topics it was
+    running fail) and replaced for the topics that follow. Each worker
+    reports its PID when it starts, so killing them doesn't depend on
+    ProcessPoolExecutor internals.
+    """
+
+    def __init__(self, size: int, target=None):
+        self.size = size
+        self._target = target or _research_findings
+        self._lock = threading.Lock()
+        self._pool, self._pids = self._new_pool()
+
+    def _new_pool(self):
+        """A fresh executor, and the (queue, seen) pair its workers report PIDs to."""
+        queue = multiprocessing.SimpleQueue()
+        pool = ProcessPoolExecutor(max_workers=self.size, initializer=_report_worker_pid, initargs=(queue,))
+        return pool, (queue, [])
+
+    def worker_pids(self, pids=None) -> List[int]:
+        """PIDs of the workers the current pool (or the given pids pair) has started."""
+        if pids is None:
+            with self._lock:
+                pids = self._pids
+        queue, seen = pids
+        while not queue.empty():
+            seen.append(queue.get())
+        return list(seen)
+
+    def research(self, name: str, timeout: float) -> List[dict]:
+        with self._lock:
+            pool = self._pool
+        try:
+            future = pool.submit(self._target, name, timeout)
+            return future.result(timeout=timeout + TOPIC_KILL_GRACE)
+        except FuturesTimeoutError:
+            self._replace(pool, kill=True)
+            raise
+        except BrokenProcessPool:
+            self._replace(pool)
+            raise
+
+    def _replace(self, pool: ProcessPoolExecutor, kill: bool = False):
+        """Swap in a fresh pool for `pool`, killing its workers if asked."""
+        with self._lock:
+            if self._pool is not pool:
+                return  # another topic already replaced it
+            pids = self._pids
+            self._pool, self._pids = self._new_pool()
+        worker_pids = self.worker_pids(pids)
+        pool.shutdown(wait=False, cancel_futures=True)
+        if kill:
+            for pid in worker_pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    pass  # already exited
+
+    def shutdown(self):
+        with self._lock:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_topic(topic: dict, workers: Optional[WorkerPool] = None) -> dict:
+    """Run research for a single topic and store findings.
+
+    Research runs in-process, sharing HTTP connections, caches and the DB
+    connection with every other topic. With `workers`, it runs in that
+    worker-process pool instead, so a crash only takes down one worker.
+    """
     start_time = time.time()
     topic_id = topic["id"]
 
@@ -132,63 +390,13 @@ def _run_topic(topic: dict) -> dict:
     run_id = store.record_run(topic_id, source_mode="both", status="running")
 
     try:
-        # Run the research script
-        cmd = [
-            sys.executable,
-            str(SCRIPT_DIR / "last30days.py"),
-            topic["name"],
-            "--emit=json",
-        ]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
+        if workers is not None:
+            findings = workers.research(topic["name"], TOPIC_TIMEOUT)
+        else:
+            findings = _research_findings(topic["name"], TOPIC_TIMEOUT)
 
         duration = time.time() - start_time
 
-        if result.returncode != 0:
-            store.update_run(
-                run_id,
-                status="failed",
-                error_message=result.stderr[:500],
-                duration_seconds=duration,
-            )
-            return {
-                "topic": topic["name"],
-                "status": "failed",
-                "error": result.stderr[:200],
-                "duration": duration,
-            }
-
-        # Parse research output
-        data = json.loads(result.stdout)
-
-        # Convert research items to findings format
-        findings = []
-        for item in data.get("reddit", []):
-            findings.append({
-                "source": "reddit",
-                "url": item.get("url", ""),
-                "title": item.get("title", ""),
-                "author": item.get("author", ""),
-                "content": item.get("title", ""),
-                "summary": item.get("top_comments_summary", ""),
-                "engagement_score": item.get("upvotes", 0),
-                "relevance_score": item.get("relevance", 0),
-            })
-        for item in data.get("x", []):
-            findings.append({
-                "source": "x",
-                "url": item.get("url", ""),
-                "title": item.get("text", "")[:100],
-                "author": item.get("author_handle", ""),
-                "content": item.get("text", ""),
-                "engagement_score": (item.get("engagement") or {}).get("likes", 0),
-                "relevance_score": item.get("relevance", 0),
-            })
-
         # Store with dedup
         counts = store.store_findings(run_id, topic_id, findings)
 
@@ -208,23 +416,23 @@ def _run_topic(topic: dict) -> dict:
             "duration": duration,
         }
 
-    except subprocess.TimeoutExpired:
+    except FuturesTimeoutError:
         duration = time.time() - start_time
         store.update_run(
             run_id, status="failed",
-            error_message="Research timed out after 300s",
+            error_message=f"Research timed out after {TOPIC_TIMEOUT}s",
             duration_seconds=duration,
         )
         return {"topic": topic["name"], "status": "failed", "error": "timeout"}
 
-    except json.JSONDecodeError as e:
+    except BrokenProcessPool as e:
         duration = time.time() - start_time
         store.update_run(
             run_id, status="failed",
-            error_message=f"Invalid JSON output: {e}",
+            error_message=f"Research worker crashed: {e}"[:500],
             duration_seconds=duration,
         )
-        return {"topic": topic["name"], "status": "failed", "error": f"parse error: {e}"}
+        return {"topic": topic["name"], "status": "failed", "error": "worker crashed"}
 
     except Exception as e:
         duration = time.time() - start_time
@@ -271,6 +479,9 @@ def main():
 
     # run-all
     ra = sub.add_parser("run-all", help="Run research for all enabled topics")
+    ra.add_argument("--jobs", type=int, default=1, help="Topics to research concurrently (default: 1)")
+    ra.add_argument("--isolate", action="store_true",
+                    help="Research in a pool of worker processes so a crash cannot stop the run")
     ra.set_defaults(func=cmd_run_all)
 
     # run-one
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark near-duplicate detection: exact pairwise loop vs MinHash/LSH.
+
+Usage:
+    python3 tests/bench_dedupe.py [--sizes 100,1000,10000] [--max-exact N]
+
+Items are synthetic Reddit-style titles; about one in five is a light
+rewrite of an earlier title, so there are real duplicates to find. Recall
+is the share of the exact loop's pairs that the LSH path also reports.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import dedupe, schema
+
+
+def make_vocab(size: int = 3000, seed: int = 3) -> list:
+    """Pseudo-words; picked with Zipf-like weights, like real titles."""
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(2, 9))) for _ in range(size)]
+
+
+WORDS = make_vocab()
+WEIGHTS = [1 / (rank + 1) for rank in range(len(WORDS))]
+
+
+def make_items(n: int, seed: int = 7) -> list:
+    """Build n titles, ~20% of them near-duplicates of earlier ones."""
+    rng = random.Random(seed)
+    titles = []
+    for i in range(n):
+        if titles and rng.random() < 0.2:
+            words = rng.choice(titles).split()
+            words[rng.randrange(len(words))] = rng.choices(WORDS, WEIGHTS)[0]
+            if rng.random() < 0.5:
+                words.append(rng.choices(WORDS, WEIGHTS)[0])
+            titles.append(" ".join(words))
+        else:
+            titles.append(" ".join(rng.choices(WORDS, WEIGHTS, k=rng.randint(6, 12))))
+    return [
+        schema.RedditItem(id=f"R{i}", title=t, url="", subreddit="")
+        for i, t in enumerate(titles)
+    ]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--max-exact", type=int, default=10000,
+                        help="Skip the exact loop above this many items")
+    args = parser.parse_args()
+
+    bands, rows = dedupe.lsh_params(args.threshold)
+    print(f"threshold={args.threshold} num_perm={dedupe.NUM_PERM} bands={bands} rows={rows}")
+    print(f"{'items':>7} {'exact s':>9} {'lsh s':>9} {'speedup':>8} {'pairs':>7} {'recall':>7}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        items = make_items(n)
+        ngrams = [dedupe.get_ngrams(dedupe.get_item_text(item)) for item in items]
+        lsh_pairs, lsh_s = timed(dedupe.find_duplicates_lsh, ngrams, args.threshold)
+        if n <= args.max_exact:
+            exact_pairs, exact_s = timed(dedupe.find_duplicates_exact, ngrams, args.threshold)
+            found = len(set(exact_pairs) & set(lsh_pairs))
+            recall = found / len(exact_pairs) if exact_pairs else 1.0
+            print(f"{n:>7} {exact_s:>9.3f} {lsh_s:>9.3f} {exact_s / lsh_s:>7.1f}x "
+                  f"{len(exact_pairs):>7} {recall:>7.3f}")
+        else:
+            print(f"{n:>7} {'-':>9} {lsh_s:>9.3f} {'-':>8} {len(lsh_pairs):>7} {'-':>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Tests for bird_x module."""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import bird_x
+
+# Speaks the worker protocol: the query decides what happens
+FAKE_WORKER = r'''
+import json, os, sys, threading, time
+
+lock = threading.Lock()
+
+def handle(line):
+    request = json.loads(line)
+    query = request["params"].get("query", "")
+    if query == "crash":
+        os._exit(1)
+    if query.startswith("sleep "):
+        time.sleep(float(query.split()[1]))
+    if query == "fail":
+        reply = {"id": request["id"], "error": "search failed"}
+    else:
+        tweet = {"id": "1", "text": query, "author": {"username": "pid%d" % os.getpid()}}
+        reply = {"id": request["id"], "result": [tweet]}
+    with lock:
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+
+for line in sys.stdin:
+    threading.Thread(target=handle, args=(line,)).start()
+'''
+
+
+class TestAuthProbe(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(setattr, bird_x, "_auth_probe", None)
+        bird_x._auth_probe = None
+        self.now = 1000.0
+        for patcher in (
+            mock.patch.object(bird_x, "is_bird_installed", return_value=True),
+            mock.patch.object(bird_x, "time", mock.Mock(monotonic=lambda: self.now)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_failed_check_retried_soon(self):
+        with mock.patch.object(bird_x, "_probe_bird_auth", side_effect=[None, "cookies"]) as probe:
+            self.assertIsNone(bird_x.is_bird_authenticated())
+            self.assertIsNone(bird_x.is_bird_authenticated())
+            self.now += bird_x.AUTH_PROBE_NEGATIVE_TTL
+            self.assertEqual(bird_x.is_bird_authenticated(), "cookies")
+        self.assertEqual(probe.call_count, 2)
+
+    def test_success_trusted_for_full_ttl(self):
+        with mock.patch.object(bird_x, "_probe_bird_auth", return_value="cookies") as probe:
+            bird_x.is_bird_authenticated()
+            self.now += bird_x.AUTH_PROBE_TTL - 1
+            self.assertEqual(bird_x.is_bird_authenticated(), "cookies")
+        self.assertEqual(probe.call_count, 1)
+
+
+class TestBirdWorker(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        script = Path(self._tmp.name) / "worker.py"
+        script.write_text(FAKE_WORKER)
+        self.worker = bird_x.BirdWorker([sys.executable, str(script)])
+
+    def tearDown(self):
+        self.worker.close()
+        self._tmp.cleanup()
+
+    def search(self, query, timeout=10):
+        return self.worker.call("search", {"query": query, "count": 1}, timeout)
+
+    def test_concurrent_queries_share_one_process(self):
+        results = []
+
+        def run(i):
+            results.append(self.search(f"sleep 0.3 #{i}"))
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertLess(time.monotonic() - started, 1.2)
+        self.assertEqual(sorted(r["result"][0]["text"] for r in results), [f"sleep 0.3 #{i}" for i in range(5)])
+        self.assertEqual(len({r["result"][0]["author"]["username"] for r in results}), 1)
+
+    def test_error_reply(self):
+        self.assertEqual(self.search("fail")["error"], "search failed")
+
+    def test_timeout_returns_none(self):
+        self.assertIsNone(self.search("sleep 1", timeout=0.1))
+
+    def test_restarts_after_crash(self):
+        self.search("hello")
+        first = self.worker.pid
+        with self.assertRaises(bird_x.BirdWorkerError):
+            self.search("crash")
+        self.assertEqual(self.search("again")["result"][0]["text"], "again")
+        self.assertNotEqual(self.worker.pid, first)
+
+
+class TestBirdSearch(unittest.TestCase):
+    def test_falls_back_to_spawn_when_worker_cannot_start(self):
+        worker = bird_x.BirdWorker(["/nonexistent/node"])
+        spawned = [{"id": "9"}]
+        with mock.patch.object(bird_x, "get_worker", return_value=worker), \
+                mock.patch.object(bird_x, "_spawn_bird_search", return_value=spawned) as spawn:
+            self.assertEqual(bird_x._bird_search("q", 5, 10), spawned)
+        spawn.assert_called_once_with("q", 5, 10)
+
+    def test_worker_disabled_by_env(self):
+        with mock.patch.dict(os.environ, {"LAST30DAYS_BIRD_WORKER": "0"}):
+            self.assertIsNone(bird_x.get_worker())
+
+
+def tweet(author, n=1):
+    return {"id": str(n), "text": f"t{n}", "author": {"username": author}}
+
+
+class TestSearchHandles(unittest.TestCase):
+    def test_merged_query_split_by_author(self):
+        response = [tweet("alice", 1), tweet("bob", 2), tweet("alice", 3), tweet("alice", 4), tweet("eve", 5)]
+        with mock.patch.object(bird_x, "_run_bird_search", return_value=response[:3]) as search:
+            items = bird_x.search_handles(["@alice", "bob", "Alice"], "claude code", "2026-01-01", count_per=2)
+        query, count, _ = search.call_args.args
+        self.assertEqual(search.call_count, 1)
+        self.assertEqual(query, "(from:alice OR from:bob) claude code since:2026-01-01")
+        self.assertEqual(count, 4)
+        self.assertEqual([(i["author_handle"], i["text"]) for i in items], [("alice", "t1"), ("alice", "t3"), ("bob", "t2")])
+
+    def test_crowded_out_handles_topped_up(self):
+        def search(query, count, timeout):
+            if query.startswith("("):
+                # A full page, all from the prolific handle
+                return [tweet("loud", n) for n in range(count)]
+            return [tweet(query.split()[0][len("from:"):], 100 + n) for n in range(count)]
+
+        with mock.patch.object(bird_x, "_run_bird_search", side_effect=search) as mocked:
+            items = bird_x.search_handles(["loud", "quiet"], "topic", "2026-01-01", count_per=2)
+        queries = [c.args[0] for c in mocked.call_args_list]
+        self.assertEqual(queries[1:], ["from:quiet topic since:2026-01-01"])
+        self.assertEqual([(i["author_handle"], i["text"]) for i in items],
+                         [("loud", "t0"), ("loud", "t1"), ("quiet", "t100"), ("quiet", "t101")])
+
+    def test_unmerged_searches_run_concurrently(self):
+        def slow_search(query, count, timeout):
+            time.sleep(0.3)
+            return [tweet(query.split()[0][len("from:"):])]
+
+        started = time.monotonic()
+        with mock.patch.object(bird_x, "_run_bird_search", side_effect=slow_search) as search:
+            items = bird_x.search_handles(["a", "b", "c", "d"], "topic", "2026-01-01", merge=False)
+        self.assertLess(time.monotonic() - started, 0.9)
+        self.assertEqual(search.call_count, 4)
+        self.assertEqual([i["author_handle"] for i in items], ["a", "b", "c", "d"])
+
+    def test_budget_keeps_finished_searches(self):
+        def search(query, count, timeout):
+            if query.startswith("from:slow"):
+                time.sleep(1)
+            return [tweet(query.split()[0][len("from:"):])]
+
+        with mock.patch.object(bird_x, "_run_bird_search", side_effect=search):
+            items = bird_x.search_handles(["fast", "slow"], "topic", "2026-01-01", merge=False, budget=0.3)
+        self.assertEqual([i["author_handle"] for i in items], ["fast"])
+
+    def test_failed_batches_are_skipped(self):
+        def search(query, count, timeout):
+            if "from:bad" in query:
+                return {"error": "rate limited", "items": []}
+            return [tweet("good")]
+
+        with mock.patch.object(bird_x, "_run_bird_search", side_effect=search):
+            items = bird_x.search_handles(["@bad", "good"], "claude code", "2026-01-01", merge=False)
+        self.assertEqual([item["author_handle"] for item in items], ["good"])
+
+
+@unittest.skipUnless(shutil.which("node"), "node not installed")
+class TestVendoredWorker(unittest.TestCase):
+    def test_ping(self):
+        worker = bird_x.BirdWorker()
+        try:
+            self.assertEqual(worker.call("ping", {}, 15)["result"], "pong")
+        finally:
+            worker.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
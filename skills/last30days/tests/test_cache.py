@@ -1,8 +1,14 @@
 """Tests for cache module."""
 
+import json
+import os
+import sqlite3
 import sys
+import tempfile
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -30,6 +36,23 @@ class TestGetCacheKey(unittest.TestCase):
         self.assertEqual(len(key), 16)
 
 
+class TestGetSourceCacheKey(unittest.TestCase):
+    def test_consistent_for_same_inputs(self):
+        key1 = cache.get_source_cache_key("topic", "2026-01-01", "2026-01-31", "reddit", "default", "gpt-5")
+        key2 = cache.get_source_cache_key("topic", "2026-01-01", "2026-01-31", "reddit", "default", "gpt-5")
+        self.assertEqual(key1, key2)
+
+    def test_differs_by_source_depth_and_model(self):
+        base = cache.get_source_cache_key("topic", "2026-01-01", "2026-01-31", "reddit", "default", "gpt-5")
+        self.assertNotEqual(base, cache.get_source_cache_key("topic", "2026-01-01", "2026-01-31", "x", "default", "gpt-5"))
+        self.assertNotEqual(base, cache.get_source_cache_key("topic", "2026-01-01", "2026-01-31", "reddit", "deep", "gpt-5"))
+        self.assertNotEqual(base, cache.get_source_cache_key("topic", "2026-01-01", "2026-01-31", "reddit", "default", "gpt-4o"))
+
+    def test_none_model(self):
+        key = cache.get_source_cache_key("topic", "2026-01-01", "2026-01-31", "youtube", "quick", None)
+        self.assertEqual(len(key), 16)
+
+
 class TestCachePath(unittest.TestCase):
     def test_returns_path(self):
         result = cache.get_cache_path("abc123")
@@ -47,6 +70,113 @@ class TestCacheValidity(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._saved = (cache.CACHE_DIR, cache.MODEL_CACHE_FILE, cache.CACHE_DB_FILE, cache.CACHE_MAX_BYTES)
+        self._env = os.environ.pop("LAST30DAYS_CACHE_DIR", None)
+        cache.close()
+        cache.CACHE_DIR = Path(self._tmp.name)
+        cache.MODEL_CACHE_FILE = cache.CACHE_DIR / "model_selection.json"
+        cache.CACHE_DB_FILE = cache.CACHE_DIR / "results.db"
+
+    def tearDown(self):
+        cache.close()
+        cache.CACHE_DIR, cache.MODEL_CACHE_FILE, cache.CACHE_DB_FILE, cache.CACHE_MAX_BYTES = self._saved
+        if self._env is not None:
+            os.environ["LAST30DAYS_CACHE_DIR"] = self._env
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        cache.save_cache("k1", {"items": [1, 2, 3]})
+        data, age = cache.load_cache_with_age("k1")
+        self.assertEqual(data, {"items": [1, 2, 3]})
+        self.assertLess(age, 0.01)
+
+    def test_single_file(self):
+        cache.save_cache("k1", {"a": 1})
+        cache.save_cache("k2", {"b": 2})
+        self.assertEqual(list(cache.CACHE_DIR.glob("*.json")), [])
+        self.assertTrue(cache.CACHE_DB_FILE.exists())
+
+    def test_ttl_respected(self):
+        cache.save_cache("k1", {"a": 1})
+        self.assertEqual(cache.load_cache_with_age("k1", ttl_hours=0), (None, None))
+        self.assertIsNotNone(cache.load_cache("k1"))
+
+    def test_hit_miss_counters(self):
+        cache.save_cache("k1", {"a": 1})
+        cache.load_cache("k1")
+        cache.load_cache("missing")
+        stats = cache.get_cache_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 1)
+
+    def test_lookups_do_not_wait_for_writers(self):
+        cache.save_cache("k1", {"a": 1})
+        writer = sqlite3.connect(str(cache.CACHE_DB_FILE), timeout=0)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            started = time.monotonic()
+            self.assertEqual(cache.load_cache("k1"), {"a": 1})
+            self.assertLess(time.monotonic() - started, 1)
+        finally:
+            writer.rollback()
+            writer.close()
+        self.assertEqual(cache.get_cache_stats()["hits"], 1)
+
+    def test_lru_eviction_over_budget(self):
+        payload = {"text": "x" * 100}
+        size = len(json.dumps(payload))
+        cache.CACHE_MAX_BYTES = size * 2
+        cache.save_cache("old", payload)
+        time.sleep(0.01)
+        cache.save_cache("recent", payload)
+        time.sleep(0.01)
+        cache.load_cache("old")  # "old" is now most recently used
+        time.sleep(0.01)
+        cache.save_cache("new", payload)
+        self.assertIsNotNone(cache.load_cache("old"))
+        self.assertIsNone(cache.load_cache("recent"))
+        self.assertIsNotNone(cache.load_cache("new"))
+        self.assertEqual(cache.get_cache_stats()["evictions"], 1)
+
+    def test_expired_evicted_first(self):
+        payload = {"text": "x" * 100}
+        cache.CACHE_MAX_BYTES = len(json.dumps(payload)) * 2
+        cache.save_cache("expired", payload, ttl_hours=-1)
+        cache.save_cache("a", payload)
+        cache.load_cache("a")
+        cache.save_cache("b", payload)
+        self.assertIsNone(cache.load_cache("expired", ttl_hours=float("inf")))
+        self.assertIsNotNone(cache.load_cache("a"))
+
+    def test_migrates_legacy_json(self):
+        (cache.CACHE_DIR / "abc123.json").write_text(json.dumps({"legacy": True}))
+        cache.MODEL_CACHE_FILE.write_text(json.dumps({"openai": "gpt-5"}))
+        self.assertEqual(cache.load_cache("abc123"), {"legacy": True})
+        self.assertFalse((cache.CACHE_DIR / "abc123.json").exists())
+        self.assertTrue(cache.MODEL_CACHE_FILE.exists())
+
+    def test_clear_cache(self):
+        cache.save_cache("k1", {"a": 1})
+        cache.clear_cache()
+        self.assertIsNone(cache.load_cache("k1"))
+
+
+class TestEnvBytes(unittest.TestCase):
+    def test_parses_value(self):
+        with mock.patch.dict(os.environ, {"LAST30DAYS_TEST_BYTES": "1024"}):
+            self.assertEqual(cache.env_bytes("LAST30DAYS_TEST_BYTES", 5), 1024)
+
+    def test_invalid_falls_back_to_default(self):
+        for raw in ("", "64MB", "-1", "0"):
+            with mock.patch.dict(os.environ, {"LAST30DAYS_TEST_BYTES": raw}), \
+                    mock.patch("sys.stderr"):
+                self.assertEqual(cache.env_bytes("LAST30DAYS_TEST_BYTES", 5), 5)
+
+
 class TestModelCache(unittest.TestCase):
     def test_get_cached_model_returns_none_for_missing(self):
         # Clear any existing cache first
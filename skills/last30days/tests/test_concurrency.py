@@ -0,0 +1,100 @@
+"""Tests for concurrency module."""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import concurrency, deadline, http
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestOverloadDelay(unittest.TestCase):
+    def test_classifies_errors(self):
+        self.assertEqual(concurrency.overload_delay(http.HTTPError("x", 429, retry_after=7)), 7)
+        self.assertEqual(concurrency.overload_delay(http.HTTPError("x", 503)), 0)
+        self.assertIsNone(concurrency.overload_delay(http.HTTPError("x", 404)))
+        self.assertIsNone(concurrency.overload_delay(ValueError("x")))
+
+
+class TestAdaptiveLimit(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limit = concurrency.AdaptiveLimit(4, maximum=8, clock=self.clock)
+
+    def _call(self, latency=0.1, overload=None):
+        started = self.limit.acquire()
+        self.clock.now += latency
+        self.limit.release(started, overload)
+
+    def test_additive_increase(self):
+        for _ in range(4):
+            self._call()
+        self.assertAlmostEqual(self.limit.limit, 5, delta=0.2)
+        for _ in range(200):
+            self._call()
+        self.assertEqual(self.limit.limit, 8)
+
+    def test_multiplicative_decrease_once_per_round(self):
+        a = self.limit.acquire()
+        b = self.limit.acquire()
+        self.clock.now += 0.1
+        self.limit.release(a, 0)
+        self.limit.release(b, 0)
+        self.assertEqual(self.limit.limit, 2)
+        self.clock.now += concurrency.DEFAULT_COOLDOWN
+        self._call(overload=0)
+        self.assertEqual(self.limit.limit, 1)
+
+    def test_slow_calls_back_off(self):
+        for _ in range(3):
+            self._call(0.1)
+        before = self.limit.limit
+        self._call(1.0)
+        self.assertLess(self.limit.limit, before)
+
+    def test_retry_after_pauses_acquire(self):
+        limit = concurrency.AdaptiveLimit(4)
+        limit.release(limit.acquire(), 0.3)
+        start = time.monotonic()
+        limit.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.25)
+
+    def test_blocks_at_limit(self):
+        limit = concurrency.AdaptiveLimit(1)
+        started = limit.acquire()
+        acquired = threading.Event()
+        threading.Thread(target=lambda: (limit.acquire(), acquired.set()), daemon=True).start()
+        self.assertFalse(acquired.wait(0.1))
+        limit.release(started)
+        self.assertTrue(acquired.wait(1))
+
+    def test_acquire_respects_deadline(self):
+        limit = concurrency.AdaptiveLimit(1)
+        limit.acquire()
+        with deadline.active(deadline.Deadline(0.1)):
+            with self.assertRaises(deadline.DeadlineExceeded):
+                limit.acquire()
+
+    def test_run_reports_overload(self):
+        def rate_limited():
+            raise http.HTTPError("x", 429, retry_after=0)
+        with self.assertRaises(http.HTTPError):
+            self.limit.run(rate_limited)
+        self.assertEqual(self.limit.limit, 2)
+        self.assertEqual(self.limit.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
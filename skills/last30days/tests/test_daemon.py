@@ -0,0 +1,124 @@
+"""Tests for daemon module."""
+
+import contextvars
+import io
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import cache, daemon
+
+_flag = contextvars.ContextVar("flag", default="unset")
+
+
+def fake_cli(argv):
+    if argv == ["flag"]:
+        print(_flag.get())
+        _flag.set("set")
+        return
+    if argv == ["fail"]:
+        print("bad topic", file=sys.stderr)
+        sys.exit(3)
+    if argv == ["crash"]:
+        raise RuntimeError("boom")
+    print("researching", " ".join(argv))
+    print("partial line", end="")
+    sys.stdout.flush()
+    print(" done")
+
+
+@unittest.skipUnless(daemon.is_supported(), "needs Unix sockets")
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "serve.sock"
+        self.server = daemon.Server(self.path, fake_cli, workers=2)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self._stdout, self._stderr = sys.stdout, sys.stderr
+        sys.stdout = daemon._ThreadRouter("stdout", self._stdout)
+        sys.stderr = daemon._ThreadRouter("stderr", self._stderr)
+
+    def tearDown(self):
+        sys.stdout, sys.stderr = self._stdout, self._stderr
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def _request(self, argv):
+        out, err = io.StringIO(), io.StringIO()
+        code = daemon.request(argv, self.path, out, err)
+        return code, out.getvalue(), err.getvalue()
+
+    def test_streams_output(self):
+        code, out, err = self._request(["ai", "agents"])
+        self.assertEqual(code, 0)
+        self.assertEqual(out, "researching ai agents\npartial line done\n")
+        self.assertEqual(err, "")
+
+    def test_exit_code_and_stderr(self):
+        code, out, err = self._request(["fail"])
+        self.assertEqual(code, 3)
+        self.assertEqual(err, "bad topic\n")
+
+    def test_crash_does_not_stop_server(self):
+        code, _, err = self._request(["crash"])
+        self.assertEqual(code, 1)
+        self.assertIn("RuntimeError: boom", err)
+        self.assertEqual(self._request(["again"])[0], 0)
+
+    def test_requests_do_not_share_context(self):
+        outputs = [self._request(["flag"])[1] for _ in range(3)]
+        self.assertEqual(outputs, ["unset\n"] * 3)
+
+    def test_claim_refuses_live_socket(self):
+        with self.assertRaises(RuntimeError):
+            daemon._claim_socket(self.path)
+
+
+class TestSocketPath(unittest.TestCase):
+    def setUp(self):
+        saved = (cache.CACHE_DIR, cache.MODEL_CACHE_FILE, cache.CACHE_DB_FILE)
+        self.addCleanup(lambda: setattr(cache, "CACHE_DIR", saved[0]))
+        self.addCleanup(lambda: setattr(cache, "MODEL_CACHE_FILE", saved[1]))
+        self.addCleanup(lambda: setattr(cache, "CACHE_DB_FILE", saved[2]))
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("LAST30DAYS_SOCKET", None)
+
+    def test_follows_cache_dir(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["LAST30DAYS_CACHE_DIR"] = tmp
+            self.assertEqual(daemon.socket_path(), Path(tmp) / "serve.sock")
+
+    def test_uses_cache_sandbox_fallback(self):
+        os.environ["LAST30DAYS_CACHE_DIR"] = "/unwritable/last30days"
+        real_mkdir = Path.mkdir
+
+        def mkdir(path, *args, **kwargs):
+            if str(path).startswith("/unwritable"):
+                raise PermissionError(13, "Permission denied")
+            return real_mkdir(path, *args, **kwargs)
+
+        with mock.patch.object(Path, "mkdir", mkdir):
+            path = daemon.socket_path()
+        self.assertEqual(path, cache.CACHE_DIR / "serve.sock")
+        self.assertEqual(path.parent, Path(tempfile.gettempdir()) / "last30days" / "cache")
+
+
+class TestClient(unittest.TestCase):
+    def test_no_server(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(daemon.request(["topic"], Path(tmp) / "missing.sock"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""Tests for deadline module."""
+
+import socket
+import sys
+import time
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import deadline, http, render, schema
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadline(unittest.TestCase):
+    def test_no_deadline(self):
+        d = deadline.Deadline()
+        self.assertEqual(d.remaining(), float("inf"))
+        self.assertEqual(d.cap(30), 30)
+        self.assertFalse(d.expired())
+
+    def test_cap_and_expiry(self):
+        clock = FakeClock()
+        d = deadline.Deadline(10, clock=clock)
+        self.assertEqual(d.cap(30), 10)
+        self.assertEqual(d.cap(5), 5)
+        clock.now += 10
+        self.assertTrue(d.expired())
+        self.assertEqual(d.cap(30), 0)
+        with self.assertRaises(deadline.DeadlineExceeded):
+            d.check()
+
+    def test_sleep_refuses_to_overrun(self):
+        d = deadline.Deadline(0.05)
+        start = time.monotonic()
+        self.assertFalse(d.sleep(5))
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    def test_cancel(self):
+        d = deadline.Deadline(60)
+        d.cancel()
+        self.assertTrue(d.expired())
+        self.assertFalse(d.sleep(1))
+
+    def test_mark(self):
+        d = deadline.Deadline(1)
+        d.mark("reddit")
+        d.mark("x")
+        d.mark("reddit")
+        self.assertEqual(d.cut_short, ["reddit", "x"])
+
+
+class TestPropagation(unittest.TestCase):
+    def test_default_is_no_deadline(self):
+        self.assertIs(deadline.current(), deadline.NO_DEADLINE)
+
+    def test_active_is_scoped(self):
+        d = deadline.Deadline(5)
+        with deadline.active(d):
+            self.assertIs(deadline.current(), d)
+        self.assertIs(deadline.current(), deadline.NO_DEADLINE)
+
+    def test_executor_tasks_see_deadline(self):
+        d = deadline.Deadline(5)
+        with deadline.active(d):
+            with deadline.ThreadPoolExecutor(max_workers=2) as pool:
+                seen = pool.submit(deadline.current).result()
+        self.assertIs(seen.parent, d)
+
+    def test_child_ends_with_parent_and_marks_root(self):
+        clock = FakeClock()
+        parent = deadline.Deadline(10, clock=clock)
+        child = parent.child(30)
+        self.assertEqual(child.remaining(), 10)
+        self.assertEqual(parent.child(4).remaining(), 4)
+        child.mark("x")
+        self.assertEqual(parent.cut_short, ["x"])
+        parent.cancel()
+        self.assertTrue(child.expired())
+
+    def test_cancelling_child_leaves_parent(self):
+        parent = deadline.Deadline(10)
+        parent.child().cancel()
+        self.assertFalse(parent.expired())
+
+    def test_abandon_stops_running_task(self):
+        with deadline.ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(lambda: deadline.current().sleep(5))
+            time.sleep(0.05)
+            start = time.monotonic()
+            deadline.abandon(future)
+            self.assertFalse(future.result(timeout=1))
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_executor_exit_does_not_wait_after_deadline(self):
+        start = time.monotonic()
+        with deadline.active(deadline.Deadline(0.05)):
+            with deadline.ThreadPoolExecutor(max_workers=1) as pool:
+                pool.submit(time.sleep, 1)
+                time.sleep(0.1)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
+class TestHttpDeadline(unittest.TestCase):
+    def test_refuses_after_deadline(self):
+        d = deadline.Deadline(0)
+        with deadline.active(d):
+            with self.assertRaises(deadline.DeadlineExceeded):
+                http.get("http://127.0.0.1:9/never")
+
+    def test_no_retry_wait_past_deadline(self):
+        # Nothing listens on this port, so every attempt fails fast
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        start = time.monotonic()
+        with deadline.active(deadline.Deadline(1)):
+            with self.assertRaises(http.HTTPError):
+                http.get(f"http://127.0.0.1:{port}/", retries=5)
+        self.assertLess(time.monotonic() - start, 1)
+
+
+class TestRetryBudget(unittest.TestCase):
+    def test_budget_bounds_retries(self):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        start = time.monotonic()
+        with self.assertRaises(http.HTTPError):
+            http.get(f"http://127.0.0.1:{port}/", retries=5, budget=0.5)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_backoff_is_jittered(self):
+        delays = {http._backoff(2) for _ in range(20)}
+        self.assertGreater(len(delays), 1)
+        base = http.RETRY_DELAY * 4
+        self.assertTrue(all(base / 2 <= d <= base for d in delays))
+
+
+class TestCutShortReport(unittest.TestCase):
+    def test_round_trip_and_render(self):
+        report = schema.create_report("topic", "2026-01-01", "2026-01-31", "both")
+        report.cut_short = ["reddit"]
+        self.assertEqual(schema.Report.from_dict(report.to_dict()).cut_short, ["reddit"])
+        self.assertIn("PARTIAL RESULTS", render.render_compact(report))
+
+    def test_omitted_when_complete(self):
+        report = schema.create_report("topic", "2026-01-01", "2026-01-31", "both")
+        self.assertNotIn("cut_short", report.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -78,6 +78,56 @@ class TestFindDuplicates(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0], (0, 1))
 
+    def test_lsh_path_matches_exact(self):
+        titles = [
+            "Best practices for Claude Code skills",
+            "Completely different topic about apples",
+            "Best practices for Claude Code skills guide",
+            "Another unrelated subject on oranges",
+            "Completely different topic about apples!",
+        ]
+        items = [
+            schema.RedditItem(id=f"R{i}", title=t, url="", subreddit="")
+            for i, t in enumerate(titles * 2)
+        ]
+        original = dedupe.LSH_MIN_ITEMS
+        dedupe.LSH_MIN_ITEMS = 1
+        try:
+            lsh = dedupe.find_duplicates(items)
+        finally:
+            dedupe.LSH_MIN_ITEMS = original
+        self.assertEqual(lsh, dedupe.find_duplicates(items))
+        self.assertIn((0, 2), lsh)
+        self.assertIn((0, 5), lsh)
+
+
+class TestMinHash(unittest.TestCase):
+    def test_signature_deterministic(self):
+        grams = dedupe.get_ngrams("hello world")
+        sig = dedupe.minhash_signature(grams)
+        self.assertEqual(len(sig), dedupe.NUM_PERM)
+        self.assertEqual(sig, dedupe.minhash_signature(set(grams)))
+
+    def test_signature_agreement_tracks_jaccard(self):
+        a = dedupe.get_ngrams("the quick brown fox jumps over the lazy dog")
+        b = dedupe.get_ngrams("the quick brown fox jumped over a lazy dog")
+        sig_a = dedupe.minhash_signature(a)
+        sig_b = dedupe.minhash_signature(b)
+        agreement = sum(x == y for x, y in zip(sig_a, sig_b)) / dedupe.NUM_PERM
+        self.assertAlmostEqual(agreement, dedupe.jaccard_similarity(a, b), delta=0.2)
+
+    def test_lsh_params(self):
+        bands, rows = dedupe.lsh_params(0.7)
+        self.assertLessEqual(bands * rows, dedupe.NUM_PERM)
+        self.assertGreaterEqual(1 - (1 - 0.7 ** rows) ** bands, dedupe.LSH_RECALL)
+
+    def test_index_query(self):
+        index = dedupe.LSHIndex(0.7)
+        sig = dedupe.minhash_signature(dedupe.get_ngrams("same text here"))
+        index.add("a", sig)
+        self.assertEqual(index.query(sig), {"a"})
+        self.assertEqual(index.query(()), set())
+
 
 class TestDedupeItems(unittest.TestCase):
     def test_keeps_higher_scored(self):
@@ -107,5 +157,74 @@ class TestDedupeItems(unittest.TestCase):
         self.assertEqual(len(result), 1)
 
 
+class TestCanonicalUrl(unittest.TestCase):
+    def test_strips_tracking_and_prefixes(self):
+        self.assertEqual(
+            dedupe.canonical_url("https://www.example.com/post/?utm_source=x&id=3#top"),
+            "example.com/post?id=3",
+        )
+
+    def test_reddit_slug_and_host_variants(self):
+        a = dedupe.canonical_url("https://old.reddit.com/r/ClaudeAI/comments/abc123/some_title/")
+        b = dedupe.canonical_url("https://www.reddit.com/r/ClaudeAI/comments/abc123")
+        self.assertEqual(a, b)
+
+    def test_youtube_forms(self):
+        expected = "youtube.com/watch?v=VID123"
+        self.assertEqual(dedupe.canonical_url("https://youtu.be/VID123"), expected)
+        self.assertEqual(dedupe.canonical_url("https://m.youtube.com/watch?v=VID123&t=30"), expected)
+        self.assertEqual(dedupe.canonical_url("https://www.youtube.com/shorts/VID123"), expected)
+
+    def test_x_status(self):
+        self.assertEqual(
+            dedupe.canonical_url("https://twitter.com/SomeUser/status/42?s=20"),
+            dedupe.canonical_url("https://x.com/someuser/status/42"),
+        )
+
+    def test_share_params_only_dropped_on_their_platform(self):
+        self.assertEqual(dedupe.canonical_url("https://x.com/someuser?s=20&t=abc"), "x.com/someuser")
+        self.assertEqual(dedupe.canonical_url("https://example.com/search?s=claude"), "example.com/search?s=claude")
+        self.assertEqual(dedupe.canonical_url("https://example.com/page?ref=v2&fbclid=1"), "example.com/page?ref=v2")
+
+
+class TestClusterCrossSource(unittest.TestCase):
+    def test_merges_shared_url(self):
+        reddit = [schema.RedditItem(
+            id="R1", title="Claude 5 launch thread", url="https://www.reddit.com/r/ai/comments/abc/x/",
+            subreddit="ai", score=80, engagement=schema.Engagement(score=500, num_comments=40),
+        )]
+        web = [schema.WebSearchItem(
+            id="W1", title="Claude 5 launch thread", url="https://old.reddit.com/r/ai/comments/abc",
+            source_domain="reddit.com", snippet="", score=90,
+        )]
+        r, x, y, w = dedupe.cluster_cross_source(reddit, [], [], web)
+        self.assertEqual(len(r), 1)
+        self.assertEqual(w, [])
+        self.assertEqual([s.source for s in r[0].sightings], ["web"])
+
+    def test_merges_similar_text_and_engagement(self):
+        reddit = [schema.RedditItem(
+            id="R1", title="OpenAI releases new reasoning model today", url="https://reddit.com/r/a/comments/1",
+            subreddit="a", score=70, engagement=schema.Engagement(score=100, num_comments=10),
+        )]
+        x = [schema.XItem(
+            id="X1", text="OpenAI releases new reasoning model today", url="https://x.com/u/status/9",
+            author_handle="u", score=60, engagement=schema.Engagement(likes=300, reposts=20),
+        )]
+        r, xs, y, w = dedupe.cluster_cross_source(reddit, x, [], [])
+        self.assertEqual(xs, [])
+        self.assertEqual(r[0].engagement.score, 100)
+        self.assertEqual(r[0].engagement.likes, 300)
+        self.assertEqual(r[0].sightings[0].label, "@u")
+        self.assertEqual(r[0].to_dict()["sightings"][0]["source"], "x")
+
+    def test_unrelated_items_untouched(self):
+        reddit = [schema.RedditItem(id="R1", title="Apples", url="https://reddit.com/r/a/comments/1", subreddit="a")]
+        x = [schema.XItem(id="X1", text="Oranges are great", url="https://x.com/u/status/2", author_handle="u")]
+        r, xs, y, w = dedupe.cluster_cross_source(reddit, x, [], [])
+        self.assertEqual((len(r), len(xs)), (1, 1))
+        self.assertNotIn("sightings", r[0].to_dict())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+"""Tests for http module."""
+
+import contextvars
+import json
+import socket
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import http
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    slow_posts = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload, extra_headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (extra_headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        _Handler.connections.add(self.client_address)
+        if self.path == "/redirect":
+            self._reply(302, {}, {"Location": "/ok"})
+        elif self.path == "/missing":
+            self._reply(404, {"error": "nope"})
+        else:
+            self._reply(200, {"path": self.path})
+
+    def do_POST(self):
+        _Handler.connections.add(self.client_address)
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        if self.path == "/slow":
+            _Handler.slow_posts += 1
+            time.sleep(0.5)
+        self._reply(200, payload)
+
+
+class TestDebug(unittest.TestCase):
+    def test_enable_debug_is_scoped_to_context(self):
+        self.assertTrue(contextvars.copy_context().run(lambda: (http.enable_debug(), http.debug_enabled())[1]))
+        self.assertEqual(http.debug_enabled(), http.DEBUG)
+
+
+class TestPooledRequests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        http.close_connections()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        http.close_connections()
+        _Handler.connections.clear()
+
+    def test_reuses_connection(self):
+        for i in range(5):
+            self.assertEqual(http.get(f"{self.base}/item/{i}"), {"path": f"/item/{i}"})
+        self.assertEqual(len(_Handler.connections), 1)
+
+    def test_post_json(self):
+        self.assertEqual(http.post(f"{self.base}/echo", {"a": 1}), {"a": 1})
+
+    def test_follows_redirect(self):
+        self.assertEqual(http.get(f"{self.base}/redirect"), {"path": "/ok"})
+
+    def test_client_error_not_retried(self):
+        with self.assertRaises(http.HTTPError) as ctx:
+            http.get(f"{self.base}/missing")
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_recovers_from_stale_connection(self):
+        http.get(f"{self.base}/first")
+        # Simulate the server dropping an idle keep-alive socket
+        for conns in http._pool._idle.values():
+            for conn in conns:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+        self.assertEqual(http.get(f"{self.base}/second"), {"path": "/second"})
+
+    def test_read_timeout_not_resent(self):
+        http.get(f"{self.base}/first")  # leave a reusable connection
+        _Handler.slow_posts = 0
+        with self.assertRaises(socket.timeout):
+            http._send_pooled("POST", f"{self.base}/slow", {"Content-Type": "application/json"}, b"{}", 0.1)
+        time.sleep(0.6)
+        self.assertEqual(_Handler.slow_posts, 1)
+
+    def test_coalescing_respects_credential_headers(self):
+        def slow_posts(*keys):
+            _Handler.slow_posts = 0
+            threads = [
+                threading.Thread(target=http.post, args=(f"{self.base}/slow", {}, {"x-api-key": k}))
+                for k in keys
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(5)
+            return _Handler.slow_posts
+
+        self.assertEqual(slow_posts("a", "a"), 1)
+        self.assertEqual(slow_posts("a", "b"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Tests for pipeline module."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import pipeline, schema
+
+WORDS = ["apples", "quantum", "guitar", "volcano", "marathon", "sushi"]
+FROM_DATE = "2026-01-01"
+TO_DATE = "2026-01-31"
+
+
+def reddit_raw(n, title="Thread"):
+    return [
+        {
+            "id": f"R{i}",
+            "title": f"{title} on {WORDS[i]}",
+            "url": f"https://reddit.com/r/test/{i}",
+            "subreddit": "test",
+            "date": "2026-01-15",
+            "engagement": {"score": 10 * (i + 1), "num_comments": i},
+            "relevance": 0.8,
+        }
+        for i in range(n)
+    ]
+
+
+def x_raw(n):
+    return [
+        {
+            "id": f"X{i}",
+            "text": f"Hot take: {WORDS[-1 - i]} is underrated",
+            "url": f"https://x.com/user/status/{i}",
+            "author_handle": "user",
+            "date": "2026-01-20",
+            "engagement": {"likes": 100 * (i + 1), "reposts": i},
+            "relevance": 0.9,
+        }
+        for i in range(n)
+    ]
+
+
+class TestProcessSource(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(pipeline.process_source("reddit", [], FROM_DATE, TO_DATE), [])
+
+    def test_reddit_sorted_by_score(self):
+        result = pipeline.process_source("reddit", reddit_raw(3), FROM_DATE, TO_DATE)
+        self.assertEqual(len(result), 3)
+        self.assertIsInstance(result[0], schema.RedditItem)
+        scores = [item.score for item in result]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_date_filter(self):
+        raw = x_raw(2)
+        raw[0]["date"] = "2025-06-01"
+        result = pipeline.process_source("x", raw, FROM_DATE, TO_DATE)
+        self.assertEqual([item.id for item in result], ["X1"])
+
+    def test_dedupes(self):
+        raw = reddit_raw(1) + reddit_raw(1)
+        raw[1]["id"] = "dup"
+        result = pipeline.process_source("reddit", raw, FROM_DATE, TO_DATE)
+        self.assertEqual(len(result), 1)
+
+    def test_unknown_source(self):
+        with self.assertRaises(ValueError):
+            pipeline.process_source("tiktok", [{}], FROM_DATE, TO_DATE)
+
+
+class TestStreamingPipeline(unittest.TestCase):
+    def test_running_view(self):
+        updates = []
+        stages = pipeline.StreamingPipeline(
+            FROM_DATE, TO_DATE,
+            on_update=lambda source, p: updates.append((source, len(p.ranked()))),
+        )
+        stages.add("x", x_raw(2))
+        stages.add("reddit", reddit_raw(3))
+        self.assertEqual(updates, [("x", 2), ("reddit", 5)])
+        self.assertEqual(stages.done(), ["x", "reddit"])
+        scores = [item.score for item in stages.ranked()]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_readd_replaces_source(self):
+        stages = pipeline.StreamingPipeline(FROM_DATE, TO_DATE)
+        stages.add("reddit", reddit_raw(2))
+        stages.add("reddit", reddit_raw(4))
+        self.assertEqual(len(stages.items("reddit")), 4)
+        self.assertEqual(len(stages.ranked()), 4)
+
+    def test_snapshot(self):
+        stages = pipeline.StreamingPipeline(FROM_DATE, TO_DATE)
+        stages.add("reddit", reddit_raw(3))
+        stages.add("x", x_raw(2))
+        snap = stages.snapshot("x", limit=4)
+        self.assertEqual(snap["event"], "partial")
+        self.assertEqual(snap["source"], "x")
+        self.assertEqual(snap["counts"], {"reddit": 3, "x": 2})
+        self.assertEqual(len(snap["items"]), 4)
+        self.assertLessEqual({item["source"] for item in snap["items"]}, {"reddit", "x"})
+
+
+if __name__ == "__main__":
+    unittest.main()
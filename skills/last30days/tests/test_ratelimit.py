@@ -0,0 +1,84 @@
+"""Tests for ratelimit module."""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import cache, ratelimit
+
+
+def _reserve_many(cache_dir, count, queue):
+    os.environ["LAST30DAYS_CACHE_DIR"] = cache_dir
+    ratelimit.close()
+    queue.put([ratelimit.reserve("api.example.com") for _ in range(count)])
+
+
+class TestParseLimits(unittest.TestCase):
+    def test_parses_entries(self):
+        limits = ratelimit.parse_limits("www.reddit.com=0.5/5, API.x.ai=off, bad, x.com=2, y=abc")
+        self.assertEqual(limits["www.reddit.com"], (0.5, 5))
+        self.assertIsNone(limits["api.x.ai"])
+        self.assertEqual(limits["x.com"], (2, 2))
+        self.assertNotIn("y", limits)
+
+
+class TestBuckets(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._saved = (cache.CACHE_DIR, os.environ.get("LAST30DAYS_CACHE_DIR"), os.environ.get("LAST30DAYS_RATE_LIMITS"))
+        os.environ["LAST30DAYS_CACHE_DIR"] = self._tmp.name
+        os.environ["LAST30DAYS_RATE_LIMITS"] = "api.example.com=10/2"
+        ratelimit.close()
+
+    def tearDown(self):
+        ratelimit.close()
+        cache.CACHE_DIR = self._saved[0]
+        for name, value in zip(("LAST30DAYS_CACHE_DIR", "LAST30DAYS_RATE_LIMITS"), self._saved[1:]):
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        self._tmp.cleanup()
+
+    def test_unlimited_host(self):
+        self.assertEqual(ratelimit.reserve("unlimited.example.com"), 0)
+
+    def test_burst_then_spaced(self):
+        self.assertEqual(ratelimit.reserve("api.example.com"), 0)
+        self.assertEqual(ratelimit.reserve("api.example.com"), 0)
+        self.assertAlmostEqual(ratelimit.reserve("api.example.com"), 0.1, delta=0.02)
+        self.assertAlmostEqual(ratelimit.reserve("api.example.com"), 0.2, delta=0.02)
+
+    def test_max_wait_takes_nothing(self):
+        ratelimit.reserve("api.example.com")
+        ratelimit.reserve("api.example.com")
+        self.assertIsNone(ratelimit.reserve("api.example.com", max_wait=0.05))
+        self.assertAlmostEqual(ratelimit.reserve("api.example.com"), 0.1, delta=0.02)
+
+    def test_penalize_holds_back_next_request(self):
+        ratelimit.penalize("api.example.com", 3)
+        self.assertAlmostEqual(ratelimit.reserve("api.example.com"), 3, delta=0.05)
+
+    def test_shared_across_processes(self):
+        ctx = multiprocessing.get_context("spawn")
+        queue = ctx.Queue()
+        procs = [ctx.Process(target=_reserve_many, args=(self._tmp.name, 3, queue)) for _ in range(2)]
+        for p in procs:
+            p.start()
+        waits = sorted(queue.get(timeout=30) + queue.get(timeout=30))
+        for p in procs:
+            p.join()
+        # 2 burst tokens, then one every 0.1s, whichever process asked
+        self.assertEqual(waits[:2], [0, 0])
+        self.assertAlmostEqual(waits[-1], 0.4, delta=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
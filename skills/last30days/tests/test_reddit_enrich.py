@@ -0,0 +1,152 @@
+"""Tests for reddit_enrich module."""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import cache, http, reddit_enrich
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def load_fixture(name):
+    with open(FIXTURES / name) as f:
+        return json.load(f)
+
+
+def make_item(post_id):
+    return {"url": f"https://reddit.com/r/test/comments/{post_id}/some_title"}
+
+
+class TestExtractPostId(unittest.TestCase):
+    def test_thread_url(self):
+        self.assertEqual(reddit_enrich.extract_post_id("https://www.reddit.com/r/a/comments/AbC12/t/"), "abc12")
+
+    def test_not_a_thread(self):
+        self.assertIsNone(reddit_enrich.extract_post_id("https://www.reddit.com/r/a/"))
+        self.assertIsNone(reddit_enrich.extract_post_id("https://example.com/comments/abc"))
+
+
+class TestRefreshEngagement(unittest.TestCase):
+    def test_refreshes_from_info_listing(self):
+        items = [make_item("abc123"), make_item("zzz999"), make_item("ghi789")]
+        refreshed = reddit_enrich.refresh_engagement(items, load_fixture("reddit_info_sample.json"))
+        self.assertEqual(refreshed, [0, 2])
+        self.assertEqual(items[0]["engagement"], {"score": 847, "num_comments": 156, "upvote_ratio": 0.94})
+        self.assertEqual(items[0]["date"], "2026-01-15")
+        self.assertNotIn("engagement", items[1])
+
+    def test_batches_ids(self):
+        items = [make_item(f"p{i}") for i in range(150)]
+        with mock.patch.object(http, "get_reddit_json", return_value={"data": {"children": []}}) as get:
+            reddit_enrich.refresh_engagement(items)
+        self.assertEqual(get.call_count, 2)
+        ids = get.call_args_list[0].kwargs["params"]["id"].split(",")
+        self.assertEqual(len(ids), reddit_enrich.INFO_BATCH_SIZE)
+        self.assertEqual(ids[0], "t3_p0")
+
+    def test_rate_limit_propagates(self):
+        error = http.HTTPError("429", status_code=429)
+        with mock.patch.object(http, "get_reddit_json", side_effect=error):
+            with self.assertRaises(reddit_enrich.RedditRateLimitError):
+                reddit_enrich.refresh_engagement([make_item("abc")])
+
+
+class TestLeanThreadFetch(unittest.TestCase):
+    def test_decoder_matches_full_parse(self):
+        text = (FIXTURES / "reddit_thread_sample.json").read_text()
+        self.assertEqual(
+            reddit_enrich.parse_thread_data(reddit_enrich.decode_thread_json(text)),
+            reddit_enrich.parse_thread_data(json.loads(text)),
+        )
+
+    def test_decoder_drops_replies_and_extra_fields(self):
+        reply = {"kind": "t1", "data": {"body": "nested", "score": 1}}
+        comment = {"kind": "t1", "data": {
+            "body": "top", "score": 5, "gildings": {"x": 1},
+            "replies": {"kind": "Listing", "data": {"children": [reply]}},
+        }}
+        data = reddit_enrich.decode_thread_json(json.dumps([{}, {"data": {"children": [comment]}}]))
+        self.assertEqual(data[1]["data"]["children"][0]["data"], {"body": "top", "score": 5})
+
+    def test_requests_shallow_top_comments(self):
+        with mock.patch.object(http, "get_reddit_json", return_value=[]) as get:
+            reddit_enrich.fetch_thread_data("https://reddit.com/r/a/comments/abc/t")
+        kwargs = get.call_args.kwargs
+        self.assertEqual(kwargs["params"], reddit_enrich.THREAD_FETCH_PARAMS)
+        self.assertIs(kwargs["decode"], reddit_enrich.decode_thread_json)
+
+
+class TestSelectForComments(unittest.TestCase):
+    def test_busiest_first_and_skips_empty(self):
+        items = [
+            {"engagement": {"num_comments": 5, "score": 10}},
+            {"engagement": {"num_comments": 0, "score": 900}},
+            {"engagement": {"num_comments": 40, "score": 1}},
+            {},
+        ]
+        self.assertEqual(reddit_enrich.select_for_comments(items, 10), [2, 0, 3])
+        self.assertEqual(reddit_enrich.select_for_comments(items, 1), [2])
+
+
+class TestThreadCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._saved = (cache.CACHE_DIR, cache.MODEL_CACHE_FILE, cache.CACHE_DB_FILE)
+        self._env = os.environ.pop("LAST30DAYS_CACHE_DIR", None)
+        cache.close()
+        cache.CACHE_DIR = Path(self._tmp.name)
+        cache.MODEL_CACHE_FILE = cache.CACHE_DIR / "model_selection.json"
+        cache.CACHE_DB_FILE = cache.CACHE_DIR / "results.db"
+        self.thread = load_fixture("reddit_thread_sample.json")
+
+    def tearDown(self):
+        cache.close()
+        cache.CACHE_DIR, cache.MODEL_CACHE_FILE, cache.CACHE_DB_FILE = self._saved
+        if self._env is not None:
+            os.environ["LAST30DAYS_CACHE_DIR"] = self._env
+        self._tmp.cleanup()
+
+    def _enrich(self, item, **kwargs):
+        with mock.patch.object(http, "get_reddit_json", return_value=self.thread) as get:
+            reddit_enrich.enrich_reddit_item(item, **kwargs)
+        return get.call_count
+
+    def test_ttl_grows_with_thread_age(self):
+        now = time.time()
+        self.assertEqual(reddit_enrich.thread_ttl_hours(now - 3600, now), 2)
+        self.assertEqual(reddit_enrich.thread_ttl_hours(now - 2 * 86400, now), 12)
+        self.assertEqual(
+            reddit_enrich.thread_ttl_hours(now - 30 * 86400, now), reddit_enrich.THREAD_STABLE_TTL_HOURS,
+        )
+
+    def test_second_enrich_served_from_cache(self):
+        self.assertEqual(self._enrich(make_item("abc123")), 1)
+        item = make_item("abc123")
+        item["engagement"] = {"score": 900, "num_comments": 160, "upvote_ratio": 0.95}
+        self.assertEqual(self._enrich(item), 0)
+        # Engagement from the batched refresh is kept; comments come from cache
+        self.assertEqual(item["engagement"]["score"], 900)
+        self.assertTrue(item["top_comments"])
+
+    def test_refresh_bypasses_cache(self):
+        self._enrich(make_item("abc123"))
+        self.assertEqual(self._enrich(make_item("abc123"), use_cache=False), 1)
+
+    def test_comment_growth_refetches(self):
+        self._enrich(make_item("abc123"))
+        item = make_item("abc123")
+        item["engagement"] = {"score": 900, "num_comments": 400, "upvote_ratio": 0.95}
+        self.assertEqual(self._enrich(item), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -70,6 +70,55 @@ class TestRenderCompact(unittest.TestCase):
         self.assertIn("xAI key", result)
 
 
+class TestRenderSourceStatus(unittest.TestCase):
+    def _report(self):
+        return schema.Report(
+            topic="test",
+            range_from="2026-01-01",
+            range_to="2026-01-31",
+            generated_at="2026-01-31T12:00:00Z",
+            mode="reddit-only",
+            reddit=[
+                schema.RedditItem(
+                    id="R1",
+                    title="Test Thread",
+                    url="https://reddit.com/r/test/1",
+                    subreddit="test",
+                )
+            ],
+        )
+
+    def test_marks_cached_sources(self):
+        result = render.render_source_status(self._report(), {"cache_ages": {"reddit": 2.25}})
+        self.assertIn("Reddit: 1 threads (cached, 2.2h old)", result)
+
+    def test_fresh_sources_unmarked(self):
+        result = render.render_source_status(self._report(), {})
+        self.assertNotIn("cached", result)
+
+
+class TestRenderSightings(unittest.TestCase):
+    def test_compact_lists_sightings(self):
+        item = schema.RedditItem(
+            id="R1",
+            title="Test Thread",
+            url="https://reddit.com/r/test/1",
+            subreddit="test",
+            sightings=[schema.Sighting(source="x", url="https://x.com/u/status/1", label="@u", title="t")],
+        )
+        report = schema.Report(
+            topic="test",
+            range_from="2026-01-01",
+            range_to="2026-01-31",
+            generated_at="2026-01-31T12:00:00Z",
+            mode="reddit-only",
+            reddit=[item],
+        )
+        self.assertIn("Also seen: X @u", render.render_compact(report))
+        restored = schema.Report.from_dict(report.to_dict())
+        self.assertEqual(restored.reddit[0].sightings[0].label, "@u")
+
+
 class TestRenderContextSnippet(unittest.TestCase):
     def test_renders_snippet(self):
         report = schema.Report(
@@ -0,0 +1,155 @@
+"""Tests for singleflight module."""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import deadline, singleflight
+
+
+def _slow_shared_call(cache_dir, marker, queue):
+    os.environ["LAST30DAYS_CACHE_DIR"] = cache_dir
+
+    def work():
+        with open(marker, "a") as f:
+            f.write("x")
+        time.sleep(1)
+        return {"items": [1, 2]}
+
+    queue.put(singleflight.do("shared-key", work, shared=True))
+
+
+class TestGroup(unittest.TestCase):
+    def setUp(self):
+        self.group = singleflight.Group()
+        self.calls = 0
+        self.release = threading.Event()
+
+    def _work(self, value):
+        self.calls += 1
+        self.release.wait(2)
+        return {"value": value}
+
+    def _run_concurrently(self, n, fn=None):
+        results = [None] * n
+        errors = [None] * n
+
+        def run(i):
+            try:
+                results[i] = self.group.do("k", fn or self._work, i)
+            except Exception as e:
+                errors[i] = e
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+        for t in threads:
+            t.start()
+        while self.group.in_flight() == 0:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        self.release.set()
+        for t in threads:
+            t.join(5)
+        return results, errors
+
+    def test_concurrent_calls_share_one_result(self):
+        results, _ = self._run_concurrently(5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len({r["value"] for r in results}), 1)
+        # Waiters get copies, not the leader's object
+        self.assertEqual(len({id(r) for r in results}), 5)
+
+    def test_leader_result_is_not_shared_with_waiters(self):
+        results, _ = self._run_concurrently(4, lambda i: (self._work(i), {"items": [1]})[1])
+        # Whichever caller led can mutate its result without the others seeing it
+        for r in results:
+            r["items"].append(2)
+        self.assertEqual([r["items"] for r in results], [[1, 2]] * 4)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        self.release.set()
+        self.group.do("k", self._work, 1)
+        self.group.do("k", self._work, 2)
+        self.assertEqual(self.calls, 2)
+
+    def test_error_is_shared(self):
+        def fail(i):
+            self.calls += 1
+            self.release.wait(2)
+            raise ValueError("boom")
+        _, errors = self._run_concurrently(3, fail)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+
+    def test_waiter_retries_when_leader_deadline_expires(self):
+        def leader():
+            with deadline.active(deadline.Deadline(0.05)):
+                self.group.do("k", lambda: (time.sleep(0.1), deadline.current().check())[1])
+        t = threading.Thread(target=lambda: self.assertRaises(deadline.DeadlineExceeded, leader))
+        t.start()
+        time.sleep(0.02)
+        self.assertEqual(self.group.do("k", lambda: "mine"), "mine")
+        t.join()
+
+    def test_waiter_deadline(self):
+        t = threading.Thread(target=lambda: self.group.do("k", self._work, 0))
+        t.start()
+        time.sleep(0.02)
+        with deadline.active(deadline.Deadline(0.1)):
+            with self.assertRaises(deadline.DeadlineExceeded):
+                self.group.do("k", self._work, 1)
+        self.release.set()
+        t.join()
+
+
+@unittest.skipIf(singleflight.fcntl is None, "needs fcntl")
+class TestShared(unittest.TestCase):
+    def test_processes_share_one_call(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            marker = os.path.join(tmp, "calls")
+            ctx = multiprocessing.get_context("spawn")
+            queue = ctx.Queue()
+            procs = [ctx.Process(target=_slow_shared_call, args=(tmp, marker, queue)) for _ in range(3)]
+            for p in procs:
+                p.start()
+            results = [queue.get(timeout=30) for _ in procs]
+            for p in procs:
+                p.join()
+            self.assertEqual(results, [{"items": [1, 2]}] * 3)
+            with open(marker) as f:
+                self.assertEqual(f.read(), "x")
+
+    def test_only_json_native_results_published(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            singleflight._write_result(directory, directory / "a.json", {"items": [1, "x", None]})
+            singleflight._write_result(directory, directory / "b.json", {"pair": (1, 2)})
+            singleflight._write_result(directory, directory / "c.json", {1: "int key"})
+            self.assertEqual(sorted(p.name for p in directory.iterdir()), ["a.json"])
+
+    def test_sweep_keeps_held_locks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            held, idle = directory / "held.lock", directory / "idle.lock"
+            fd = os.open(str(held), os.O_CREAT | os.O_RDWR)
+            singleflight.fcntl.flock(fd, singleflight.fcntl.LOCK_EX)
+            idle.touch()
+            old = time.time() - singleflight.SHARED_RESULT_TTL - 10
+            for path in (held, idle):
+                os.utime(path, (old, old))
+            try:
+                singleflight._sweep(directory)
+                self.assertTrue(held.exists())
+                self.assertFalse(idle.exists())
+            finally:
+                os.close(fd)
+
+
+if __name__ == "__main__":
+    unittest.main()
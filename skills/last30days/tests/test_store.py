@@ -0,0 +1,135 @@
+"""Tests for store module."""
+
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import store
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self._orig_override = store._db_override
+        store._db_override = Path(self.tmpdir.name) / "research.db"
+        store.init_db()
+
+    def tearDown(self):
+        store.close()
+        store._db_override = self._orig_override
+        self.tmpdir.cleanup()
+
+
+def finding(i, engagement=10, **extra):
+    return {
+        "source": "reddit",
+        "url": f"https://reddit.com/r/test/comments/{i}",
+        "title": f"Thread {i}",
+        "author": "test",
+        "content": f"Discussion about widget number {i}",
+        "engagement_score": engagement,
+        "relevance_score": 0.5,
+        **extra,
+    }
+
+
+class TestStoreFindings(StoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.topic_id = store.add_topic("widgets")["id"]
+
+    def _store(self, findings):
+        run_id = store.record_run(self.topic_id)
+        return run_id, store.store_findings(run_id, self.topic_id, findings)
+
+    def test_new_then_updated(self):
+        _, counts = self._store([finding(1), finding(2)])
+        self.assertEqual(counts, {"new": 2, "updated": 0})
+        run_id, counts = self._store([finding(2, engagement=50), finding(3)])
+        self.assertEqual(counts, {"new": 1, "updated": 1})
+
+        rows = {r["source_url"]: r for r in store.get_new_findings(self.topic_id)}
+        self.assertEqual(len(rows), 3)
+        resighted = rows["https://reddit.com/r/test/comments/2"]
+        self.assertEqual(resighted["sighting_count"], 2)
+        self.assertEqual(resighted["engagement_score"], 50)
+        self.assertEqual(resighted["run_id"], run_id)
+
+    def test_keeps_higher_engagement(self):
+        self._store([finding(1, engagement=80)])
+        self._store([finding(1, engagement=5)])
+        row = store.get_new_findings(self.topic_id)[0]
+        self.assertEqual(row["engagement_score"], 80)
+
+    def test_duplicate_url_within_batch(self):
+        _, counts = self._store([finding(1), finding(1, engagement=30)])
+        self.assertEqual(counts, {"new": 1, "updated": 1})
+        row = store.get_new_findings(self.topic_id)[0]
+        self.assertEqual(row["sighting_count"], 2)
+        self.assertEqual(row["engagement_score"], 30)
+
+    def test_skips_missing_url(self):
+        _, counts = self._store([{"source": "x", "title": "no url"}, finding(1)])
+        self.assertEqual(counts, {"new": 1, "updated": 0})
+
+    def test_run_stats_and_search(self):
+        self._store([finding(1), finding(2)])
+        run_id, _ = self._store([finding(1)])
+        self.assertEqual(len(store.search_findings("widget")), 2)
+        self.assertEqual(store.list_topics()[0]["finding_count"], 2)
+        with store.connection() as conn:
+            run = conn.execute(
+                "SELECT findings_new, findings_updated FROM research_runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        self.assertEqual(tuple(run), (0, 1))
+
+
+class TestConnection(StoreTestCase):
+    def test_reuses_thread_connection(self):
+        with store.connection() as first:
+            pass
+        store.add_topic("a")
+        store.list_topics()
+        with store.connection() as second:
+            self.assertIs(first, second)
+            self.assertEqual(second.execute("PRAGMA temp_store").fetchone()[0], 2)
+
+    def test_threads_get_own_connections(self):
+        seen = []
+
+        def worker():
+            with store.connection() as conn:
+                seen.append(conn)
+            store.close()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        with store.connection() as conn:
+            self.assertIsNot(conn, seen[0])
+
+    def test_outer_block_is_one_transaction(self):
+        with self.assertRaises(RuntimeError):
+            with store.connection():
+                store.add_topic("rolled-back")
+                raise RuntimeError("boom")
+        self.assertIsNone(store.get_topic("rolled-back"))
+
+    def test_reopens_when_db_changes(self):
+        with store.connection() as first:
+            pass
+        with tempfile.TemporaryDirectory() as other:
+            store._db_override = Path(other) / "other.db"
+            store.init_db()
+            with store.connection() as second:
+                self.assertIsNot(first, second)
+            store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
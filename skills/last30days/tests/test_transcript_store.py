@@ -0,0 +1,68 @@
+"""Tests for transcript_store module."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import transcript_store
+
+
+class TestTranscriptStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = mock.patch.dict(os.environ, {"LAST30DAYS_CACHE_DIR": self._tmp.name})
+        self._env.start()
+        transcript_store.close()
+
+    def tearDown(self):
+        transcript_store.close()
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def test_round_trip_compressed(self):
+        text = "a fairly repetitive transcript " * 200
+        transcript_store.put("vid1", text)
+        self.assertEqual(transcript_store.get("vid1"), (True, text))
+        self.assertLess(transcript_store.stats()["bytes"], len(text) / 10)
+
+    def test_unknown_video(self):
+        self.assertEqual(transcript_store.get("nope"), (False, None))
+
+    def test_no_captions_marker_expires(self):
+        transcript_store.put("vid1", "")
+        self.assertEqual(transcript_store.get("vid1"), (True, None))
+        later = time.time() + transcript_store.NEGATIVE_TTL_HOURS * 3600 + 1
+        with mock.patch.object(transcript_store.time, "time", return_value=later):
+            self.assertEqual(transcript_store.get("vid1"), (False, None))
+
+    def test_evicts_least_recently_used(self):
+        # Incompressible-ish text so each entry has a predictable size
+        texts = {vid: " ".join(str(hash((vid, i))) for i in range(400)) for vid in ("a", "b", "c")}
+        transcript_store.put("a", texts["a"])
+        transcript_store.put("b", texts["b"])
+        one = transcript_store.stats()["bytes"] // 2
+        transcript_store.get("a")  # b is now least recently used
+        with mock.patch.object(transcript_store, "MAX_BYTES", int(one * 2.5)):
+            transcript_store.put("c", texts["c"])
+        self.assertTrue(transcript_store.get("a")[0])
+        self.assertFalse(transcript_store.get("b")[0])
+        self.assertTrue(transcript_store.get("c")[0])
+
+    def test_corrupt_entry_ignored(self):
+        transcript_store.put("vid1", "some text")
+        with transcript_store._lock:
+            conn = transcript_store._get_conn()
+            with conn:
+                conn.execute("UPDATE transcripts SET sha256 = 'bad' WHERE video_id = 'vid1'")
+        self.assertEqual(transcript_store.get("vid1"), (False, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
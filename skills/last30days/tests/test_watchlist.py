@@ -0,0 +1,148 @@
+"""Tests for watchlist module."""
+
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+import watchlist
+
+
+def _fake_research(name, deadline_seconds):
+    """WorkerPool target: "hang" never returns."""
+    if name == "hang":
+        time.sleep(60)
+    return [{"name": name}]
+
+
+def _exits_soon(pid, timeout=5):
+    """Whether child process pid exits within timeout (without reaping it)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None:
+                return True
+        except ChildProcessError:
+            return True  # already reaped
+        time.sleep(0.05)
+    return False
+
+
+class TestBudgetLedger(unittest.TestCase):
+    def test_reserves_until_limit(self):
+        ledger = watchlist.BudgetLedger(limit=1.0, spent=0.5)
+        self.assertTrue(ledger.reserve(0.3))
+        self.assertFalse(ledger.reserve(0.3))
+        self.assertAlmostEqual(ledger.committed(), 0.8)
+
+    def test_settle_releases_reservation(self):
+        ledger = watchlist.BudgetLedger(limit=1.0, spent=0.0)
+        ledger.reserve(0.6)
+        ledger.settle(0.6, spent=0.2)
+        self.assertAlmostEqual(ledger.committed(), 0.2)
+        self.assertTrue(ledger.reserve(0.6))
+
+    def test_zero_cost_runs_until_spent(self):
+        ledger = watchlist.BudgetLedger(limit=1.0, spent=1.0)
+        self.assertFalse(ledger.reserve(0.0))
+
+
+class TestProviderRateLimiter(unittest.TestCase):
+    def test_waits_for_refill(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        limiter = watchlist.ProviderRateLimiter({"openai": 2, "bird": 60}, clock=lambda: now[0], sleep=sleep)
+        limiter.acquire(["openai", "bird"])
+        limiter.acquire(["openai", "bird"])
+        self.assertEqual(sleeps, [])
+        limiter.acquire(["openai", "bird"])
+        self.assertAlmostEqual(sum(sleeps), 30.0)
+
+    def test_ignores_unknown_providers(self):
+        limiter = watchlist.ProviderRateLimiter({}, sleep=lambda s: self.fail("should not wait"))
+        limiter.acquire(["web"])
+
+
+class TestPrioritize(unittest.TestCase):
+    def test_stale_and_productive_first(self):
+        now = datetime(2026, 3, 10, 12, 0, 0)
+        topics = [{"id": 1, "name": "fresh"}, {"id": 2, "name": "stale"},
+                  {"id": 3, "name": "never"}, {"id": 4, "name": "stale-busy"}]
+        stats = {
+            1: {"last_success": "2026-03-10 10:00:00", "avg_new": 5},
+            2: {"last_success": "2026-03-09 12:00:00", "avg_new": 0},
+            3: {"last_success": None, "avg_new": None},
+            4: {"last_success": "2026-03-09 12:00:00", "avg_new": 20},
+        }
+        ordered = [t["name"] for t in watchlist._prioritize(topics, stats, now)]
+        self.assertEqual(ordered, ["never", "stale-busy", "stale", "fresh"])
+
+
+class TestEstimateCost(unittest.TestCase):
+    def test_zero_cost_history_still_reserves(self):
+        stats = {1: {"avg_cost": 0.0}, 2: {"avg_cost": None}}
+        self.assertEqual(watchlist._estimate_cost(stats, {"id": 1}), watchlist.DEFAULT_RUN_COST)
+        ledger = watchlist.BudgetLedger(limit=0.06, spent=0.0)
+        self.assertTrue(ledger.reserve(watchlist._estimate_cost(stats, {"id": 1})))
+        self.assertFalse(ledger.reserve(watchlist._estimate_cost(stats, {"id": 2})))
+
+    def test_falls_back_to_mean_of_recorded_costs(self):
+        stats = {1: {"avg_cost": 0.0}, 2: {"avg_cost": 0.2}, 3: {"avg_cost": 0.4}}
+        self.assertAlmostEqual(watchlist._estimate_cost(stats, {"id": 1}), 0.3)
+        self.assertEqual(watchlist._estimate_cost(stats, {"id": 3}), 0.4)
+
+
+class TestTopicTimeouts(unittest.TestCase):
+    def test_hung_source_is_cut_short(self):
+        stop = threading.Event()
+        self.addCleanup(stop.set)
+
+        def hang(*args, **kwargs):
+            stop.wait()
+            return [], {}, None
+
+        research = functools.partial(
+            last30days.research_topic, mock=True, sources="reddit", cache_mode="refresh",
+        )
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.dict(os.environ, {"LAST30DAYS_CACHE_DIR": tmp}), \
+                mock.patch.object(last30days, "_search_reddit", side_effect=hang), \
+                mock.patch.object(last30days, "research_topic", side_effect=research):
+            started = time.monotonic()
+            watchlist._research_findings("hung topic", deadline_seconds=0.5)
+        self.assertLess(time.monotonic() - started, 5)
+
+    @unittest.skipUnless(hasattr(os, "waitid"), "needs os.waitid")
+    def test_hung_worker_is_killed_and_replaced(self):
+        pool = watchlist.WorkerPool(1, target=_fake_research)
+        self.addCleanup(pool.shutdown)
+        self.assertEqual(pool.research("warm", 5), [{"name": "warm"}])
+        old_pids = pool.worker_pids()
+        self.assertEqual(len(old_pids), 1)
+        with mock.patch.object(watchlist, "TOPIC_KILL_GRACE", 0):
+            with self.assertRaises(FuturesTimeoutError):
+                pool.research("hang", 0.3)
+        for pid in old_pids:
+            self.assertTrue(_exits_soon(pid))
+        self.assertEqual(pool.research("next", 5), [{"name": "next"}])
+        self.assertNotEqual(pool.worker_pids(), old_pids)
+
+
+if __name__ == "__main__":
+    unittest.main()
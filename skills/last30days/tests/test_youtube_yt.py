@@ -0,0 +1,232 @@
+"""Tests for youtube_yt module."""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import transcript_store, youtube_yt
+
+VIDEOS = {
+    "vid1": {"id": "vid1", "title": "One", "channel": "Chan", "upload_date": "20260110",
+             "view_count": 500, "like_count": 20, "comment_count": 3, "duration": 61},
+    "vid2": {"id": "vid2", "title": "Two", "uploader": "Up", "upload_date": "20260112",
+             "view_count": 900, "like_count": None, "duration": 30},
+    "vid3": {"id": "vid3", "title": "Three", "channel": "C", "upload_date": "20260115", "view_count": 10},
+}
+
+VTT = "WEBVTT\n\n00:00:00.000 --> 00:00:02.000\nhello <c>world</c>\n\n00:00:02.000 --> 00:00:04.000\nhello world\nagain\n"
+
+
+class FakeYoutubeDL:
+    """Stands in for yt_dlp.YoutubeDL (search + auto-captions)."""
+
+    instances = []
+
+    def __init__(self, params):
+        self.params = params
+        FakeYoutubeDL.instances.append(self)
+
+    def extract_info(self, url, download=True, ie_key=None, process=True):
+        if url.startswith("ytsearch"):
+            entries = [{"_type": "url", "url": f"https://www.youtube.com/watch?v={vid}", "ie_key": "Youtube"}
+                       for vid in VIDEOS]
+            return {"_type": "playlist", "entries": iter(entries)}
+        video_id = url.rsplit("=", 1)[-1]
+        if video_id == "limited":
+            raise Exception("ERROR: Unable to download: HTTP Error 429: Too Many Requests")
+        info = dict(VIDEOS.get(video_id, {"id": video_id}))
+        if self.params.get("writeautomaticsub") and video_id != "vid3":
+            info["requested_subtitles"] = {"en": {"ext": "vtt", "url": f"https://subs/{video_id}"}}
+        return info
+
+    def urlopen(self, url):
+        return io.BytesIO(VTT.encode())
+
+
+class StoreIsolation(unittest.TestCase):
+    """Keeps the transcript store in a temporary cache directory."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(os.environ, {"LAST30DAYS_CACHE_DIR": tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        transcript_store.close()
+        self.addCleanup(transcript_store.close)
+
+
+class FakeCli:
+    """A `yt-dlp` executable on PATH that prints VIDEOS one line at a time."""
+
+    SCRIPT = """#!{python}
+import json, sys, time
+for video in {videos!r}:
+    print(json.dumps(video), flush=True)
+    time.sleep({delay})
+"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def __enter__(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        script = Path(self._tmp.name) / "yt-dlp"
+        script.write_text(self.SCRIPT.format(python=sys.executable, videos=list(VIDEOS.values()), delay=self.delay))
+        script.chmod(0o755)
+        self.path = f"{self._tmp.name}{os.pathsep}{os.environ.get('PATH', '')}"
+        return self
+
+    def __exit__(self, *exc):
+        self._tmp.cleanup()
+
+
+class InProcessTestCase(StoreIsolation):
+    def setUp(self):
+        super().setUp()
+        FakeYoutubeDL.instances = []
+        youtube_yt._ydl_local.instances = {}
+        patcher = mock.patch.object(youtube_yt, "yt_dlp", mock.Mock(YoutubeDL=FakeYoutubeDL))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("LAST30DAYS_YTDLP", None)
+        self.addCleanup(setattr, youtube_yt._ydl_local, "instances", {})
+
+
+class TestInProcessSearch(InProcessTestCase):
+    def test_items_match_cli_output(self):
+        with FakeCli() as cli, mock.patch.dict(os.environ, {"LAST30DAYS_YTDLP": "subprocess", "PATH": cli.path}):
+            via_cli = youtube_yt._search_youtube("claude code", "2026-01-01", "quick")
+        in_process = youtube_yt._search_youtube("claude code", "2026-01-01", "quick")
+        self.assertEqual(in_process, via_cli)
+        self.assertEqual([i["video_id"] for i in in_process["items"]], ["vid2", "vid1", "vid3"])
+        self.assertEqual(in_process["items"][0]["channel_name"], "Up")
+
+    def test_instances_are_reused(self):
+        youtube_yt._search_youtube("claude code", "2026-01-01", "quick")
+        youtube_yt._search_youtube("other topic", "2026-01-01", "quick")
+        self.assertEqual(len(FakeYoutubeDL.instances), 1)
+
+
+class TestInProcessBudgets(InProcessTestCase):
+    def _slow_extract(self, delay):
+        original = FakeYoutubeDL.extract_info
+
+        def extract(ydl, url, *args, **kwargs):
+            if not url.startswith("ytsearch"):
+                time.sleep(delay)
+            return original(ydl, url, *args, **kwargs)
+        return mock.patch.object(FakeYoutubeDL, "extract_info", extract)
+
+    def test_search_stops_at_budget(self):
+        videos = []
+        with self._slow_extract(0.1), mock.patch.object(youtube_yt, "SEARCH_TIMEOUT", 0.15):
+            error = youtube_yt._search_inprocess("claude code", 3, videos.append)
+        self.assertEqual(error, "Search timed out")
+        self.assertEqual([v["id"] for v in videos], ["vid1", "vid2"])
+
+    def test_socket_timeout_capped_by_budget(self):
+        with mock.patch.object(youtube_yt, "SEARCH_TIMEOUT", 5):
+            youtube_yt._search_inprocess("claude code", 3, lambda video: None)
+        self.assertLessEqual(FakeYoutubeDL.instances[0].params["socket_timeout"], 5)
+        # Instances with the full socket timeout are still reused
+        youtube_yt._search_inprocess("claude code", 3, lambda video: None)
+        youtube_yt._search_inprocess("claude code", 3, lambda video: None)
+        self.assertEqual(FakeYoutubeDL.instances[-1].params["socket_timeout"], 30)
+        self.assertIs(youtube_yt._ydl("search"), FakeYoutubeDL.instances[-1])
+
+    def test_slow_transcript_fails(self):
+        with self._slow_extract(0.1), mock.patch.object(youtube_yt, "TRANSCRIPT_TIMEOUT", 0.05):
+            self.assertIsNone(youtube_yt.fetch_transcript("vid1", "/nonexistent"))
+        self.assertEqual(transcript_store.get("vid1"), (False, None))
+
+
+class TestInProcessTranscripts(InProcessTestCase):
+    def test_transcript_cleaned(self):
+        self.assertEqual(youtube_yt.fetch_transcript("vid1", "/nonexistent"), "hello world again")
+
+    def test_no_captions(self):
+        self.assertIsNone(youtube_yt.fetch_transcript("vid3", "/nonexistent"))
+
+    def test_second_fetch_served_from_store(self):
+        youtube_yt.fetch_transcript("vid1", "/nonexistent")
+        youtube_yt.fetch_transcript("vid3", "/nonexistent")
+        with mock.patch.object(FakeYoutubeDL, "extract_info", side_effect=AssertionError("fetched")):
+            self.assertEqual(youtube_yt.fetch_transcript("vid1", "/nonexistent"), "hello world again")
+            self.assertIsNone(youtube_yt.fetch_transcript("vid3", "/nonexistent"))
+
+    def test_failures_are_not_stored(self):
+        with mock.patch.object(FakeYoutubeDL, "extract_info", side_effect=Exception("network down")):
+            self.assertIsNone(youtube_yt.fetch_transcript("vid1", "/nonexistent"))
+        self.assertEqual(transcript_store.get("vid1"), (False, None))
+
+    def test_rate_limit_raises(self):
+        with self.assertRaises(youtube_yt.TranscriptRateLimitError):
+            youtube_yt.fetch_transcript("limited", "/nonexistent")
+
+    def test_parallel_fetch(self):
+        results = youtube_yt.fetch_transcripts_parallel(["vid1", "vid2", "vid3"])
+        self.assertEqual(results, {"vid1": "hello world again", "vid2": "hello world again", "vid3": None})
+
+
+class TestStreaming(StoreIsolation):
+    def test_transcripts_start_before_search_finishes(self):
+        started = {}
+        search_done = threading.Event()
+
+        def fake_fetch(video_id, temp_dir):
+            started[video_id] = search_done.is_set()
+            return f"transcript {video_id}"
+
+        original = youtube_yt._search_youtube
+
+        def search(*args):
+            try:
+                return original(*args)
+            finally:
+                search_done.set()
+
+        with FakeCli(delay=0.2) as cli, \
+                mock.patch.dict(os.environ, {"LAST30DAYS_YTDLP": "subprocess", "PATH": cli.path}), \
+                mock.patch.object(youtube_yt, "_download_transcript", side_effect=fake_fetch), \
+                mock.patch.object(youtube_yt, "_search_youtube", side_effect=search):
+            result = youtube_yt.search_and_transcribe("claude code", "2026-01-01", "2026-01-31", "quick")
+        self.assertFalse(started["vid1"])
+        self.assertEqual([i["transcript_snippet"] for i in result["items"]],
+                         ["transcript vid2", "transcript vid1", "transcript vid3"])
+
+    def test_without_streaming_transcripts_wait_for_search(self):
+        with FakeCli() as cli, mock.patch.dict(os.environ, {"LAST30DAYS_YTDLP": "subprocess", "PATH": cli.path}), \
+                mock.patch.object(youtube_yt, "_search_youtube", wraps=youtube_yt._search_youtube) as search, \
+                mock.patch.object(youtube_yt, "_download_transcript", return_value="t"):
+            youtube_yt.search_and_transcribe("claude code", "2026-01-01", "2026-01-31", "quick", stream=False)
+        self.assertIsNone(search.call_args.args[3])
+
+
+class TestBackendChoice(unittest.TestCase):
+    def test_env_forces_subprocess(self):
+        with mock.patch.object(youtube_yt, "yt_dlp", mock.Mock()):
+            self.assertTrue(youtube_yt._use_inprocess())
+            with mock.patch.dict(os.environ, {"LAST30DAYS_YTDLP": "subprocess"}):
+                self.assertFalse(youtube_yt._use_inprocess())
+
+    def test_without_package(self):
+        with mock.patch.object(youtube_yt, "yt_dlp", None):
+            self.assertFalse(youtube_yt._use_inprocess())
+
+
+if __name__ == "__main__":
+    unittest.main()